@@ -0,0 +1 @@
+"""Completion analytics served from weekly rollups."""
@@ -0,0 +1,26 @@
+"""Admin configuration for the analytics app."""
+
+from chorequest.admin_utils import EstimatedCountPaginator
+from django.contrib import admin
+
+from .models import WeeklyCompletion
+
+
+@admin.register(WeeklyCompletion)
+class WeeklyCompletionAdmin(admin.ModelAdmin):
+    """Read-only admin for the weekly completion rollups."""
+
+    list_display = ("character", "week", "completed", "experience_points", "gold")
+    list_select_related = ("character",)
+    date_hierarchy = "week"
+    search_fields = ("character__name",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request: object) -> bool:  # noqa: ARG002
+        """Rollups are maintained by the quest completion, not by hand."""
+        return False
+
+    def has_change_permission(self, request: object, obj: object = None) -> bool:  # noqa: ARG002
+        """Rollups are maintained by the quest completion, not by hand."""
+        return False
@@ -0,0 +1,10 @@
+"""Module contains the configuration for the analytics app."""
+
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    """Configuration for the analytics app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "analytics"
@@ -0,0 +1,49 @@
+"""
+Initial migration for the analytics app.
+
+Generated by Django 5.2 on 2026-10-19 11:20
+
+Existing completions are not copied; run ``python manage.py backfill_rollups``
+once after migrating.
+"""
+
+from typing import ClassVar
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration creates the weekly completion rollups."""
+
+    initial = True
+
+    dependencies: ClassVar[list] = [
+        ("character", "0009_character_unique_active_character"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.CreateModel(
+            name="WeeklyCompletion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("week", models.DateField(help_text="Monday of the ISO week")),
+                ("completed", models.PositiveIntegerField(default=0)),
+                ("experience_points", models.PositiveIntegerField(default=0)),
+                ("gold", models.PositiveIntegerField(default=0)),
+                (
+                    "character",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weekly_completions",
+                        to="character.character",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("character", "week"), name="unique_weekly_completion"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1 @@
+"""Initializes the migrations of the analytics module."""
@@ -0,0 +1,33 @@
+"""
+Models of the analytics app.
+
+``WeeklyCompletion`` is a rollup of the completed quests of a character per
+ISO week.  It is maintained incrementally when a quest is completed (see
+:mod:`analytics.rollups`), so reports never scan ``CharacterQuest``.
+"""
+
+from typing import ClassVar
+
+from django.db import models
+
+
+class WeeklyCompletion(models.Model):
+    """Completed quests, experience and gold of a character in one ISO week."""
+
+    character = models.ForeignKey("character.Character", on_delete=models.CASCADE, related_name="weekly_completions")
+    week = models.DateField(help_text="Monday of the ISO week")
+    completed = models.PositiveIntegerField(default=0)
+    experience_points = models.PositiveIntegerField(default=0)
+    gold = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """Meta information for the WeeklyCompletion model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(fields=["character", "week"], name="unique_weekly_completion"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the rollup."""
+        year, week, _weekday = self.week.isocalendar()
+        return f"{self.character_id} {year}-W{week:02d}: {self.completed}"
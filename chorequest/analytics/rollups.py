@@ -0,0 +1,146 @@
+"""
+Incremental maintenance of the weekly completion rollups.
+
+:func:`record_completion` is called by :func:`quest.services.complete_quest`
+inside its transaction and adds one completion to the row of the character
+and week with a single ``UPDATE ... SET completed = completed + 1``; the row
+is inserted on the first completion of the week.  :func:`backfill_rollups`
+rebuilds all rows from the completed ``CharacterQuest`` history, including
+the archive (:func:`quest.archive.quest_history`), e.g. after introducing the
+table.
+
+Weeks start on Monday in the current time zone, the same boundary
+``TruncWeek`` uses.
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Q, QuerySet, Sum
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+from quest.archive import quest_history
+
+from .models import WeeklyCompletion
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def week_start(moment: datetime) -> date:
+    """Return the Monday of the week of ``moment`` in the current time zone."""
+    day = timezone.localdate(moment)
+    return day - timedelta(days=day.weekday())
+
+
+def record_completion(character_id: int, completed_at: datetime, experience_points: int, gold: int) -> None:
+    """Add a completed quest with its rewards to the weekly rollup of the character."""
+    week = week_start(completed_at)
+    increments = {
+        "completed": F("completed") + 1,
+        "experience_points": F("experience_points") + experience_points,
+        "gold": F("gold") + gold,
+    }
+    rollup = WeeklyCompletion.objects.filter(character_id=character_id, week=week)
+    if rollup.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            WeeklyCompletion.objects.create(
+                character_id=character_id, week=week, completed=1, experience_points=experience_points, gold=gold,
+            )
+    except IntegrityError:
+        # Ein paralleler Abschluss hat die Zeile gerade angelegt
+        rollup.update(**increments)
+
+
+def _group_weeks(rows: "Iterator[dict]") -> "Iterator[tuple[tuple[int, date], list[dict]]]":
+    """Group rows sorted by character and week into the rows of each character and week."""
+    for key, group in groupby(rows, key=itemgetter("character_id", "week")):
+        yield key, list(group)
+
+
+def backfill_rollups(batch_size: int = 1000, character_ids: "list[int] | None" = None) -> tuple[int, float]:
+    """
+    Rebuild the rollups from the completed quests; return the number of rows and the elapsed seconds.
+
+    Without ``character_ids`` all rollups are rebuilt, otherwise only those of
+    the given characters (e.g. after a restore).  Rewards are taken from the
+    quests as they are today.  Run it while no quests are completed,
+    completions during the rebuild would be counted twice or not at all.
+    """
+    start = time.perf_counter()
+    rollups = WeeklyCompletion.objects.all()
+    if character_ids is not None:
+        rollups = rollups.filter(character_id__in=character_ids)
+
+    def completed_weeks(queryset: QuerySet) -> QuerySet:
+        """Group the completed quests of one table by character and week."""
+        queryset = queryset.filter(status="completed", completed_at__isnull=False)
+        if character_ids is not None:
+            queryset = queryset.filter(character_id__in=character_ids)
+        return (
+            queryset.annotate(week=TruncWeek("completed_at", output_field=DateField()))
+            .values("character_id", "week")
+            .annotate(
+                completed=Count("id"),
+                experience_points=Sum("quest__experience_points"),
+                gold=Sum("quest__gold"),
+            )
+            .order_by()
+        )
+
+    # Hot- und Archivtabelle liefern je eine Zeile pro Woche, sortiert werden sie zusammengefasst
+    weeks = quest_history(completed_weeks).order_by("character_id", "week")
+    with transaction.atomic():
+        rollups.delete()
+        rows = WeeklyCompletion.objects.bulk_create(
+            (
+                WeeklyCompletion(
+                    character_id=character_id,
+                    week=week,
+                    completed=sum(row["completed"] for row in group),
+                    experience_points=sum(row["experience_points"] or 0 for row in group),
+                    gold=sum(row["gold"] or 0 for row in group),
+                )
+                for (character_id, week), group in _group_weeks(weeks.iterator(chunk_size=batch_size))
+            ),
+            batch_size=batch_size,
+        )
+    return len(rows), time.perf_counter() - start
+
+
+def weekly_report(character_filter: Q, weeks: int) -> list[dict]:
+    """
+    Return the rollups of the last ``weeks`` weeks of the characters matching ``character_filter``.
+
+    Only the rollup table is read, through its ``(character, week)`` index, so
+    the cost depends on the number of characters and weeks, not on the
+    length of the history.  Weeks without completions are omitted.
+    """
+    since = week_start(timezone.now()) - timedelta(weeks=weeks - 1)
+    rows = (
+        WeeklyCompletion.objects.filter(character_filter, week__gte=since)
+        .values("character_id", "character__name", "week", "completed", "experience_points", "gold")
+        .order_by("character_id", "week")
+    )
+    characters: dict[int, dict] = {}
+    for row in rows:
+        character = characters.setdefault(
+            row["character_id"], {"id": row["character_id"], "name": row["character__name"], "weeks": []},
+        )
+        year, week, _weekday = row["week"].isocalendar()
+        character["weeks"].append(
+            {
+                "week": f"{year}-W{week:02d}",
+                "start": row["week"],
+                "completed": row["completed"],
+                "experience_points": row["experience_points"],
+                "gold": row["gold"],
+            },
+        )
+    return list(characters.values())
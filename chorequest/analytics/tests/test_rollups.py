@@ -0,0 +1,138 @@
+"""Tests for the weekly completion rollups and the analytics endpoint."""
+
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
+
+from character.factories import CharacterFactory
+from django.core.management import call_command
+from django.test import TestCase
+from household.factories import HouseholdMembershipFactory
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.services import complete_quest
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from analytics.models import WeeklyCompletion
+from analytics.rollups import backfill_rollups, record_completion, week_start
+
+
+def rollups() -> list[tuple]:
+    """Lade alle Rollups sortiert nach Charakter und Woche."""
+    return list(
+        WeeklyCompletion.objects.order_by("character_id", "week").values_list(
+            "character_id", "week", "completed", "experience_points", "gold",
+        ),
+    )
+
+
+class RollupTest(TestCase):
+    """Teste die inkrementelle Pflege und den Neuaufbau der Rollups."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter."""
+        self.character = CharacterFactory()
+
+    def test_completion_updates_rollup(self) -> None:
+        """Teste, ob jeder Questabschluss die Woche des Charakters hochzählt."""
+        for experience_points, gold in ((100, 10), (50, 5)):
+            quest = QuestFactory(experience_points=experience_points, gold=gold)
+            complete_quest(CharacterQuestFactory(character=self.character, quest=quest, status="accepted").pk)
+
+        [(character_id, week, completed, experience_points, gold)] = rollups()
+        self.assertEqual((character_id, completed, experience_points, gold), (self.character.pk, 2, 150, 15))
+        self.assertEqual(week.weekday(), 0)
+
+    def test_week_boundaries(self) -> None:
+        """Teste, ob Sonntag und Montag in verschiedene ISO-Wochen fallen."""
+        sunday = datetime(2026, 10, 18, 23, 30, tzinfo=timezone.utc)
+        record_completion(self.character.pk, sunday, 10, 1)
+        record_completion(self.character.pk, sunday + timedelta(hours=1), 20, 2)
+
+        self.assertEqual(rollups(), [
+            (self.character.pk, date(2026, 10, 12), 1, 10, 1),
+            (self.character.pk, date(2026, 10, 19), 1, 20, 2),
+        ])
+
+    def test_backfill_matches_incremental(self) -> None:
+        """Teste, ob der Neuaufbau dieselben Zeilen liefert wie die inkrementelle Pflege."""
+        other = CharacterFactory()
+        start = datetime(2026, 9, 1, 12, tzinfo=timezone.utc)
+        for offset, character in enumerate([self.character, self.character, other, self.character] * 3):
+            completed_at = start + timedelta(days=3 * offset)
+            character_quest = CharacterQuestFactory(character=character, status="completed", completed_at=completed_at)
+            record_completion(
+                character.pk, completed_at, character_quest.quest.experience_points, character_quest.quest.gold,
+            )
+        CharacterQuestFactory(character=other, status="accepted")
+        incremental = rollups()
+
+        rows, _seconds = backfill_rollups(batch_size=2)
+
+        self.assertEqual(rows, len(incremental))
+        self.assertEqual(rollups(), incremental)
+
+    def test_backfill_command(self) -> None:
+        """Teste den Befehl zum Neuaufbau."""
+        CharacterQuestFactory(character=self.character, status="completed", completed_at=datetime.now(timezone.utc))
+        out = StringIO()
+
+        call_command("backfill_rollups", stdout=out)
+
+        self.assertIn("Rebuilt 1 weekly rollups", out.getvalue())
+
+
+class WeeklyCompletionViewTest(APITestCase):
+    """Teste den Analytics-Endpunkt."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Haushalt mit zwei Kindern und einen angemeldeten Elternteil."""
+        parent = HouseholdMembershipFactory(role="owner")
+        self.household = parent.household
+        self.kids = [CharacterFactory(user=HouseholdMembershipFactory(household=self.household).user) for _ in range(2)]
+        self.own = CharacterFactory(user=parent.user)
+        now = datetime.now(timezone.utc)
+        for character in [*self.kids, self.kids[0], self.own]:
+            record_completion(character.pk, now, 10, 1)
+        # Außerhalb des Zeitfensters
+        record_completion(self.kids[0].pk, now - timedelta(weeks=30), 10, 1)
+        token = ChoreQuestRefreshToken.for_user(parent.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_own_characters(self) -> None:
+        """Teste, ob ohne Haushalt nur die eigenen Charaktere geliefert werden."""
+        response = self.client.get("/api/analytics/weekly/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        [character] = response.data["characters"]
+        self.assertEqual(character["id"], self.own.pk)
+        self.assertEqual(character["weeks"][0]["start"], week_start(datetime.now(timezone.utc)))
+
+    def test_household(self) -> None:
+        """Teste die Wochenwerte aller Charaktere eines Haushalts, auch die des Elternteils."""
+        response = self.client.get(f"/api/analytics/weekly/?household={self.household.pk}&weeks=4")
+
+        self.assertEqual(
+            {character["id"]: [week["completed"] for week in character["weeks"]]
+             for character in response.data["characters"]},
+            {self.kids[0].pk: [2], self.kids[1].pk: [1], self.own.pk: [1]},
+        )
+        response = self.client.get(f"/api/analytics/weekly/?household={self.household.pk}&weeks=52")
+        self.assertEqual(len(response.data["characters"][0]["weeks"]), 2)
+
+    def test_reads_only_rollups(self) -> None:
+        """Teste, ob die Zahl der Queries nicht von der Historie abhängt."""
+        CharacterQuestFactory.create_batch(20, character=self.kids[0], status="completed")
+        url = f"/api/analytics/weekly/?household={self.household.pk}"
+
+        # Mitgliedschaft prüfen, Rollups lesen
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def test_foreign_household(self) -> None:
+        """Teste, ob fremde Haushalte nicht abgefragt werden können."""
+        other = HouseholdMembershipFactory().household
+
+        response = self.client.get(f"/api/analytics/weekly/?household={other.pk}")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,9 @@
+"""URL configuration for the analytics app."""
+
+from django.urls import path
+
+from .views import WeeklyCompletionView
+
+urlpatterns = [
+    path("api/analytics/weekly/", WeeklyCompletionView.as_view(), name="analytics-weekly"),
+]
@@ -0,0 +1,47 @@
+"""Views of the analytics API."""
+
+from typing import ClassVar
+
+from django.db.models import Q
+from household.models import HouseholdMembership
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .rollups import weekly_report
+
+
+class WeeklyQuerySerializer(serializers.Serializer):
+    """Query parameters of the weekly completion report."""
+
+    weeks = serializers.IntegerField(min_value=1, max_value=104, default=12)
+    household = serializers.IntegerField(min_value=1, required=False)
+
+
+class WeeklyCompletionView(APIView):
+    """
+    Completed quests per character and week: ``GET /api/analytics/weekly/?weeks=12&household=1``.
+
+    Without ``household`` the own characters are reported, with it all
+    characters of the household, if the user is a member.
+    """
+
+    permission_classes: ClassVar[list] = [IsAuthenticated]
+
+    def get(self, request: Request) -> Response:
+        """Return the weekly rollups of the requested characters."""
+        params = WeeklyQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        if "household" in data:
+            if not HouseholdMembership.objects.filter(household_id=data["household"], user_id=request.user.pk).exists():
+                msg = "Household not found."
+                raise NotFound(msg)
+            characters = Q(character__user__household_memberships__household_id=data["household"])
+        else:
+            characters = Q(character__user_id=request.user.pk)
+        return Response({"weeks": data["weeks"], "characters": weekly_report(characters, data["weeks"])})
@@ -0,0 +1 @@
+"""Streaming export and restore of a user's game data."""
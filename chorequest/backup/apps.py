@@ -0,0 +1,10 @@
+"""Module contains the configuration for the backup app."""
+
+from django.apps import AppConfig
+
+
+class BackupConfig(AppConfig):
+    """Configuration for the backup app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "backup"
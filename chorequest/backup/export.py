@@ -0,0 +1,264 @@
+"""
+Streaming export of the game data of one or more users.
+
+:func:`export_records` yields one flat record per row, in dependency order:
+all ``user`` records, then ``character``, ``inventory`` and ``quest``.  Rows
+are read as value tuples through :func:`chorequest.db.stream_queryset` (a
+server-side cursor on PostgreSQL), never as model instances or serializers, so
+memory stays constant however much a user owns.
+
+Records reference each other by natural keys instead of primary keys, so a
+restore into another database can resolve them:
+
+``user``
+    ``username``, ``email``, ``first_name``, ``last_name``, ``date_of_birth``,
+    ``date_joined`` (``password`` hash only with ``include_credentials``),
+``character``
+    ``user`` (username), ``name`` and the stored attributes,
+``inventory``
+    ``character`` (name), ``item`` (``Item.name``), ``quantity``,
+    ``current_durability``, ``slot`` (equipment slot or ``null``),
+``quest``
+    ``character`` (name), ``quest`` and ``quest_due_date`` (``Quest.name`` is
+    not unique, the due date tells quests of the same name apart),
+    ``status``, ``progress``, ``accepted_at``, ``completed_at`` and
+    ``archived_at`` (``null`` for quests in the hot table, the archival time
+    for quests in ``ArchivedCharacterQuest``).
+
+:func:`export_stream` renders the records as JSON Lines or CSV (one table with
+a ``type`` column) in blocks of ``WRITE_BUFFER_SIZE`` bytes, optionally gzip
+compressed.
+"""
+
+import csv
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from character.models import Character, InventoryItem
+from chorequest.db import stream_queryset
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import DateTimeField, QuerySet, Value
+from quest.archive import quest_history
+from quest.models import CharacterQuest
+
+FORMATS = ("jsonl", "csv")
+CONTENT_TYPES = {"jsonl": "application/x-ndjson", "csv": "text/csv"}
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Schlüssel im Export -> Lookup relativ zum Modell
+USER_FIELDS = {
+    "username": "username",
+    "email": "email",
+    "first_name": "first_name",
+    "last_name": "last_name",
+    "date_of_birth": "date_of_birth",
+    "date_joined": "date_joined",
+}
+CHARACTER_FIELDS = {
+    "user": "user__username",
+    "name": "name",
+    "active": "active",
+    "level": "level",
+    "experience_points": "experience_points",
+    "experience_points_to_next_level": "experience_points_to_next_level",
+    "strength": "strength",
+    "dexterity": "dexterity",
+    "intelligence": "intelligence",
+    "constitution": "constitution",
+    "wisdom": "wisdom",
+    "charisma": "charisma",
+    "hitpoints": "hitpoints",
+    "mana": "mana",
+    "hitpoints_max": "hitpoints_max",
+    "mana_max": "mana_max",
+    "max_inventory_slots": "max_inventory_slots",
+    "max_carry_weight": "max_carry_weight",
+    "gold": "gold",
+    "date_created": "date_created",
+}
+INVENTORY_FIELDS = {
+    "character": "character__name",
+    "item": "item__name",
+    "quantity": "quantity",
+    "current_durability": "current_durability",
+    "slot": "equipped__slot",
+}
+QUEST_FIELDS = {
+    "character": "character__name",
+    "quest": "quest__name",
+    "quest_due_date": "quest__due_date",
+    "status": "status",
+    "progress": "progress",
+    "accepted_at": "accepted_at",
+    "completed_at": "completed_at",
+}
+ARCHIVED_QUEST_FIELDS = {**QUEST_FIELDS, "archived_at": "archived_at"}
+
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    """``DjangoJSONEncoder`` keeping the microseconds of times, so a restore reproduces them exactly."""
+
+    def default(self, o: object) -> object:
+        """Encode datetimes and times with full precision."""
+        if isinstance(o, (datetime, time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+_encoder = ExportJSONEncoder()
+
+
+def get_chunk_size() -> int:
+    """Return the number of rows fetched from the database per round trip."""
+    return getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+
+
+def record_sources(user_ids: list[int], *, include_credentials: bool = False) -> list[tuple[str, QuerySet, dict]]:
+    """Return ``(record type, value tuples queryset, fields)`` of every record type in dependency order."""
+    user_fields = {**USER_FIELDS, "password": "password"} if include_credentials else USER_FIELDS
+
+    def rows(queryset: QuerySet, fields: dict) -> QuerySet:
+        """Select ``fields`` as value tuples in primary key order."""
+        return queryset.order_by("pk").values_list(*fields.values())
+
+    def quests(queryset: QuerySet) -> QuerySet:
+        """Select the quests of the users from one quest table; hot rows get an empty ``archived_at``."""
+        if queryset.model is CharacterQuest:
+            queryset = queryset.annotate(archived_at=Value(None, output_field=DateTimeField()))
+        return (
+            queryset.filter(character__user_id__in=user_ids).order_by().values_list(*ARCHIVED_QUEST_FIELDS.values())
+        )
+
+    return [
+        ("user", rows(get_user_model().objects.filter(pk__in=user_ids), user_fields), user_fields),
+        ("character", rows(Character.objects.filter(user_id__in=user_ids), CHARACTER_FIELDS), CHARACTER_FIELDS),
+        (
+            "inventory",
+            rows(InventoryItem.objects.filter(character__user_id__in=user_ids), INVENTORY_FIELDS),
+            INVENTORY_FIELDS,
+        ),
+        # Offene und archivierte Quests in einem UNION ALL
+        ("quest", quest_history(quests), ARCHIVED_QUEST_FIELDS),
+    ]
+
+
+def export_columns(*, include_credentials: bool = False) -> list[str]:
+    """Return the CSV columns: ``type`` followed by the keys of all record types."""
+    columns = ["type"]
+    for _record_type, _rows, fields in record_sources([], include_credentials=include_credentials):
+        columns.extend(key for key in fields if key not in columns)
+    return columns
+
+
+def export_records(
+    user_ids: Iterable[int], chunk_size: "int | None" = None, *, include_credentials: bool = False,
+) -> Iterator[dict]:
+    """Yield the records of the users ``user_ids`` in dependency order, reading ``chunk_size`` rows at a time."""
+    user_ids = list(user_ids)
+    chunk_size = chunk_size or get_chunk_size()
+    for record_type, rows, fields in record_sources(user_ids, include_credentials=include_credentials):
+        keys = ("type", *fields)
+        for row in stream_queryset(rows, chunk_size):
+            yield dict(zip(keys, (record_type, *row)))
+
+
+def render_jsonl(records: Iterable[dict]) -> Iterator[bytes]:
+    """Yield every record as one line of JSON."""
+    for record in records:
+        yield json.dumps(record, cls=ExportJSONEncoder, separators=(",", ":")).encode() + b"\n"
+
+
+class _Echo:
+    """File-like object returning what is written, so ``csv.writer`` produces one line per call."""
+
+    def write(self, value: str) -> str:
+        """Return ``value`` instead of storing it."""
+        return value
+
+
+def _csv_value(value: object) -> object:
+    """Format dates, datetimes and decimals like the JSON export."""
+    if isinstance(value, (date, time, Decimal)):
+        return _encoder.default(value)
+    return value
+
+
+def render_csv(records: Iterable[dict], columns: list[str]) -> Iterator[bytes]:
+    """Yield a header row and one row per record; keys a record type does not have stay empty."""
+    writer = csv.DictWriter(_Echo(), fieldnames=columns, restval="")
+    yield writer.writeheader().encode()
+    for record in records:
+        yield writer.writerow({key: _csv_value(value) for key, value in record.items()}).encode()
+
+
+def buffered(chunks: Iterable[bytes], size: int = WRITE_BUFFER_SIZE) -> Iterator[bytes]:
+    """Join small chunks into blocks of at least ``size`` bytes (the last one may be smaller)."""
+    block = []
+    length = 0
+    for chunk in chunks:
+        block.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield b"".join(block)
+            block = []
+            length = 0
+    if block:
+        yield b"".join(block)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress ``chunks`` incrementally into one gzip stream."""
+    # wbits=31: Gzip-Header und -Prüfsumme statt rohem zlib-Format
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(
+    user_ids: Iterable[int],
+    export_format: str = "jsonl",
+    *,
+    compress: bool = False,
+    include_credentials: bool = False,
+    chunk_size: "int | None" = None,
+) -> Iterator[bytes]:
+    """Return the export of ``user_ids`` as a lazy stream of byte blocks in ``export_format``."""
+    records = export_records(user_ids, chunk_size, include_credentials=include_credentials)
+    if export_format == "csv":
+        chunks = render_csv(records, export_columns(include_credentials=include_credentials))
+    else:
+        chunks = render_jsonl(records)
+    chunks = buffered(chunks)
+    return gzip_chunks(chunks) if compress else chunks
+
+
+async def iterate_async(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Serve a synchronous stream under ASGI without consuming it up front.
+
+    Django reads a synchronous iterator of a ``StreamingHttpResponse`` into a
+    list under ASGI; this fetches one block at a time in the thread that owns
+    the database connection (and cursor) of the request instead.
+    """
+    fetch = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            chunk = await fetch(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        # Abgebrochener Download: Cursor im Thread der Verbindung schließen
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
@@ -0,0 +1,72 @@
+"""
+Management command exporting the game data of users as JSON Lines or CSV.
+
+Writes the records of :mod:`backup.export` for the given usernames to a file
+or stdout, e.g. for a GDPR request or before moving a household::
+
+    python manage.py export_user_data alice bob --output household.jsonl.gz --gzip
+
+``--include-credentials`` adds the password hashes, so a restore keeps the
+logins working; keep such files as safe as the database itself.
+"""
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from backup.export import FORMATS, export_stream
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def write_chunks(chunks: "Iterable[bytes]", target: BinaryIO) -> int:
+    """Write ``chunks`` to ``target`` and return the number of bytes written."""
+    size = 0
+    for chunk in chunks:
+        target.write(chunk)
+        size += len(chunk)
+    target.flush()
+    return size
+
+
+class Command(BaseCommand):
+    """Stream the game data of users into a file."""
+
+    help = "Export the users, characters, inventories and quests of the given usernames."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument("usernames", nargs="+", help="Users to export.")
+        parser.add_argument("--output", type=Path, default=None, help="Target file (default: stdout).")
+        parser.add_argument("--format", choices=FORMATS, default="jsonl", dest="export_format", help="Output format.")
+        parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip.")
+        parser.add_argument("--chunk-size", type=int, default=None, help="Rows fetched per database round trip.")
+        parser.add_argument("--include-credentials", action="store_true", help="Export the password hashes.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Resolve the users and write the export."""
+        usernames = options["usernames"]
+        users = dict(get_user_model().objects.filter(username__in=usernames).values_list("username", "pk"))
+        missing = sorted(set(usernames) - set(users))
+        if missing:
+            msg = f"Unknown users: {', '.join(missing)}."
+            raise CommandError(msg)
+
+        chunks = export_stream(
+            users.values(),
+            options["export_format"],
+            compress=options["gzip"],
+            include_credentials=options["include_credentials"],
+            chunk_size=options["chunk_size"],
+        )
+        if options["output"] is None:
+            write_chunks(chunks, sys.stdout.buffer)
+            return
+        with options["output"].open("wb") as target:
+            size = write_chunks(chunks, target)
+        self.stdout.write(self.style.SUCCESS(f"Exported {len(users)} users to {options['output']} ({size} bytes)."))
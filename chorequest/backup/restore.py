@@ -0,0 +1,329 @@
+"""
+Bulk restore of exported game data.
+
+Reads the records of :mod:`backup.export` (JSON Lines or CSV, optionally
+gzip compressed) as a stream and inserts them with chunked ``bulk_create``
+instead of replaying them through the serializers:
+
+* natural keys are resolved through in-memory maps: ``Item.name`` and
+  ``Quest.name`` with ``quest_due_date`` against the catalogue (a quest
+  matching more than one catalogue entry is skipped as ambiguous instead of
+  guessing), ``username`` and ``Character.name`` against the rows created by
+  this run, so a restore never attaches data to an existing account,
+* every chunk is inserted in dependency order (users, characters, inventory
+  with equipment, quests); the records must arrive in the order the export
+  writes them,
+* quest records with an ``archived_at`` go back into
+  ``ArchivedCharacterQuest``, so a quest assigned again after its archival
+  keeps both rows.  Their original ids belong to another database; they get
+  negative ids, which never collide with the ids the hot table hands out and
+  the archive copies on later runs,
+* the whole restore is one transaction.  Foreign key checks are disabled
+  where the backend allows it (SQLite outside a transaction, MySQL) and
+  verified once with ``check_constraints`` before the commit, like
+  ``loaddata`` does; on PostgreSQL Django's foreign keys are
+  ``DEFERRABLE INITIALLY DEFERRED`` and checked at commit anyway.
+
+Records that cannot be restored (duplicates, unknown keys, invalid values)
+are skipped with a reason.  ``equipment_bonus`` and the weekly rollups of
+the restored characters are recomputed at the end.
+"""
+
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from analytics.rollups import backfill_rollups
+from character.models import ITEM_BONUS_FIELDS, Character, Equipment, InventoryItem, Item
+from chorequest.db import chunked
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+from django.db.models import Min, Model
+from quest.models import ArchivedCharacterQuest, CharacterQuest, Quest
+
+from .export import ARCHIVED_QUEST_FIELDS, CHARACTER_FIELDS, INVENTORY_FIELDS, QUEST_FIELDS, USER_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+RECORD_TYPES = ("user", "character", "inventory", "quest")
+
+
+@dataclass
+class RestoreResult:
+    """Counters and timing of a restore run."""
+
+    users: int = 0
+    characters: int = 0
+    inventory: int = 0
+    equipment: int = 0
+    quests: int = 0
+    skipped: list[tuple[int, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        """Return the number of inserted rows."""
+        return self.users + self.characters + self.inventory + self.equipment + self.quests
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of inserted rows per second."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def convert(model: type[Model], fields: dict[str, str], record: dict) -> dict:
+    """
+    Return the model field values of ``record``; natural keys (lookups across relations) are left out.
+
+    Values are parsed with ``to_python``, so the strings of a CSV export work
+    as well as JSON; empty values become ``None`` for nullable fields and the
+    model default otherwise.
+    """
+    values = {}
+    for key, lookup in fields.items():
+        if "__" in lookup or key not in record:
+            continue
+        model_field = model._meta.get_field(lookup)  # noqa: SLF001
+        value = record[key]
+        if value is None or value == "":
+            if model_field.null:
+                values[lookup] = None
+            continue
+        values[lookup] = model_field.to_python(value)
+    return values
+
+
+def clean_rows(
+    rows: list[tuple[int, dict]], clean: "Callable[[dict], object]", skipped: list[tuple[int, str]],
+) -> list:
+    """Return the results of ``clean`` for the numbered ``rows``; rows it rejects are added to ``skipped``."""
+    cleaned = []
+    for line, record in rows:
+        try:
+            value = clean(record)
+        except ValidationError as exc:
+            value = f"invalid value: {'; '.join(exc.messages)}"
+        if isinstance(value, str):
+            skipped.append((line, value))
+        else:
+            cleaned.append(value)
+    return cleaned
+
+
+class DataRestorer:
+    """Resolve the natural keys of exported records and bulk insert them."""
+
+    def __init__(self, chunk_size: int = 2000, using: str = "default") -> None:
+        """Pre-load the catalogue and the unique values already present in the database."""
+        self.chunk_size = chunk_size
+        self.using = using
+        self.user_model = get_user_model()
+        self.usernames = set(self.user_model.objects.values_list("username", flat=True))
+        self.emails = set(self.user_model.objects.values_list("email", flat=True))
+        self.character_names = set(Character.objects.values_list("name", flat=True))
+        self.items: dict[str, int] = {}
+        self.item_bonuses: dict[int, dict[str, int]] = {}
+        for name, pk, *bonuses in Item.objects.values_list("name", "pk", *ITEM_BONUS_FIELDS.values()):
+            self.items[name] = pk
+            self.item_bonuses[pk] = {key: value for key, value in zip(ITEM_BONUS_FIELDS, bonuses) if value}
+        # (Name, Fälligkeit) und (Name, None) für Exporte ohne Fälligkeit; None heißt mehrdeutig
+        self.quests: dict[tuple[str, datetime | None], int | None] = {}
+        for name, due_date, pk in Quest.objects.values_list("name", "due_date", "pk"):
+            for key in ((name, due_date), (name, None)):
+                self.quests[key] = None if key in self.quests else pk
+        # In diesem Lauf angelegt: natürlicher Schlüssel -> Primärschlüssel
+        self.restored_users: dict[str, int] = {}
+        self.restored_characters: dict[str, int] = {}
+        self.equipped_slots: set[tuple[int, str]] = set()
+        self.assigned_quests: set[tuple[int, int]] = set()
+        lowest = ArchivedCharacterQuest.objects.aggregate(low=Min("pk"))["low"] or 0
+        self.next_archived_id = min(lowest, 0) - 1
+        self.equipment_bonus: dict[int, dict[str, int]] = {}
+        self.completed_characters: set[int] = set()
+
+    def run(self, records: Iterable[dict]) -> RestoreResult:
+        """Restore ``records`` in one transaction and return the counters."""
+        result = RestoreResult()
+        start = time.perf_counter()
+        connection = connections[self.using]
+        with connection.constraint_checks_disabled(), transaction.atomic(using=self.using):
+            for offset, chunk in enumerate(chunked(records, self.chunk_size)):
+                self.restore_chunk(enumerate(chunk, start=offset * self.chunk_size + 1), result)
+            self.finish()
+            connection.check_constraints(
+                table_names=[
+                    model._meta.db_table  # noqa: SLF001
+                    for model in (
+                        self.user_model, Character, InventoryItem, Equipment, CharacterQuest, ArchivedCharacterQuest,
+                    )
+                ],
+            )
+        result.skipped.sort()
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def restore_chunk(self, numbered: Iterator[tuple[int, dict]], result: RestoreResult) -> None:
+        """Insert one chunk of numbered records, grouped by type in dependency order."""
+        grouped: dict[str, list[tuple[int, dict]]] = {record_type: [] for record_type in RECORD_TYPES}
+        for line, record in numbered:
+            record_type = record.get("type")
+            if record_type in grouped:
+                grouped[record_type].append((line, record))
+            else:
+                result.skipped.append((line, f"unknown record type {record_type}"))
+        result.users += self.insert_users(grouped["user"], result.skipped)
+        result.characters += self.insert_characters(grouped["character"], result.skipped)
+        inventory, equipment = self.insert_inventory(grouped["inventory"], result.skipped)
+        result.inventory += inventory
+        result.equipment += equipment
+        result.quests += self.insert_quests(grouped["quest"], result.skipped)
+
+    def clean_user(self, record: dict) -> "Model | str":
+        """Return the unsaved user or the reason why it has to be skipped."""
+        username = self.user_model.normalize_username(str(record.get("username") or "").strip())
+        email = self.user_model.objects.normalize_email(str(record.get("email") or "").strip())
+        if not username or not email:
+            return "missing username or email"
+        if username in self.usernames:
+            return f"duplicate username {username}"
+        if email in self.emails:
+            return f"duplicate email {email}"
+        values = convert(self.user_model, USER_FIELDS, record)
+        values.update(username=username, email=email)
+        # Ohne exportierten Hash bleibt das Konto bis zum Passwort-Reset gesperrt
+        user = self.user_model(password=record.get("password") or make_password(None), **values)
+        self.usernames.add(username)
+        self.emails.add(email)
+        return user
+
+    def insert_users(self, rows: list[tuple[int, dict]], skipped: list[tuple[int, str]]) -> int:
+        """Insert the user records of a chunk."""
+        users = clean_rows(rows, self.clean_user, skipped)
+        self.user_model.objects.bulk_create(users, batch_size=self.chunk_size)
+        self._resolve_pks(self.user_model, users, "username")
+        self.restored_users.update((user.username, user.pk) for user in users)
+        return len(users)
+
+    def clean_character(self, record: dict) -> "Character | str":
+        """Return the unsaved character or the reason why it has to be skipped."""
+        name = str(record.get("name") or "").strip()
+        user_id = self.restored_users.get(record.get("user"))
+        if user_id is None:
+            return f"unknown user {record.get('user')}"
+        if not name:
+            return "missing character name"
+        if name in self.character_names:
+            return f"duplicate character name {name}"
+        values = convert(Character, CHARACTER_FIELDS, record)
+        values["name"] = name
+        self.character_names.add(name)
+        return Character(user_id=user_id, **values)
+
+    def insert_characters(self, rows: list[tuple[int, dict]], skipped: list[tuple[int, str]]) -> int:
+        """Insert the character records of a chunk, keeping their original creation dates."""
+        characters = clean_rows(rows, self.clean_character, skipped)
+        # bulk_create setzt auto_now_add-Felder auf jetzt
+        created = [character.date_created for character in characters]
+        Character.objects.bulk_create(characters, batch_size=self.chunk_size)
+        self._resolve_pks(Character, characters, "name")
+        restored = []
+        for character, date_created in zip(characters, created):
+            self.restored_characters[character.name] = character.pk
+            if date_created is not None:
+                character.date_created = date_created
+                restored.append(character)
+        Character.objects.bulk_update(restored, ["date_created"], batch_size=self.chunk_size)
+        return len(characters)
+
+    def clean_inventory(self, record: dict) -> "tuple[InventoryItem, str | None] | str":
+        """Return the unsaved inventory row with its equipment slot or the reason why it has to be skipped."""
+        character_id = self.restored_characters.get(record.get("character"))
+        if character_id is None:
+            return f"unknown character {record.get('character')}"
+        item_id = self.items.get(record.get("item"))
+        if item_id is None:
+            return f"unknown item {record.get('item')}"
+        slot = record.get("slot") or None
+        if slot is not None:
+            if (character_id, slot) in self.equipped_slots:
+                return f"slot {slot} equipped twice"
+            self.equipped_slots.add((character_id, slot))
+        values = convert(InventoryItem, INVENTORY_FIELDS, record)
+        return InventoryItem(character_id=character_id, item_id=item_id, **values), slot
+
+    def insert_inventory(self, rows: list[tuple[int, dict]], skipped: list[tuple[int, str]]) -> tuple[int, int]:
+        """Insert the inventory records of a chunk and the equipment they are worn in."""
+        cleaned = clean_rows(rows, self.clean_inventory, skipped)
+        # Die Ausrüstung braucht die neuen Primärschlüssel (RETURNING, SQLite und PostgreSQL)
+        stacks = InventoryItem.objects.bulk_create([stack for stack, _slot in cleaned], batch_size=self.chunk_size)
+        equipment = []
+        for stack, slot in zip(stacks, (slot for _stack, slot in cleaned)):
+            if slot is None:
+                continue
+            equipment.append(Equipment(character_id=stack.character_id, slot=slot, inventory_item_id=stack.pk))
+            bonus = self.equipment_bonus.setdefault(stack.character_id, {})
+            for key, value in self.item_bonuses[stack.item_id].items():
+                bonus[key] = bonus.get(key, 0) + value
+        Equipment.objects.bulk_create(equipment, batch_size=self.chunk_size)
+        return len(stacks), len(equipment)
+
+    def clean_quest(self, record: dict) -> "CharacterQuest | ArchivedCharacterQuest | str":
+        """Return the unsaved quest assignment, hot or archived, or the reason why it has to be skipped."""
+        character_id = self.restored_characters.get(record.get("character"))
+        if character_id is None:
+            return f"unknown character {record.get('character')}"
+        name, due_date = record.get("quest"), record.get("quest_due_date") or None
+        if due_date is not None:
+            due_date = Quest._meta.get_field("due_date").to_python(due_date)  # noqa: SLF001
+        if (name, due_date) not in self.quests:
+            return f"unknown quest {name}"
+        quest_id = self.quests[name, due_date]
+        if quest_id is None:
+            return f"ambiguous quest {name}"
+        if record.get("archived_at"):
+            values = convert(ArchivedCharacterQuest, ARCHIVED_QUEST_FIELDS, record)
+            quest = ArchivedCharacterQuest(
+                id=self.next_archived_id, character_id=character_id, quest_id=quest_id, **values,
+            )
+            self.next_archived_id -= 1
+        else:
+            if (character_id, quest_id) in self.assigned_quests:
+                return f"duplicate quest {name}"
+            self.assigned_quests.add((character_id, quest_id))
+            values = convert(CharacterQuest, QUEST_FIELDS, record)
+            quest = CharacterQuest(character_id=character_id, quest_id=quest_id, **values)
+        if values.get("status") == "completed":
+            self.completed_characters.add(character_id)
+        return quest
+
+    def insert_quests(self, rows: list[tuple[int, dict]], skipped: list[tuple[int, str]]) -> int:
+        """Insert the quest records of a chunk into the hot table and the archive."""
+        quests = clean_rows(rows, self.clean_quest, skipped)
+        for model in (CharacterQuest, ArchivedCharacterQuest):
+            model.objects.bulk_create([quest for quest in quests if type(quest) is model], batch_size=self.chunk_size)
+        return len(quests)
+
+    def finish(self) -> None:
+        """Store the equipment bonus and rebuild the weekly rollups of the restored characters."""
+        Character.objects.bulk_update(
+            [Character(pk=pk, equipment_bonus=bonus) for pk, bonus in self.equipment_bonus.items()],
+            ["equipment_bonus"],
+            batch_size=self.chunk_size,
+        )
+        for character_ids in chunked(sorted(self.completed_characters), self.chunk_size):
+            backfill_rollups(self.chunk_size, character_ids)
+
+    def _resolve_pks(self, model: type[Model], objects: list[Model], key: str) -> None:
+        """Backends without RETURNING: look the new ids up by the unique ``key``."""
+        if not any(obj.pk is None for obj in objects):
+            return
+        ids = dict(
+            model.objects.filter(**{f"{key}__in": [getattr(obj, key) for obj in objects]}).values_list(key, "pk"),
+        )
+        for obj in objects:
+            obj.pk = ids[getattr(obj, key)]
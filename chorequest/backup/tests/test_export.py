@@ -0,0 +1,153 @@
+"""Tests for the streaming export of the game data."""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import Equipment
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from quest.factories import CharacterQuestFactory, QuestFactory
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from backup.export import buffered, export_columns, export_records, gzip_chunks
+
+RECORD_TYPES = ["user", "character", "inventory", "inventory", "quest"]
+
+
+class ExportTestMixin:
+    """Legt einen Benutzer mit Charakter, Inventar und Quest sowie fremde Daten an."""
+
+    def setUp(self) -> None:
+        """Erstelle die Spieldaten zweier Benutzer."""
+        self.character = CharacterFactory(name="Aria", gold=42)
+        self.user = self.character.user
+        self.sword = ItemFactory(name="Sword", slot="weapon")
+        self.stack = InventoryItemFactory(character=self.character, item=self.sword, quantity=1)
+        Equipment.objects.create(character=self.character, slot="weapon", inventory_item=self.stack)
+        InventoryItemFactory(character=self.character, item=ItemFactory(name="Apple"), quantity=7)
+        self.quest = QuestFactory(name="Dishes")
+        CharacterQuestFactory(character=self.character, quest=self.quest, status="accepted")
+        InventoryItemFactory(character=CharacterFactory(name="Stranger"), item=self.sword)
+
+
+class ExportRecordsTest(ExportTestMixin, TestCase):
+    """Teste die Datensätze des Exports."""
+
+    def test_records_in_dependency_order_with_natural_keys(self) -> None:
+        """Teste Reihenfolge, natürliche Schlüssel und die Ausrüstungsslots."""
+        records = list(export_records([self.user.pk], chunk_size=1))
+
+        self.assertEqual([record["type"] for record in records], RECORD_TYPES)
+        user, character, sword, apple, quest = records
+        self.assertEqual(user["username"], self.user.username)
+        self.assertNotIn("password", user)
+        self.assertEqual((character["user"], character["name"], character["gold"]), (self.user.username, "Aria", 42))
+        self.assertEqual((sword["character"], sword["item"], sword["slot"]), ("Aria", "Sword", "weapon"))
+        self.assertEqual((apple["item"], apple["quantity"], apple["slot"]), ("Apple", 7, None))
+        self.assertEqual((quest["character"], quest["quest"], quest["status"]), ("Aria", "Dishes", "accepted"))
+        self.assertEqual(quest["quest_due_date"], self.quest.due_date)
+
+    def test_credentials_only_on_request(self) -> None:
+        """Teste, ob der Passwort-Hash nur auf Wunsch exportiert wird."""
+        user = next(export_records([self.user.pk], include_credentials=True))
+        self.assertEqual(user["password"], self.user.password)
+        self.assertIn("password", export_columns(include_credentials=True))
+        self.assertNotIn("password", export_columns())
+
+    def test_query_count_does_not_grow_with_rows(self) -> None:
+        """Teste, ob pro Datensatztyp und Block nur eine Abfrage läuft."""
+        for _ in range(20):
+            InventoryItemFactory(character=self.character, item=self.sword)
+        with self.assertNumQueries(4):
+            list(export_records([self.user.pk]))
+
+    def test_buffered_gzip_stream(self) -> None:
+        """Teste, ob kleine Blöcke zusammengefasst und als ein Gzip-Stream komprimiert werden."""
+        chunks = [b"x" * 10] * 25
+        self.assertEqual([len(block) for block in buffered(chunks, size=100)], [100, 100, 50])
+        self.assertEqual(gzip.decompress(b"".join(gzip_chunks(chunks))), b"".join(chunks))
+
+
+class ExportViewTest(ExportTestMixin, APITestCase):
+    """Teste den Download unter /api/export/."""
+
+    def setUp(self) -> None:
+        """Melde den Benutzer an."""
+        super().setUp()
+        self.token = ChoreQuestRefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def test_jsonl_is_streamed(self) -> None:
+        """Teste, ob der Export als JSON Lines gestreamt wird."""
+        response = self.client.get("/api/export/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn(f"chorequest-export-{self.user.username}.jsonl", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)["type"] for line in lines], RECORD_TYPES)
+
+    def test_csv(self) -> None:
+        """Teste, ob der CSV-Export alle Datensatztypen in einer Tabelle enthält."""
+        response = self.client.get("/api/export/", {"output": "csv"})
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 5)
+        sword = rows[2]
+        self.assertEqual(
+            (sword["type"], sword["item"], sword["slot"], sword["username"]), ("inventory", "Sword", "weapon", ""),
+        )
+
+    def test_gzip(self) -> None:
+        """Teste, ob der komprimierte Export dem unkomprimierten entspricht."""
+        plain = b"".join(self.client.get("/api/export/").streaming_content)
+        response = self.client.get("/api/export/", {"gzip": "true"})
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertTrue(response["Content-Disposition"].endswith('.jsonl.gz"'))
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), plain)
+
+    def test_invalid_output(self) -> None:
+        """Teste, ob ein unbekanntes Format abgelehnt wird."""
+        response = self.client.get("/api/export/", {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self) -> None:
+        """Teste, ob der Export eine Anmeldung erfordert."""
+        self.client.credentials()
+        self.assertEqual(self.client.get("/api/export/").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_asgi_streams_asynchronously(self) -> None:
+        """Teste, ob der Export unter ASGI blockweise aus einem asynchronen Iterator gelesen wird."""
+        response = await self.async_client.get("/api/export/", headers={"Authorization": f"Bearer {self.token}"})
+
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(content.splitlines()), 5)
+
+
+class ExportCommandTest(ExportTestMixin, TestCase):
+    """Teste das Kommando export_user_data."""
+
+    def test_writes_file(self) -> None:
+        """Teste, ob das Kommando den komprimierten Export in eine Datei schreibt."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "export.jsonl.gz"
+            call_command("export_user_data", self.user.username, "--output", str(path), "--gzip", stdout=io.StringIO())
+            lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+
+        self.assertEqual(len(lines), 5)
+
+    def test_unknown_user(self) -> None:
+        """Teste, ob unbekannte Benutzer gemeldet werden."""
+        with self.assertRaisesMessage(CommandError, "Unknown users: nobody."):
+            call_command("export_user_data", self.user.username, "nobody")
@@ -0,0 +1,190 @@
+"""Tests for the bulk restore of exported game data."""
+
+import io
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from analytics.models import WeeklyCompletion
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import Character, Equipment, InventoryItem
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from quest.archive import archive_completed_quests
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.models import ArchivedCharacterQuest, CharacterQuest, Quest
+from user.models import UserAccount
+
+from backup.export import export_records
+from backup.restore import DataRestorer
+
+
+class RestoreTest(TestCase):
+    """Teste die Wiederherstellung eines Exports."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Benutzer mit ausgerüstetem Schwert, Vorrat und abgeschlossener Quest."""
+        self.user = UserAccount.objects.create_user(
+            username="aria", email="aria@example.com", password="securepassword",  # noqa: S106
+        )
+        self.character = CharacterFactory(user=self.user, name="Aria", gold=42, active=True)
+        self.sword = ItemFactory(name="Sword", slot="weapon", strength_bonus=3)
+        self.character.equip(InventoryItemFactory(character=self.character, item=self.sword))
+        InventoryItemFactory(character=self.character, item=ItemFactory(name="Apple"), quantity=7)
+        CharacterQuestFactory(
+            character=self.character,
+            quest=QuestFactory(name="Dishes", experience_points=50, gold=5),
+            status="completed",
+            progress=100,
+            completed_at=datetime(2026, 10, 14, 12, tzinfo=timezone.utc),
+        )
+
+    def export(self, *, include_credentials: bool = False) -> list[dict]:
+        """Exportiere den Benutzer."""
+        return list(export_records([self.user.pk], include_credentials=include_credentials))
+
+    def test_round_trip(self) -> None:
+        """Teste, ob ein gelöschter Benutzer vollständig wiederhergestellt wird."""
+        records = self.export(include_credentials=True)
+        self.user.delete()
+
+        result = DataRestorer(chunk_size=2).run(records)
+
+        self.assertEqual(
+            (result.users, result.characters, result.inventory, result.equipment, result.quests, result.skipped),
+            (1, 1, 2, 1, 1, []),
+        )
+        self.user = UserAccount.objects.get(username="aria")
+        self.assertTrue(self.user.check_password("securepassword"))
+        self.assertEqual(self.export(include_credentials=True), records)
+        character = Character.objects.get(name="Aria")
+        self.assertEqual(character.equipment_bonus, {"strength": 3})
+        self.assertEqual(Equipment.objects.get(character=character).inventory_item.item, self.sword)
+        self.assertEqual(
+            list(WeeklyCompletion.objects.filter(character=character).values_list("completed", "experience_points")),
+            [(1, 50)],
+        )
+
+    def test_round_trip_with_archived_quest(self) -> None:
+        """Teste, ob archivierte und danach erneut zugewiesene Quests beide in ihre Tabellen zurückkehren."""
+        archive_completed_quests(datetime(2026, 10, 15, tzinfo=timezone.utc))
+        quest = Quest.objects.get(name="Dishes")
+        CharacterQuestFactory(character=self.character, quest=quest, status="accepted")
+        records = self.export()
+        self.assertEqual([record["archived_at"] is not None for record in records[4:]], [False, True])
+        self.user.delete()
+
+        result = DataRestorer().run(records)
+
+        self.assertEqual((result.quests, result.skipped), (2, []))
+        character = Character.objects.get(name="Aria")
+        self.assertEqual(
+            list(CharacterQuest.objects.filter(character=character).values_list("status", flat=True)), ["accepted"],
+        )
+        archived = ArchivedCharacterQuest.objects.get(character=character)
+        self.assertEqual((archived.quest, archived.status, archived.pk < 0), (quest, "completed", True))
+        self.user = UserAccount.objects.get(username="aria")
+        self.assertEqual(self.export(), records)
+        self.assertEqual(
+            list(WeeklyCompletion.objects.filter(character=character).values_list("completed", "experience_points")),
+            [(1, 50)],
+        )
+
+    def test_without_credentials_password_is_unusable(self) -> None:
+        """Teste, ob ohne exportierten Hash ein unbenutzbares Passwort gesetzt wird."""
+        records = self.export()
+        self.user.delete()
+
+        DataRestorer().run(records)
+
+        self.assertFalse(UserAccount.objects.get(username="aria").has_usable_password())
+
+    def test_existing_user_is_skipped_with_its_data(self) -> None:
+        """Teste, ob Daten eines bestehenden Kontos nicht an dieses angehängt werden."""
+        result = DataRestorer().run(self.export())
+
+        self.assertEqual(result.rows, 0)
+        self.assertEqual(
+            [reason for _line, reason in result.skipped],
+            [
+                "duplicate username aria",
+                "unknown user aria",
+                "unknown character Aria",
+                "unknown character Aria",
+                "unknown character Aria",
+            ],
+        )
+        self.assertEqual(InventoryItem.objects.count(), 2)
+
+    def test_unknown_keys_and_invalid_values(self) -> None:
+        """Teste, ob unbekannte Items und ungültige Werte übersprungen werden."""
+        records = self.export()
+        self.user.delete()
+        records[2]["item"] = "Lost Sword"
+        records[3]["quantity"] = "many"
+
+        result = DataRestorer().run([*records, {"type": "pet", "name": "Rex"}])
+
+        self.assertEqual((result.inventory, result.equipment), (0, 0))
+        self.assertEqual(
+            [(line, reason.split(":")[0]) for line, reason in result.skipped],
+            [(3, "unknown item Lost Sword"), (4, "invalid value"), (6, "unknown record type pet")],
+        )
+        self.assertEqual(Character.objects.get(name="Aria").equipment_bonus, {})
+
+    def test_quests_with_the_same_name(self) -> None:
+        """Teste, ob gleichnamige Quests über ihre Fälligkeit unterschieden werden."""
+        for due_date in (datetime(2026, 11, 1, tzinfo=timezone.utc), datetime(2026, 11, 8, tzinfo=timezone.utc)):
+            CharacterQuestFactory(character=self.character, quest=QuestFactory(name="Laundry", due_date=due_date))
+        records = self.export()
+        self.user.delete()
+
+        result = DataRestorer().run(records)
+
+        self.assertEqual((result.quests, result.skipped), (3, []))
+        self.user = UserAccount.objects.get(username="aria")
+        self.assertEqual(self.export(), records)
+
+    def test_ambiguous_quest_is_skipped(self) -> None:
+        """Teste, ob eine Quest, die mehrere Katalogeinträge trifft, nicht geraten wird."""
+        records = self.export()
+        self.user.delete()
+        quest = records[-1]
+        QuestFactory(name="Dishes", due_date=quest["quest_due_date"])
+
+        result = DataRestorer().run(records)
+
+        self.assertEqual(result.quests, 0)
+        self.assertEqual(result.skipped, [(len(records), "ambiguous quest Dishes")])
+
+    def test_one_insert_per_chunk(self) -> None:
+        """Teste, ob alle Inventarzeilen eines Blocks mit einem INSERT geschrieben werden."""
+        for _ in range(30):
+            InventoryItemFactory(character=self.character, item=self.sword)
+        records = self.export()
+        self.user.delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            result = DataRestorer(chunk_size=1000).run(records)
+
+        self.assertEqual(result.inventory, 32)
+        inserts = [query for query in queries if query["sql"].startswith('INSERT INTO "character_inventoryitem"')]
+        self.assertEqual(len(inserts), 1)
+
+    def test_command_restores_gzip_csv(self) -> None:
+        """Teste Export und Wiederherstellung über die Kommandos mit komprimiertem CSV."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "aria.csv.gz"
+            call_command(
+                "export_user_data", "aria", "--output", str(path), "--format", "csv", "--gzip", stdout=io.StringIO(),
+            )
+            records = self.export()
+            self.user.delete()
+            out = io.StringIO()
+            call_command("restore_user_data", str(path), stdout=out, stderr=io.StringIO())
+
+        self.assertIn("Restored 1 users, 1 characters, 2 inventory rows (1 equipped) and 1 quests", out.getvalue())
+        self.user = UserAccount.objects.get(username="aria")
+        self.assertEqual(self.export(), records)
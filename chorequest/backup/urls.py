@@ -0,0 +1,9 @@
+"""URL configuration for the backup app."""
+
+from django.urls import path
+
+from .views import ExportView
+
+urlpatterns = [
+    path("api/export/", ExportView.as_view(), name="export"),
+]
@@ -0,0 +1,45 @@
+"""Views of the backup API."""
+
+from typing import ClassVar
+
+from django.http import StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from .export import CONTENT_TYPES, FORMATS, export_stream, iterate_async
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """Query parameters of the export; ``format`` is taken by DRF's format suffix, hence ``output``."""
+
+    output = serializers.ChoiceField(choices=FORMATS, default="jsonl")
+    gzip = serializers.BooleanField(default=False)
+
+
+class ExportView(APIView):
+    """
+    Download the own game data: ``GET /api/export/?output=jsonl|csv&gzip=true``.
+
+    The file is streamed while it is read from the database, so the response
+    starts immediately and needs constant memory whatever its size.
+    """
+
+    permission_classes: ClassVar[list] = [IsAuthenticated]
+
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """Stream the export of the current user."""
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        output, compress = params.validated_data["output"], params.validated_data["gzip"]
+
+        chunks = export_stream([request.user.pk], output, compress=compress)
+        # Unter ASGI blockweise aus dem Thread der Datenbankverbindung lesen
+        content = iterate_async(chunks) if getattr(request, "scope", None) is not None else chunks
+        filename = f"chorequest-export-{request.user.instance.username}.{output}{'.gz' if compress else ''}"
+        response = StreamingHttpResponse(
+            content, content_type="application/gzip" if compress else CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
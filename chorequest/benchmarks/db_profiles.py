@@ -0,0 +1,163 @@
+"""
+Concurrent write benchmark comparing the database profiles.
+
+Every profile runs in its own subprocess against a scratch database: the schema
+is migrated, a few characters and items are created and then ``--threads``
+threads run a mixed workload for ``--seconds`` (write transactions that grant
+XP and items, interleaved with character reads).  The report lists operations
+per second, latency percentiles and the number of "database is locked" errors::
+
+    python benchmarks/db_profiles.py --profiles sqlite-plain sqlite --threads 8 --seconds 10
+
+The ``postgres`` profile uses the ``POSTGRES_*`` environment variables and
+needs an empty database it may migrate.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+CHARACTERS = 50
+ITEMS = 20
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` (nearest rank)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def setup_world() -> tuple[list[int], list[int]]:
+    """Migrate the scratch database and create the characters and items used by the workload."""
+    from character.models import Character, Item  # noqa: PLC0415
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from django.core.management import call_command  # noqa: PLC0415
+
+    call_command("migrate", verbosity=0)
+    user = get_user_model().objects.create(username="bench", email="bench@example.com")
+    characters = Character.objects.bulk_create(
+        Character(user=user, name=f"BenchHero{index}", max_inventory_slots=10_000, max_carry_weight=1e9)
+        for index in range(CHARACTERS)
+    )
+    items = Item.objects.bulk_create(Item(name=f"BenchItem{index}", stacksize=99) for index in range(ITEMS))
+    return [character.pk for character in characters], [item.pk for item in items]
+
+
+def workload(
+    character_ids: list[int], item_ids: list[int], deadline: float, write_ratio: float, results: dict,
+) -> None:
+    """Run write and read operations until ``deadline`` and record latencies and errors."""
+    from character.models import Character, InventoryItem  # noqa: PLC0415
+    from django.db import OperationalError, connection, transaction  # noqa: PLC0415
+    from django.db.models import F  # noqa: PLC0415
+
+    rng = random.Random(threading.get_ident())  # noqa: S311
+    latencies, errors = [], 0
+    while time.perf_counter() < deadline:
+        character_id = rng.choice(character_ids)
+        start = time.perf_counter()
+        try:
+            if rng.random() < write_ratio:
+                with transaction.atomic():
+                    Character.objects.filter(pk=character_id).update(experience_points=F("experience_points") + 1)
+                    InventoryItem.objects.create(character_id=character_id, item_id=rng.choice(item_ids))
+            else:
+                list(Character.objects.filter(pk=character_id).prefetch_related("inventory"))
+        except OperationalError:
+            errors += 1
+        else:
+            latencies.append((time.perf_counter() - start) * 1000)
+    connection.close()
+    with results["lock"]:
+        results["latencies"].extend(latencies)
+        results["errors"] += errors
+
+
+def run_worker(args: argparse.Namespace) -> dict:
+    """Run the benchmark for the profile selected through the environment."""
+    import django  # noqa: PLC0415
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chorequest.settings")
+    django.setup()
+    from django.db import connection  # noqa: PLC0415
+
+    character_ids, item_ids = setup_world()
+    connection.close()
+
+    results = {"lock": threading.Lock(), "latencies": [], "errors": 0}
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=workload, args=(character_ids, item_ids, deadline, args.write_ratio, results))
+        for _ in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies = results["latencies"]
+    return {
+        "profile": os.environ.get("CHOREQUEST_DB_PROFILE", "sqlite"),
+        "threads": args.threads,
+        "seconds": args.seconds,
+        "operations": len(latencies),
+        "ops_per_second": round(len(latencies) / args.seconds, 1),
+        "errors": results["errors"],
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def run_profile(profile: str, args: argparse.Namespace) -> dict:
+    """Run the benchmark for ``profile`` in a subprocess with its own scratch database."""
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            **os.environ,
+            "CHOREQUEST_DB_PROFILE": profile,
+            "SQLITE_PATH": str(Path(directory) / "bench.sqlite3"),
+            "SQLITE_BUSY_TIMEOUT": str(args.busy_timeout),
+        }
+        command = [
+            sys.executable, __file__, "--worker",
+            "--threads", str(args.threads),
+            "--seconds", str(args.seconds),
+            "--write-ratio", str(args.write_ratio),
+        ]
+        output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout  # noqa: S603
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Parse the command line and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", default=["sqlite-plain", "sqlite"])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.5, help="Share of write transactions.")
+    parser.add_argument("--busy-timeout", type=int, default=20, help="SQLite busy timeout in seconds.")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        sys.stdout.write(json.dumps(run_worker(args)) + "\n")
+        return
+    report = [run_profile(profile, args) for profile in args.profiles]
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Micro benchmarks for the game-logic hot paths.
+
+Every benchmark runs against a scratch SQLite database for each combination of
+``--stacks`` (inventory stacks per character) and ``--characters`` (characters
+of the benchmark user)::
+
+    python benchmarks/hot_paths.py --stacks 10 100 1000 --characters 1 10 > report.json
+
+For every case the report contains operations per second, the mean latency,
+the number of queries of one operation and the peak Python memory allocated by
+one operation (``tracemalloc``).  Writing operations run inside a transaction
+that is rolled back afterwards, so every iteration sees the same data; the
+rollback is part of the measured time.
+
+Save a report as baseline and compare later runs against it; regressions are
+listed in the report and make the script exit with status 1::
+
+    python benchmarks/hot_paths.py --save-baseline baseline.json
+    python benchmarks/hot_paths.py --baseline baseline.json --threshold 0.2
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+EXPERIENCE_POINTS = 250
+
+
+@contextmanager
+def rolled_back() -> Iterator[None]:
+    """Run the block in a transaction that is always rolled back."""
+    from django.db import transaction  # noqa: PLC0415
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def measure(
+    operation: Callable[[], object], setup: "Callable[[], object] | None", min_time: float, min_runs: int,
+) -> dict:
+    """Return throughput, latency, query count and peak memory of ``operation``."""
+    from chorequest.instrumentation import RequestMetrics  # noqa: PLC0415
+    from django.db import connection  # noqa: PLC0415
+
+    # Eine Probe-Ausführung für Abfragen und Speicher, ungestört von der Zeitmessung
+    if setup:
+        setup()
+    queries = RequestMetrics()
+    tracemalloc.start()
+    with connection.execute_wrapper(queries):
+        operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    runs, elapsed = 0, 0.0
+    while runs < min_runs or elapsed < min_time:
+        if setup:
+            setup()
+        start = time.perf_counter()
+        operation()
+        elapsed += time.perf_counter() - start
+        runs += 1
+    return {
+        "runs": runs,
+        "ops_per_second": round(runs / elapsed, 2),
+        "mean_ms": round(elapsed / runs * 1000, 3),
+        "queries": len(queries.queries),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def build_world(stacks: int, characters: int) -> dict:
+    """Create a user with ``characters`` characters carrying ``stacks`` stacks each."""
+    from character.models import Character, InventoryItem, Item  # noqa: PLC0415
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+
+    name = f"bench-{stacks}-{characters}"
+    user = get_user_model().objects.create(username=name, email=f"{name}@example.com")
+    items = Item.objects.bulk_create(
+        Item(name=f"Bench-{stacks}-{characters}-{index}", stacksize=99, weight=0.1) for index in range(stacks + 1)
+    )
+    heroes = Character.objects.bulk_create(
+        Character(
+            user=user,
+            name=f"BenchHero-{stacks}-{characters}-{index}",
+            max_inventory_slots=stacks + 10,
+            max_carry_weight=1e9,
+        )
+        for index in range(characters)
+    )
+    InventoryItem.objects.bulk_create(
+        InventoryItem(character=hero, item=item, quantity=2) for hero in heroes for item in items[:stacks]
+    )
+    return {"user": user, "characters": heroes, "stacked_item": items[0], "new_item": items[stacks]}
+
+
+def benchmarks(world: dict) -> dict[str, tuple[Callable[[], object], "Callable[[], object] | None"]]:
+    """Return the benchmark operations for ``world`` as ``name: (operation, setup)``."""
+    from character.models import Character  # noqa: PLC0415
+    from character.serializers import CharacterSerializer  # noqa: PLC0415
+    from django.core.cache import cache  # noqa: PLC0415
+    from rest_framework.test import APIClient  # noqa: PLC0415
+    from user.tokens import ChoreQuestRefreshToken  # noqa: PLC0415
+
+    hero = world["characters"][0]
+    stacked_item, new_item = world["stacked_item"], world["new_item"]
+    queryset = Character.objects.filter(user_id=world["user"].pk)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {ChoreQuestRefreshToken.for_user(world['user']).access_token}")
+
+    def add_item() -> None:
+        with rolled_back():
+            hero.add_item_to_inventory(new_item, 1)
+
+    def remove_item() -> None:
+        with rolled_back():
+            hero.remove_item_from_inventory(stacked_item, 1)
+
+    def add_experience() -> None:
+        with rolled_back():
+            # Kopie, damit der Level-Up den Ausgangszustand nicht verändert
+            copy.copy(hero).add_experience(EXPERIENCE_POINTS)
+
+    return {
+        "has_inventory_space": (lambda: hero.has_inventory_space(new_item, 1), None),
+        "add_item_to_inventory": (add_item, None),
+        "remove_item_from_inventory": (remove_item, None),
+        "add_experience": (add_experience, None),
+        "serializer_list_cold": (lambda: CharacterSerializer(queryset, many=True).data, cache.clear),
+        "serializer_list_warm": (lambda: CharacterSerializer(queryset, many=True).data, None),
+        "viewset_list_cold": (lambda: client.get("/api/characters/"), cache.clear),
+        "viewset_retrieve_cold": (lambda: client.get(f"/api/characters/{hero.pk}/"), cache.clear),
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[dict]:
+    """Return the cases slower by more than ``threshold`` or running more queries than in ``baseline``."""
+    previous = {(entry["benchmark"], entry["stacks"], entry["characters"]): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        old = previous.get((entry["benchmark"], entry["stacks"], entry["characters"]))
+        if old is None:
+            continue
+        change = entry["ops_per_second"] / old["ops_per_second"] - 1 if old["ops_per_second"] else 0.0
+        reasons = []
+        if change < -threshold:
+            reasons.append(f"throughput {change:+.1%}")
+        if entry["queries"] > old["queries"]:
+            reasons.append(f"queries {old['queries']} -> {entry['queries']}")
+        if reasons:
+            regressions.append({
+                "benchmark": entry["benchmark"],
+                "stacks": entry["stacks"],
+                "characters": entry["characters"],
+                "reasons": reasons,
+            })
+    return regressions
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    """Run all selected benchmarks for every data size."""
+    import django  # noqa: PLC0415
+
+    django.setup()
+    from django.core.management import call_command  # noqa: PLC0415
+    from django.test.utils import override_settings  # noqa: PLC0415
+
+    call_command("migrate", verbosity=0)
+    results = []
+    # Ohne DEBUG, damit die Zeitmessung nicht das Mitschreiben jeder Abfrage enthält
+    with override_settings(DEBUG=False):
+        for stacks in args.stacks:
+            for characters in args.characters:
+                world = build_world(stacks, characters)
+                for name, (operation, setup) in benchmarks(world).items():
+                    if args.only and name not in args.only:
+                        continue
+                    stats = measure(operation, setup, args.min_time, args.min_runs)
+                    results.append({"benchmark": name, "stacks": stacks, "characters": characters, **stats})
+    return results
+
+
+def main() -> None:
+    """Parse the command line and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stacks", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--characters", nargs="+", type=int, default=[1, 10])
+    parser.add_argument("--only", nargs="+", help="Run only the named benchmarks.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum measured seconds per case.")
+    parser.add_argument("--min-runs", type=int, default=5, help="Minimum number of measured runs per case.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previously saved report.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Tolerated throughput loss (0.2 = 20%%).")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results to this file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chorequest.settings")
+        os.environ["SQLITE_PATH"] = str(Path(directory) / "bench.sqlite3")
+        os.environ.setdefault("CHOREQUEST_CACHE_BACKEND", "locmem")
+        results = run(args)
+
+    report = {"python": sys.version.split()[0], "results": results}
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        report["regressions"] = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
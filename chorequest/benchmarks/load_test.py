@@ -0,0 +1,291 @@
+"""
+End-to-end HTTP load test with a weighted mix of realistic traffic.
+
+Every virtual user logs in with its own account, keeps its own access and
+refresh token and then picks weighted actions until ``--duration`` is over:
+
+* ``login``: a fresh JWT login,
+* ``refresh``: exchange the refresh token for a new access token,
+* ``poll``: list the user's characters (what open app tabs do),
+* ``grant``: add an item to the inventory of one of the user's characters
+  (only open to ordinary accounts with ``CHOREQUEST_BENCHMARK_ENDPOINTS=1``),
+* ``complete``: complete one of the user's open or accepted quests.
+
+The accounts are the ones created by ``seed_world`` (``<prefix>-user-<n>``
+with a shared password).  Run the server under test first, e.g.::
+
+    python manage.py seed_world --users 2000
+    CHOREQUEST_BENCHMARK_ENDPOINTS=1 gunicorn chorequest.wsgi -w 4      # or runserver / uvicorn
+    python benchmarks/load_test.py --base-url http://127.0.0.1:8000 --vus 50 --duration 60 \
+        --html report.html > report.json
+
+The JSON report and the HTML summary list throughput, p50/p95/p99 latency,
+status codes and the error rate per endpoint.
+"""
+
+import argparse
+import html
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+from benchmarks.login_storm import summarize  # noqa: E402
+
+LOGIN_PATH = "/api/user/login/"
+REFRESH_PATH = "/api/user/token/refresh/"
+CHARACTERS_PATH = "/api/characters/"
+QUESTS_PATH = "/api/character-quests/"
+
+DEFAULT_MIX = {"login": 2, "refresh": 8, "poll": 60, "grant": 15, "complete": 15}
+
+
+class Recorder:
+    """Thread-safe collection of latencies and status codes per endpoint."""
+
+    def __init__(self) -> None:
+        """Start with empty samples."""
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, status: "int | str", milliseconds: float) -> None:
+        """Record one request of ``endpoint``."""
+        with self._lock:
+            self.latencies[endpoint].append(milliseconds)
+            self.statuses[endpoint][str(status)] += 1
+
+    def report(self, seconds: float) -> dict:
+        """Return the per endpoint summary for a run of ``seconds``."""
+        endpoints = {}
+        for endpoint in sorted(self.latencies):
+            samples, statuses = self.latencies[endpoint], dict(self.statuses[endpoint])
+            errors = sum(count for status, count in statuses.items() if not status.isdigit() or int(status) >= 400)  # noqa: PLR2004
+            endpoints[endpoint] = {
+                **summarize(samples),
+                "requests_per_second": round(len(samples) / seconds, 2) if seconds else 0.0,
+                "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+                "status_counts": statuses,
+            }
+        return endpoints
+
+
+class VirtualUser:
+    """One simulated player with its own connection and tokens."""
+
+    def __init__(self, args: argparse.Namespace, username: str, recorder: Recorder, seed: int) -> None:
+        """Prepare the connection; nothing is sent before :meth:`run`."""
+        self.args = args
+        self.username = username
+        self.recorder = recorder
+        self.rng = random.Random(seed)  # noqa: S311
+        self.url = urlsplit(args.base_url)
+        self.connection: http.client.HTTPConnection | None = None
+        self.access = self.refresh = ""
+        self.character_ids: list[int] = []
+        self.quest_ids: list[int] = []
+
+    def request(self, endpoint: str, method: str, path: str, payload: "dict | None" = None) -> tuple[int, object]:
+        """Send one request over the kept-alive connection and record its latency."""
+        headers = {"Content-Type": "application/json"}
+        if self.access and endpoint not in {"login", "refresh"}:
+            headers["Authorization"] = f"Bearer {self.access}"
+        body = json.dumps(payload).encode() if payload is not None else None
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                secure = self.url.scheme == "https"
+                connection_class = http.client.HTTPSConnection if secure else http.client.HTTPConnection
+                self.connection = connection_class(self.url.netloc, timeout=self.args.timeout)
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException) as exc:
+            self.recorder.record(endpoint, type(exc).__name__, (time.perf_counter() - start) * 1000)
+            self.close()
+            return 0, None
+        self.recorder.record(endpoint, status, (time.perf_counter() - start) * 1000)
+        if response.will_close:
+            self.close()
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            return status, None
+
+    def close(self) -> None:
+        """Close the connection, the next request opens a new one."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def login(self) -> bool:
+        """Log in and remember both tokens."""
+        status, body = self.request(
+            "login", "POST", LOGIN_PATH, {"username": self.username, "password": self.args.password},
+        )
+        if status != 200:  # noqa: PLR2004
+            return False
+        self.access, self.refresh = body["access"], body["refresh"]
+        return True
+
+    def refresh_token(self) -> None:
+        """Exchange the refresh token for a new access token."""
+        status, body = self.request("refresh", "POST", REFRESH_PATH, {"refresh": self.refresh})
+        if status == 200:  # noqa: PLR2004
+            self.access = body["access"]
+            self.refresh = body.get("refresh", self.refresh)
+
+    def poll(self) -> None:
+        """List the characters and remember their ids."""
+        status, body = self.request("poll", "GET", CHARACTERS_PATH)
+        if status == 200 and body:  # noqa: PLR2004
+            self.character_ids = [character["id"] for character in body]
+
+    def grant(self) -> None:
+        """Add a random item to one of the characters."""
+        if not self.character_ids:
+            self.poll()
+            return
+        character_id = self.rng.choice(self.character_ids)
+        item_id = self.rng.choice(self.args.item_ids)
+        self.request("grant", "POST", f"{CHARACTERS_PATH}{character_id}/inventory/", {"item": item_id, "quantity": 1})
+
+    def complete(self) -> None:
+        """Complete one of the open or accepted quests."""
+        if not self.quest_ids:
+            status, body = self.request("quests", "GET", f"{QUESTS_PATH}?status=open,accepted")
+            self.quest_ids = [quest["id"] for quest in body or []] if status == 200 else []  # noqa: PLR2004
+            if not self.quest_ids:
+                return
+        self.request("complete", "POST", f"{QUESTS_PATH}{self.quest_ids.pop()}/complete/")
+
+    def run(self, deadline: float) -> None:
+        """Log in and run weighted actions until ``deadline``."""
+        if not self.login():
+            return
+        actions = {"login": self.login, "refresh": self.refresh_token, "poll": self.poll,
+                   "grant": self.grant, "complete": self.complete}
+        names = [name for name in self.args.mix if self.args.mix[name] > 0]
+        weights = [self.args.mix[name] for name in names]
+        while time.perf_counter() < deadline:
+            actions[self.rng.choices(names, weights)[0]]()
+            if self.args.think_time:
+                time.sleep(self.rng.expovariate(1 / self.args.think_time))
+        self.close()
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run all virtual users and return the report."""
+    recorder = Recorder()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    users = [
+        VirtualUser(args, f"{args.prefix}-user-{index % args.accounts}", recorder, seed=args.seed + index)
+        for index in range(args.vus)
+    ]
+    with ThreadPoolExecutor(max_workers=args.vus) as pool:
+        list(pool.map(lambda user: user.run(deadline), users))
+    seconds = time.perf_counter() - start
+
+    endpoints = recorder.report(seconds)
+    total = sum(endpoint["count"] for endpoint in endpoints.values())
+    errors = sum(endpoint["error_rate"] * endpoint["count"] for endpoint in endpoints.values())
+    return {
+        "base_url": args.base_url,
+        "virtual_users": args.vus,
+        "seconds": round(seconds, 2),
+        "mix": args.mix,
+        "requests": total,
+        "requests_per_second": round(total / seconds, 2) if seconds else 0.0,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def render_html(report: dict) -> str:
+    """Return a self-contained HTML summary of ``report``."""
+    columns = ["count", "requests_per_second", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "error_rate"]
+    rows = "".join(
+        "<tr><th>{}</th>{}<td>{}</td></tr>".format(
+            html.escape(name),
+            "".join(f"<td>{endpoint[column]}</td>" for column in columns),
+            html.escape(", ".join(f"{status}: {count}" for status, count in endpoint["status_counts"].items())),
+        )
+        for name, endpoint in report["endpoints"].items()
+    )
+    header = "".join(f"<th>{column}</th>" for column in ["endpoint", *columns, "status codes"])
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>ChoreQuest load test</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 0.3em 0.8em; text-align: right; }}
+th:first-child {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>ChoreQuest load test</h1>
+<p>{html.escape(report["base_url"])}: {report["virtual_users"]} virtual users for {report["seconds"]} s,
+{report["requests"]} requests ({report["requests_per_second"]} req/s), error rate {report["error_rate"]:.2%}.</p>
+<p>Mix: {html.escape(json.dumps(report["mix"]))}</p>
+<table>
+<tr>{header}</tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parse ``login=2,poll=60,...`` into the action weights."""
+    mix = dict(DEFAULT_MIX)
+    for part in filter(None, value.split(",")):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            msg = f"Unknown action {name!r}, expected one of {', '.join(DEFAULT_MIX)}."
+            raise argparse.ArgumentTypeError(msg)
+        mix[name] = float(weight)
+    return mix
+
+
+def main() -> None:
+    """Parse the command line, run the load test and write the reports."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--vus", type=int, default=20, help="Number of virtual users.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    parser.add_argument("--prefix", default="seed", help="Username prefix used by seed_world.")
+    parser.add_argument("--accounts", type=int, default=1000, help="Number of seeded accounts to spread the VUs over.")
+    parser.add_argument("--password", default="chorequest", help="Password of the seeded accounts.")
+    parser.add_argument("--item-ids", type=int, nargs="+", default=list(range(1, 51)), help="Items to grant.")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="Action weights, e.g. 'poll=80,grant=10' (unlisted actions keep their default).")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between actions in seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--html", type=Path, help="Also write an HTML summary to this file.")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.html:
+        args.html.write_text(render_html(report), encoding="utf-8")
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Login storm load test.
+
+Measures the latency of an unrelated authenticated endpoint while a burst of
+logins hits the server.  With password hashing on the bounded pool the probe
+latency during the storm should stay close to the idle baseline; saturated
+logins are answered with ``429`` instead of occupying workers.
+
+Run against a local server, e.g.::
+
+    python manage.py runserver --noreload
+    python benchmarks/login_storm.py --base-url http://127.0.0.1:8000 \
+        --username alice --password secret --logins 200 --concurrency 50
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+LOGIN_PATH = "/api/user/login/"
+PROBE_PATH = "/api/characters/"
+
+
+def post_json(url: str, payload: dict, timeout: float) -> tuple[int, dict]:
+    """POST ``payload`` as JSON and return the status code and decoded body."""
+    request = urllib.request.Request(  # noqa: S310
+        url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"}, method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
+            return response.status, json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as exc:
+        return exc.code, {}
+
+
+def timed_get(url: str, token: str, timeout: float) -> float:
+    """GET ``url`` with a bearer token and return the latency in milliseconds."""
+    request = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})  # noqa: S310
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` (nearest rank)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict:
+    """Return count, mean and percentiles for latency ``samples``."""
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 2) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+    }
+
+
+def probe(url: str, token: str, stop: threading.Event, interval: float, timeout: float) -> list[float]:
+    """Poll the probe endpoint until ``stop`` is set and collect latencies."""
+    samples = []
+    while not stop.is_set():
+        samples.append(timed_get(url, token, timeout))
+        time.sleep(interval)
+    return samples
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run the baseline and storm phases and return the report."""
+    login_url = args.base_url.rstrip("/") + LOGIN_PATH
+    probe_url = args.base_url.rstrip("/") + PROBE_PATH
+    credentials = {"username": args.username, "password": args.password}
+
+    status_code, body = post_json(login_url, credentials, args.timeout)
+    if status_code != 200:  # noqa: PLR2004
+        msg = f"Initial login failed with status {status_code}."
+        raise SystemExit(msg)
+    token = body["access"]
+
+    baseline = [timed_get(probe_url, token, args.timeout) for _ in range(args.baseline_requests)]
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as probe_pool:
+        probe_future = probe_pool.submit(probe, probe_url, token, stop, args.probe_interval, args.timeout)
+        storm_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as storm_pool:
+            statuses = list(
+                storm_pool.map(lambda _: post_json(login_url, credentials, args.timeout)[0], range(args.logins)),
+            )
+        storm_seconds = time.perf_counter() - storm_start
+        stop.set()
+        during = probe_future.result()
+
+    baseline_summary = summarize(baseline)
+    during_summary = summarize(during)
+    return {
+        "logins": args.logins,
+        "concurrency": args.concurrency,
+        "storm_seconds": round(storm_seconds, 2),
+        "login_status_counts": {str(code): statuses.count(code) for code in sorted(set(statuses))},
+        "probe_baseline": baseline_summary,
+        "probe_during_storm": during_summary,
+        "p95_ratio": round(during_summary["p95_ms"] / baseline_summary["p95_ms"], 2)
+        if baseline_summary["p95_ms"]
+        else None,
+    }
+
+
+def main() -> None:
+    """Parse the command line and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=200, help="Number of logins in the storm.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Parallel login clients.")
+    parser.add_argument("--baseline-requests", type=int, default=50)
+    parser.add_argument("--probe-interval", type=float, default=0.02, help="Seconds between probe requests.")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:  # noqa: PTH123
+            handle.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 """Admin configuration for the character app."""
 
+from chorequest.admin_utils import EstimatedCountPaginator, range_filter
 from django.contrib import admin
+from search.mixins import FullTextSearchMixin
 
-from .models import Character, InventoryItem, Item
+from .models import Character, Equipment, InventoryItem, Item
+
+LEVEL_BUCKETS = [(1, 10), (10, 20), (20, 40), (40, None)]
+EXPERIENCE_BUCKETS = [(0, 100), (100, 1000), (1000, 10000), (10000, None)]
 
 
 class InventoryItemInline(admin.TabularInline):
@@ -11,14 +16,49 @@ class InventoryItemInline(admin.TabularInline):
     model = InventoryItem
     extra = 1  # Anzahl leerer Felder für neue Einträge
     fields = ("item", "quantity", "current_durability")
+    autocomplete_fields = ("item",)
 
 class CharacterAdmin(admin.ModelAdmin):
     """Admin interface for Character."""
 
     list_display = ("name", "user", "level", "experience_points", "date_created")
+    list_select_related = ("user",)
     search_fields = ("name", "user__username")
-    list_filter = ("level", "experience_points")
+    # Feste Bereiche statt SELECT DISTINCT über die ganze Tabelle
+    list_filter = (range_filter("level", LEVEL_BUCKETS), range_filter("experience_points", EXPERIENCE_BUCKETS))
+    autocomplete_fields = ("user",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+class ItemAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    """Admin interface for Item; the search uses the full-text index."""
+
+    list_display = ("name", "item_type", "rarity", "slot", "value")
+    search_fields = ("name", "description")
+    search_kind = "item"
+
+class InventoryItemAdmin(admin.ModelAdmin):
+    """Admin interface for InventoryItem."""
+
+    list_display = ("item", "character", "quantity", "current_durability")
+    list_select_related = ("item", "character")
+    search_fields = ("character__name", "item__name")
+    autocomplete_fields = ("character", "item")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+class EquipmentAdmin(admin.ModelAdmin):
+    """Admin interface for Equipment."""
+
+    list_display = ("character", "slot", "inventory_item")
+    list_select_related = ("character", "inventory_item__item", "inventory_item__character")
+    list_filter = ("slot",)
+    search_fields = ("character__name",)
+    autocomplete_fields = ("character", "inventory_item")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 admin.site.register(Character, CharacterAdmin)
-admin.site.register(Item)
-admin.site.register(InventoryItem)
+admin.site.register(Item, ItemAdmin)
+admin.site.register(InventoryItem, InventoryItemAdmin)
+admin.site.register(Equipment, EquipmentAdmin)
@@ -8,3 +8,7 @@ class CharacterConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "character"
+
+    def ready(self) -> None:
+        """Connect the signal handlers of the character app."""
+        from . import signals  # noqa: F401, PLC0415
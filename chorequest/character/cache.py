@@ -0,0 +1,114 @@
+"""
+Caching of serialized character payloads.
+
+``CharacterSerializer`` output barely changes between polls, so it is cached per
+character.  The key contains the character id, the character's version token
+and the global item version token::
+
+    character:payload:<id>:<character version>.<item version>:<host>
+
+Saving or deleting a ``Character`` or one of its ``InventoryItem`` rows bumps the
+character's version; saving an ``Item`` bumps the item version and with it every
+payload.  The bumps run after the surrounding transaction commits (see
+:mod:`character.signals`).  Code that changes rows with ``update()`` or
+``bulk_create()`` must call :func:`invalidate_character_payloads` itself.
+
+The id of each user's active character is cached as well (``character:active:<user id>``),
+so resolving the acting character needs neither a query nor the token claim,
+which goes stale when the player switches characters.
+"""
+
+from collections.abc import Callable, Iterable
+
+from chorequest.cache import bump_versions, cache_metrics, get_versions
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+ACTIVE_CACHE_PREFIX = "character:active"
+NO_ACTIVE_CHARACTER = 0
+CHARACTER_NAMESPACE = "character"
+ITEM_NAMESPACE = "item"
+ALL_ITEMS = "all"
+
+
+def get_character_cache_timeout() -> int:
+    """Return the lifetime of a cached character payload in seconds."""
+    return getattr(settings, "CHARACTER_CACHE_TIMEOUT", 300)
+
+
+def character_payload_keys(character_ids: Iterable[int], variant: str = "") -> dict[int, str]:
+    """Return the current payload cache key of every character id."""
+    character_ids = list(character_ids)
+    versions = get_versions(CHARACTER_NAMESPACE, character_ids)
+    item_version = get_versions(ITEM_NAMESPACE, [ALL_ITEMS])[ALL_ITEMS]
+    return {
+        character_id: f"character:payload:{character_id}:{versions[character_id]}.{item_version}:{variant}"
+        for character_id in character_ids
+    }
+
+
+def get_or_render_payloads(instances: list, render: Callable, variant: str = "") -> list[dict]:
+    """
+    Return the serialized payload of every character, rendering only cache misses.
+
+    ``render`` turns a single ``Character`` into its payload.  All lookups and all
+    writes of one call are done with ``get_many``/``set_many``.
+    """
+    keys = character_payload_keys((instance.pk for instance in instances), variant)
+    cached = cache.get_many(keys.values())
+    payloads, missing = [], {}
+    for instance in instances:
+        key = keys[instance.pk]
+        if key in cached:
+            payloads.append(cached[key])
+        else:
+            payload = dict(render(instance))
+            missing[key] = payload
+            payloads.append(payload)
+    if missing:
+        cache.set_many(missing, get_character_cache_timeout())
+    cache_metrics.record(CHARACTER_NAMESPACE, hits=len(instances) - len(missing), misses=len(missing))
+    return payloads
+
+
+def invalidate_character_payloads(character_ids: Iterable[int]) -> None:
+    """Invalidate the cached payloads of ``character_ids`` once the transaction commits."""
+    character_ids = set(character_ids)
+    if character_ids:
+        transaction.on_commit(lambda: bump_versions(CHARACTER_NAMESPACE, character_ids))
+
+
+def invalidate_all_character_payloads() -> None:
+    """Invalidate every cached character payload once the transaction commits."""
+    transaction.on_commit(lambda: bump_versions(ITEM_NAMESPACE, [ALL_ITEMS]))
+
+
+def active_character_cache_key(user_id: "int | str") -> str:
+    """Return the cache key holding the active character id of ``user_id``."""
+    return f"{ACTIVE_CACHE_PREFIX}:{user_id}"
+
+
+def get_active_character_id(user_id: "int | str") -> "int | None":
+    """
+    Return the id of the active character of ``user_id`` or ``None``.
+
+    Misses are answered from the partial unique index ``unique_active_character``
+    and cached, including the answer "no active character".
+    """
+    key = active_character_cache_key(user_id)
+    character_id = cache.get(key)
+    if character_id is None:
+        from .models import Character  # noqa: PLC0415 - the models import this module
+
+        character_id = (
+            Character.objects.filter(user_id=user_id, active=True).values_list("id", flat=True).first()
+            or NO_ACTIVE_CHARACTER
+        )
+        cache.set(key, character_id, get_character_cache_timeout())
+    return character_id or None
+
+
+def invalidate_active_character(user_id: "int | str") -> None:
+    """Drop the cached active character of ``user_id`` once the transaction commits."""
+    transaction.on_commit(lambda: cache.delete(active_character_cache_key(user_id)))
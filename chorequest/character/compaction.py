@@ -0,0 +1,98 @@
+"""
+Inventory compaction.
+
+Adding and removing items fills and drains stacks in database order, so over
+time an inventory fragments into many partially filled stacks of the same
+item.  :func:`compact_inventory` merges them again: the stacks of one item
+with the same durability are refilled up to ``Item.stacksize``, the fullest
+stacks are kept and the emptied ones deleted.  Equipped stacks are never
+touched.
+
+The whole inventory is read in one query and written back with one
+``bulk_update`` and one ``DELETE``, independent of the number of items.
+Both bypass the model signals, so the payload cache is invalidated
+explicitly.
+"""
+
+import time
+from collections import Counter
+from itertools import groupby
+from math import ceil
+
+from chorequest.db import delete_rows
+from django.db import transaction
+from django.db.models import Count, F
+
+from .cache import invalidate_character_payloads
+from .events import publish_inventory
+from .models import InventoryItem
+
+
+def compact_inventory(character_id: int) -> int:
+    """Merge the partially filled stacks of a character; return the number of removed stacks."""
+    with transaction.atomic():
+        stacks = list(
+            InventoryItem.objects.select_for_update(of=("self",))
+            .filter(character_id=character_id, equipped__isnull=True)
+            .order_by("item_id", "current_durability", "-quantity", "pk")
+            .values_list("pk", "item_id", "current_durability", "quantity", "item__stacksize"),
+        )
+        updates, deletes, changed = [], [], []
+        for (item_id, durability), group in groupby(stacks, key=lambda stack: (stack[1], stack[2])):
+            group = list(group)  # noqa: PLW2901
+            stacksize = max(group[0][4], 1)
+            total = sum(stack[3] for stack in group)
+            # Die vollsten Stacks bleiben erhalten, das spart Schreibzugriffe
+            kept = ceil(total / stacksize)
+            for index, (pk, _item_id, _durability, quantity, _stacksize) in enumerate(group):
+                if index >= kept:
+                    deletes.append(pk)
+                    continue
+                target = stacksize if index < kept - 1 else total - stacksize * (kept - 1)
+                if target != quantity:
+                    updates.append(InventoryItem(pk=pk, quantity=target))
+                    changed.append({"id": pk, "item": item_id, "quantity": target, "current_durability": durability})
+        if updates:
+            InventoryItem.objects.bulk_update(updates, ["quantity"])
+        if deletes:
+            delete_rows(InventoryItem.objects.filter(pk__in=deletes))
+        publish_inventory(character_id, stacks=changed, removed=deletes)
+    if updates or deletes:
+        invalidate_character_payloads([character_id])
+    return len(deletes)
+
+
+def most_fragmented(limit: int = 1000) -> list[tuple[int, int]]:
+    """
+    Return ``(character_id, surplus)`` of the most fragmented inventories, worst first.
+
+    The surplus counts the partially filled, unequipped stacks of an item
+    beyond the first one; only inventories with a surplus can be compacted.
+    """
+    groups = (
+        InventoryItem.objects.filter(equipped__isnull=True, quantity__lt=F("item__stacksize"))
+        .values("character_id", "item_id", "current_durability")
+        .annotate(partial=Count("id"))
+        .filter(partial__gt=1)
+        .order_by()
+        .values_list("character_id", "partial")
+    )
+    surplus: Counter[int] = Counter()
+    for character_id, partial in groups.iterator():
+        surplus[character_id] += partial - 1
+    return surplus.most_common(limit)
+
+
+def compact_fragmented_inventories(limit: int = 1000) -> tuple[int, int, float]:
+    """
+    Compact the ``limit`` most fragmented inventories, one transaction each.
+
+    Returns the number of compacted characters, the removed stacks and the
+    elapsed seconds.
+    """
+    start = time.perf_counter()
+    characters = removed = 0
+    for character_id, _surplus in most_fragmented(limit):
+        removed += compact_inventory(character_id)
+        characters += 1
+    return characters, removed, time.perf_counter() - start
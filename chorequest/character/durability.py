@@ -0,0 +1,112 @@
+"""
+Set-based durability mechanics for inventory items.
+
+``InventoryItem.current_durability`` is ``NULL`` for an undamaged stack, which
+stands for the item's ``max_durability``.  Wear and repair never load rows into
+Python: every operation is a single ``UPDATE`` that computes the new value in
+SQL, e.g.::
+
+    UPDATE character_inventoryitem
+       SET current_durability = MAX(COALESCE(current_durability, <item max>) - 5, 0)
+     WHERE id IN (<equipped stacks>)
+
+Repairs cost gold: every missing durability point of every unit in a stack
+costs the item's ``value``.  The price is summed in SQL and paid in the same
+transaction as the repair.
+
+Bulk updates bypass the model signals, so the payload cache is invalidated
+explicitly.
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from chorequest.db import pk_ranges
+from django.db import transaction
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .cache import invalidate_all_character_payloads, invalidate_character_payloads
+from .events import publish_resync
+from .models import Character, InventoryItem, Item
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DECAY_PER_QUEST = 1
+
+
+def _max_durability() -> Subquery:
+    """Return the ``max_durability`` of the item of the outer inventory row."""
+    return Subquery(Item.objects.filter(pk=OuterRef("item_id")).values("max_durability")[:1])
+
+
+def decay(queryset: QuerySet, amount: int) -> int:
+    """Lower the durability of the stacks in ``queryset`` by ``amount``, not below zero; return the row count."""
+    return queryset.update(
+        current_durability=Greatest(Coalesce(F("current_durability"), _max_durability()) - Value(amount), Value(0)),
+    )
+
+
+def equipped_stacks(character_ids: "Iterable[int] | None" = None) -> QuerySet:
+    """Return the equipped inventory stacks, optionally of ``character_ids`` only."""
+    queryset = InventoryItem.objects.filter(equipped__isnull=False)
+    if character_ids is not None:
+        queryset = queryset.filter(character_id__in=list(character_ids))
+    return queryset
+
+
+def decay_equipment(character_id: int, amount: int = DECAY_PER_QUEST) -> int:
+    """Wear down the equipped items of one character, e.g. after a completed quest."""
+    rows = decay(equipped_stacks([character_id]), amount)
+    if rows:
+        invalidate_character_payloads([character_id])
+        publish_resync([character_id])
+    return rows
+
+
+def repair_inventory(character_id: int) -> tuple[int, int]:
+    """
+    Restore every damaged, repairable stack of a character to full durability.
+
+    Raises ``ValueError`` if the character cannot pay the repair; nothing is
+    written in that case.  Returns the number of repaired stacks and the gold
+    paid.
+    """
+    stacks = InventoryItem.objects.filter(
+        character_id=character_id, item__is_repairable=True, current_durability__isnull=False,
+    )
+    with transaction.atomic():
+        balance = Character.objects.select_for_update().values_list("gold", flat=True).get(pk=character_id)
+        cost = stacks.aggregate(
+            cost=Sum((F("item__max_durability") - F("current_durability")) * F("item__value") * F("quantity")),
+        )["cost"] or 0
+        if cost > balance:
+            msg = "Not enough gold to repair."
+            raise ValueError(msg)
+        rows = stacks.update(current_durability=None)
+        if cost:
+            Character.objects.filter(pk=character_id).update(gold=F("gold") - cost)
+        if rows:
+            publish_resync([character_id])
+    if rows:
+        invalidate_character_payloads([character_id])
+    return rows, cost
+
+
+def decay_all_equipment(amount: int = DECAY_PER_QUEST, chunk_size: int = 5000) -> tuple[int, float]:
+    """
+    Wear down the equipped items of all characters.
+
+    The inventory table is processed in primary key ranges, one short
+    transaction per range, so memory use and lock times stay constant.
+    Returns the number of updated rows and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    rows = 0
+    for low, high in pk_ranges(InventoryItem.objects.all(), chunk_size):
+        with transaction.atomic():
+            rows += decay(equipped_stacks().filter(pk__range=(low, high)), amount)
+    if rows:
+        invalidate_all_character_payloads()
+    return rows, time.perf_counter() - start
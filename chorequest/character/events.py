@@ -0,0 +1,96 @@
+"""
+Change events of a character for the event stream (see :mod:`character.streams`).
+
+Events are published on the channel ``character:<id>`` after the surrounding
+transaction commits:
+
+``character``
+    level, experience, gold, hitpoints and mana after the character was saved,
+``inventory``
+    the new state of changed stacks (``stacks``) and the ids of removed
+    stacks (``removed``),
+``quest``
+    status and progress of a quest of the character; ``quest`` identifies
+    the assignment, ``id`` is missing for bulk assignments,
+``resync``
+    the change cannot be described row by row (set-based updates such as
+    durability decay or vendor sales); the client reloads the character.
+
+Model saves publish through :mod:`character.signals` and :mod:`quest.signals`;
+code writing with ``update()``, ``bulk_update()`` or raw deletes publishes
+itself, just like it invalidates the payload cache.
+"""
+
+from typing import TYPE_CHECKING
+
+from chorequest.events import broker
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Character, InventoryItem
+
+CHARACTER_STATE_FIELDS = (
+    "level",
+    "experience_points",
+    "experience_points_to_next_level",
+    "gold",
+    "hitpoints",
+    "hitpoints_max",
+    "mana",
+    "mana_max",
+)
+
+
+def character_channel(character_id: "int | str") -> str:
+    """Return the event channel of a character."""
+    return f"character:{character_id}"
+
+
+def publish_character_events(character_ids: "Iterable[int]", event_type: str, data: "dict | None" = None) -> None:
+    """Publish the same event for every character in ``character_ids`` once the transaction commits."""
+    character_ids = set(character_ids)
+    if not character_ids:
+        return
+    event = {"type": event_type, "data": data or {}}
+
+    def publish() -> None:
+        for character_id in character_ids:
+            broker.publish(character_channel(character_id), event)
+
+    transaction.on_commit(publish)
+
+
+def publish_character_event(character_id: int, event_type: str, data: "dict | None" = None) -> None:
+    """Publish an event for ``character_id`` once the transaction commits."""
+    publish_character_events([character_id], event_type, data)
+
+
+def character_state(character: "Character") -> dict:
+    """Return the fields of the ``character`` event."""
+    return {field: getattr(character, field) for field in CHARACTER_STATE_FIELDS}
+
+
+def stack_state(stack: "InventoryItem") -> dict:
+    """Return the state of an inventory stack as sent in ``inventory`` events."""
+    return {
+        "id": stack.pk,
+        "item": stack.item_id,
+        "quantity": stack.quantity,
+        "current_durability": stack.current_durability,
+    }
+
+
+def publish_inventory(
+    character_id: int, stacks: "Iterable[dict]" = (), removed: "Iterable[int]" = (),
+) -> None:
+    """Publish changed (``stacks``, see :func:`stack_state`) and removed stacks of a character."""
+    stacks, removed = list(stacks), list(removed)
+    if stacks or removed:
+        publish_character_event(character_id, "inventory", {"stacks": stacks, "removed": removed})
+
+
+def publish_resync(character_ids: "Iterable[int]") -> None:
+    """Ask the clients of ``character_ids`` to reload the full character state."""
+    publish_character_events(character_ids, "resync")
@@ -0,0 +1,52 @@
+"""
+Factories for character models using factory_boy.
+
+This module defines factories for creating test instances of characters, items
+and inventory rows.
+"""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from character.models import Character, InventoryItem, Item
+
+
+class ItemFactory(DjangoModelFactory):
+    """Factory for the Item model."""
+
+    name = factory.Sequence(lambda n: f"Item {n}")
+    description = factory.Faker("sentence")
+    rarity = factory.Faker("random_element", elements=["trash", "common", "rare", "epic", "legendary"])
+    weight = factory.Faker("pydecimal", left_digits=1, right_digits=2, positive=True)
+    value = factory.Faker("random_int", min=1, max=500)
+    stacksize = factory.Faker("random_element", elements=[1, 10, 20, 99])
+
+    class Meta:
+        """Meta information for the ItemFactory."""
+
+        model = Item
+
+
+class CharacterFactory(DjangoModelFactory):
+    """Factory for the Character model."""
+
+    user = factory.SubFactory("user.factories.UserAccountFactory")
+    name = factory.Sequence(lambda n: f"Hero {n}")
+
+    class Meta:
+        """Meta information for the CharacterFactory."""
+
+        model = Character
+
+
+class InventoryItemFactory(DjangoModelFactory):
+    """Factory for the InventoryItem model."""
+
+    character = factory.SubFactory(CharacterFactory)
+    item = factory.SubFactory(ItemFactory)
+    quantity = 1
+
+    class Meta:
+        """Meta information for the InventoryItemFactory."""
+
+        model = InventoryItem
@@ -0,0 +1,85 @@
+"""
+Management command measuring the cost of idle event streams in one worker.
+
+Opens ``--connections`` streams of :func:`character.streams.event_stream` in a
+single event loop, the state a worker keeps per connected client, and reports
+the Python memory per idle stream and the time to deliver one event to every
+stream::
+
+    python manage.py benchmark_event_streams --connections 5000
+
+Sockets and the ASGI server's own buffers are not included.
+"""
+
+import asyncio
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+from chorequest.events import broker
+from django.core.management.base import BaseCommand
+
+from character.streams import event_stream
+
+BENCHMARK_CHANNEL = "benchmark:{}"
+
+
+async def run_benchmark(connections: int) -> tuple[int, float]:
+    """Return the traced memory of ``connections`` idle streams in bytes and the fan-out time in seconds."""
+    received = 0
+    target = connections
+    reached = asyncio.Event()
+
+    async def client(stream: object) -> None:
+        nonlocal received
+        async for _message in stream:
+            received += 1
+            if received == target:
+                reached.set()
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tasks = [
+            asyncio.create_task(client(event_stream(broker.subscribe(BENCHMARK_CHANNEL.format(index)), {})))
+            for index in range(connections)
+        ]
+        await reached.wait()
+        # Einen Durchlauf der Event-Loop abwarten, bis alle Streams im Leerlauf warten
+        await asyncio.sleep(0)
+        memory = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    reached.clear()
+    target = 2 * connections
+    start = time.perf_counter()
+    for index in range(connections):
+        broker.publish(BENCHMARK_CHANNEL.format(index), {"type": "quest", "data": {"quest": 1, "progress": 50}})
+    await reached.wait()
+    seconds = time.perf_counter() - start
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return memory, seconds
+
+
+class Command(BaseCommand):
+    """Measure memory and fan-out time of idle event streams."""
+
+    help = "Open many idle event streams in one event loop and report memory and fan-out time."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument("--connections", type=int, default=5000, help="Number of idle streams to open.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Run the benchmark and report the result."""
+        connections = options["connections"]
+        memory, seconds = asyncio.run(run_benchmark(connections))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{connections} idle streams: {memory / 2**20:.1f} MiB ({memory / connections / 1024:.1f} KiB each), "
+                f"one event to all streams in {seconds * 1000:.0f}ms.",
+            ),
+        )
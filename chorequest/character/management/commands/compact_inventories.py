@@ -0,0 +1,31 @@
+"""
+Management command compacting the most fragmented inventories.
+
+Finds the inventories with the most partially filled stacks of the same item
+and merges them, one short transaction per character::
+
+    python manage.py compact_inventories --limit 5000
+"""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from character.compaction import compact_fragmented_inventories
+
+
+class Command(BaseCommand):
+    """Merge the partially filled stacks of the most fragmented inventories."""
+
+    help = "Compact the inventories with the most partially filled stacks first."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument("--limit", type=int, default=1000, help="Maximum number of inventories to compact.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Run the compaction and report the result."""
+        characters, removed, seconds = compact_fragmented_inventories(options["limit"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Compacted {characters} inventories, removed {removed} stacks in {seconds:.2f}s."),
+        )
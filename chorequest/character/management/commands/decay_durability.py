@@ -0,0 +1,31 @@
+"""
+Management command wearing down the equipped items of all characters.
+
+Runs one set-based ``UPDATE`` per primary key range of the inventory table, so
+it needs constant memory regardless of the number of characters::
+
+    python manage.py decay_durability --amount 2 --chunk-size 10000
+"""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from character.durability import DECAY_PER_QUEST, decay_all_equipment
+
+
+class Command(BaseCommand):
+    """Decay the durability of all equipped inventory stacks."""
+
+    help = "Lower the durability of every equipped item in chunked, set-based updates."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument("--amount", type=int, default=DECAY_PER_QUEST, help="Durability points to remove.")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Inventory ids per UPDATE statement.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Run the decay and report the throughput."""
+        rows, seconds = decay_all_equipment(options["amount"], options["chunk_size"])
+        rate = rows / seconds if seconds else 0.0
+        self.stdout.write(self.style.SUCCESS(f"Decayed {rows} equipped stacks in {seconds:.2f}s ({rate:.0f} rows/s)."))
@@ -0,0 +1,69 @@
+"""
+Migration adding the Equipment model and the cached equipment bonus of characters.
+
+Generated by Django 5.2 on 2026-10-19 07:25
+"""
+
+from typing import ClassVar
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration creates the Equipment model and adds Character.equipment_bonus."""
+
+    dependencies: ClassVar[list] = [
+        ("character", "0006_item_character_max_carry_weight_and_more"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.AddField(
+            model_name="character",
+            name="equipment_bonus",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.CreateModel(
+            name="Equipment",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "slot",
+                    models.CharField(
+                        choices=[
+                            ("head", "Head"),
+                            ("chest", "Chest"),
+                            ("legs", "Legs"),
+                            ("weapon", "Weapon"),
+                            ("shield", "Shield"),
+                            ("ring", "Ring"),
+                            ("necklace", "Necklace"),
+                            ("boots", "Boots"),
+                            ("gloves", "Gloves"),
+                            ("none", "None"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "character",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="equipment",
+                        to="character.character",
+                    ),
+                ),
+                (
+                    "inventory_item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.RESTRICT,
+                        related_name="equipped",
+                        to="character.inventoryitem",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("character", "slot"), name="unique_equipment_slot")],
+            },
+        ),
+    ]
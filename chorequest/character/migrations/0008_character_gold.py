@@ -0,0 +1,25 @@
+"""
+Migration adding the gold balance of characters.
+
+Generated by Django 5.2 on 2026-10-19 09:40
+"""
+
+from typing import ClassVar
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration adds Character.gold."""
+
+    dependencies: ClassVar[list] = [
+        ("character", "0007_equipment"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.AddField(
+            model_name="character",
+            name="gold",
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,38 @@
+"""
+Migration allowing at most one active character per user.
+
+Generated by Django 5.2 on 2026-10-19 10:15
+
+Users that already have several active characters keep the oldest one
+active before the partial unique constraint is added.
+"""
+
+from typing import ClassVar
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def deactivate_duplicates(apps: object, schema_editor: object) -> None:  # noqa: ARG001
+    """Keep only the oldest active character of every user active."""
+    character_model = apps.get_model("character", "Character")
+    oldest = character_model.objects.filter(active=True).values("user_id").annotate(oldest=Min("id")).values("oldest")
+    character_model.objects.filter(active=True).exclude(pk__in=oldest).update(active=False)
+
+
+class Migration(migrations.Migration):
+    """Migration adds the partial unique constraint on the active character of a user."""
+
+    dependencies: ClassVar[list] = [
+        ("character", "0008_character_gold"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.RunPython(deactivate_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="character",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("active", True)), fields=("user",), name="unique_active_character",
+            ),
+        ),
+    ]
@@ -1,11 +1,14 @@
 """Module containing the models for characters, items, and inventory in the ChoreQuest game."""
 
 from decimal import Decimal
+from typing import ClassVar
 
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 from django.db.models import TextChoices
 
+from .cache import invalidate_active_character
+
 
 class SlotChoices(TextChoices):
     """Enumeration for different equipment slots."""
@@ -72,6 +75,18 @@ class Item(models.Model):
         """Return the string representation of the item."""
         return self.name
 
+ATTRIBUTES = ("strength", "dexterity", "intelligence", "constitution", "wisdom", "charisma")
+# Bonus-Schlüssel im Equipment-Cache und die zugehörigen Item-Felder
+ITEM_BONUS_FIELDS = {
+    **{attribute: f"{attribute}_bonus" for attribute in ATTRIBUTES},
+    "hitpoints": "hitpoints_bonus",
+    "mana": "mana_bonus",
+}
+HITPOINTS_PER_CONSTITUTION = 5
+MANA_PER_INTELLIGENCE = 3
+CARRY_WEIGHT_PER_STRENGTH = 2.5
+
+
 def calculate_experience_to_next_level(level: int, base_xp: int = 100, growth_factor: float = 1.5) -> int:
     """Berechnet die benötigten Erfahrungspunkte für das nächste Level basierend auf exponentiellem Wachstum."""
     return round(base_xp * (level ** growth_factor))
@@ -114,11 +129,130 @@ class Character(models.Model):
     mana_max = models.IntegerField(default=10)
     max_inventory_slots = models.IntegerField(default=20)
     max_carry_weight = models.FloatField(default=50.0)
+    gold = models.IntegerField(default=0)
+    # Summe der Boni aller ausgerüsteten Items, wird bei equip/unequip fortgeschrieben
+    equipment_bonus = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        """Meta information for the Character model."""
+
+        constraints: ClassVar[list] = [
+            # Partieller Index: höchstens ein aktiver Charakter pro Benutzer, zugleich der Lookup-Index
+            models.UniqueConstraint(fields=["user"], condition=models.Q(active=True), name="unique_active_character"),
+        ]
 
     def __str__(self) -> str:
         """Return the string representation of the character."""
         return self.name
 
+    def activate(self) -> None:
+        """
+        Macht diesen Charakter zum aktiven Charakter seines Benutzers.
+
+        Die Charaktere des Benutzers werden gesperrt, dann wird der bisher aktive
+        abgewählt und dieser aktiviert.  Ein einzelnes ``UPDATE ... CASE`` ist
+        nicht möglich: SQLite und PostgreSQL prüfen den partiellen Unique-Index
+        pro Zeile, und bedingte Constraints lassen sich nicht verzögern.
+        """
+        with transaction.atomic():
+            list(Character.objects.select_for_update().filter(user_id=self.user_id).order_by("pk").values_list("pk"))
+            Character.objects.filter(user_id=self.user_id, active=True).exclude(pk=self.pk).update(active=False)
+            Character.objects.filter(pk=self.pk).update(active=True)
+            invalidate_active_character(self.user_id)
+        self.active = True
+
+    @property
+    def effective_stats(self) -> dict[str, float]:
+        """
+        Gibt die Werte des Charakters inklusive Ausrüstung zurück.
+
+        Berechnet aus den eigenen Feldern und ``equipment_bonus``, ohne Zugriff
+        auf Inventar- oder Ausrüstungstabellen.
+        """
+        bonus = self.equipment_bonus
+        stats: dict[str, float] = {
+            attribute: getattr(self, attribute) + bonus.get(attribute, 0) for attribute in ATTRIBUTES
+        }
+        stats["hitpoints_max"] = (
+            self.hitpoints_max + bonus.get("hitpoints", 0) + bonus.get("constitution", 0) * HITPOINTS_PER_CONSTITUTION
+        )
+        stats["mana_max"] = self.mana_max + bonus.get("mana", 0) + bonus.get("intelligence", 0) * MANA_PER_INTELLIGENCE
+        stats["max_carry_weight"] = self.max_carry_weight + bonus.get("strength", 0) * CARRY_WEIGHT_PER_STRENGTH
+        return stats
+
+    def _add_equipment_bonus(self, item: Item, sign: int) -> None:
+        """Addiert (``sign=1``) oder subtrahiert (``sign=-1``) die Boni von ``item``."""
+        bonus = dict(self.equipment_bonus)
+        for key, field in ITEM_BONUS_FIELDS.items():
+            value = bonus.get(key, 0) + sign * getattr(item, field)
+            if value:
+                bonus[key] = value
+            else:
+                bonus.pop(key, None)
+        self.equipment_bonus = bonus
+
+    def _equipped_items(self) -> models.QuerySet:
+        """Gibt die Ausrüstung des Charakters samt Items zurück."""
+        return Equipment.objects.filter(character=self).select_related("inventory_item__item")
+
+    def _lock_equipment_bonus(self) -> None:
+        """Sperrt die Zeile des Charakters und lädt den aktuellen ``equipment_bonus``."""
+        self.equipment_bonus = (
+            Character.objects.select_for_update().values_list("equipment_bonus", flat=True).get(pk=self.pk)
+        )
+
+    def equip(self, inventory_item: "InventoryItem") -> "Equipment":
+        """
+        Rüstet ein Item aus dem Inventar aus.
+
+        Ein bereits belegter Slot wird vorher geleert; die Boni werden
+        inkrementell in ``equipment_bonus`` fortgeschrieben.
+        """
+        item = inventory_item.item
+        if inventory_item.character_id != self.pk:
+            msg = "Item is not in the inventory of this character."
+            raise ValueError(msg)
+        if item.slot == SlotChoices.NONE:
+            msg = "Item cannot be equipped."
+            raise ValueError(msg)
+        if item.required_level > self.level:
+            msg = "Level too low for this item."
+            raise ValueError(msg)
+
+        with transaction.atomic():
+            self._lock_equipment_bonus()
+            current = self._equipped_items().filter(slot=item.slot).first()
+            if current is not None:
+                if current.inventory_item_id == inventory_item.pk:
+                    return current
+                self._add_equipment_bonus(current.inventory_item.item, -1)
+                current.delete()
+            equipment = Equipment.objects.create(character=self, slot=item.slot, inventory_item=inventory_item)
+            self._add_equipment_bonus(item, 1)
+            self.save(update_fields=["equipment_bonus"])
+        return equipment
+
+    def unequip(self, slot: str) -> None:
+        """Legt das Item im ``slot`` ab und zieht seine Boni wieder ab."""
+        with transaction.atomic():
+            self._lock_equipment_bonus()
+            equipment = self._equipped_items().filter(slot=slot).first()
+            if equipment is None:
+                msg = "Nothing equipped in this slot."
+                raise ValueError(msg)
+            self._add_equipment_bonus(equipment.inventory_item.item, -1)
+            equipment.delete()
+            self.save(update_fields=["equipment_bonus"])
+
+    def recalculate_equipment_bonus(self) -> None:
+        """Berechnet ``equipment_bonus`` vollständig aus der Ausrüstung neu, z. B. nach Änderung eines Items."""
+        with transaction.atomic():
+            self._lock_equipment_bonus()
+            self.equipment_bonus = {}
+            for equipment in self._equipped_items():
+                self._add_equipment_bonus(equipment.inventory_item.item, 1)
+            self.save(update_fields=["equipment_bonus"])
+
     def level_up(self) -> None:
         """
         Erhöht das Level des Charakters, basierend auf den Erfahrungspunkten.
@@ -158,7 +292,8 @@ class Character(models.Model):
         # Check Weight
         current_weight = self.calculate_inventory_weight()
         additional_weight = new_item.weight * quantity
-        return not Decimal(current_weight) + Decimal(additional_weight) > Decimal(self.max_carry_weight)
+        max_carry_weight = self.effective_stats["max_carry_weight"]
+        return not Decimal(current_weight) + Decimal(additional_weight) > Decimal(max_carry_weight)
 
     def add_item_to_inventory(self, item: Item, quantity:int=1) -> None:
         """Fügt ein Item zum Inventar hinzu, unter Berücksichtigung von Stacklimits und Platzkapazität."""
@@ -196,8 +331,8 @@ class Character(models.Model):
 
 
     def remove_item_from_inventory(self, item:Item, quantity:int=1)->None:
-        """Entfernt ein Item aus dem Inventar."""
-        inventory_item = InventoryItem.objects.filter(character=self, item=item).first()
+        """Entfernt ein Item aus dem Inventar; ausgerüstete Stacks bleiben unberührt."""
+        inventory_item = InventoryItem.objects.filter(character=self, item=item, equipped__isnull=True).first()
         if not inventory_item:
             msg = "Item not found in inventory."
             raise ValueError(msg)
@@ -242,3 +377,23 @@ class InventoryItem(models.Model):
     def __str__(self) -> str:
         """Return the string representation of the inventory item."""
         return f"{self.quantity} x {self.item.name} (Owned by {self.character.name})"
+
+
+class Equipment(models.Model):
+    """An inventory item worn in one equipment slot of a character."""
+
+    character = models.ForeignKey("Character", on_delete=models.CASCADE, related_name="equipment")
+    slot = models.CharField(max_length=20, choices=SlotChoices.choices)
+    # RESTRICT: ein ausgerüsteter Stack muss erst abgelegt werden, bevor er gelöscht wird
+    inventory_item = models.OneToOneField("InventoryItem", on_delete=models.RESTRICT, related_name="equipped")
+
+    class Meta:
+        """Meta information for the Equipment model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(fields=["character", "slot"], name="unique_equipment_slot"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the equipment."""
+        return f"{self.slot}: {self.inventory_item_id} (Character {self.character_id})"
@@ -0,0 +1,20 @@
+"""Permissions of the character API."""
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+
+class CanGrantItems(BasePermission):
+    """
+    Allow granting items out of thin air to staff only.
+
+    The load test needs the endpoint for ordinary accounts; it is opened for
+    them with ``BENCHMARK_ENDPOINTS`` (``CHOREQUEST_BENCHMARK_ENDPOINTS=1``),
+    which must stay off in production.
+    """
+
+    def has_permission(self, request: Request, view: APIView) -> bool:  # noqa: ARG002
+        """Return whether the user may grant items."""
+        return bool(request.user and (request.user.is_staff or getattr(settings, "BENCHMARK_ENDPOINTS", False)))
@@ -1,10 +1,16 @@
 """Serializers for the character app."""
 
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from chorequest.instrumentation import TimedSerializerMixin
+from django.db import models
 from rest_framework import serializers
 
-from .models import Character, InventoryItem, Item
+from .cache import get_or_render_payloads
+from .models import Character, Equipment, InventoryItem, Item, SlotChoices
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class ItemSerializer(serializers.ModelSerializer):
@@ -33,17 +39,88 @@ class InventoryItemSerializer(serializers.ModelSerializer):
         """Meta class for InventoryItemSerializer."""
 
         model = InventoryItem
-        fields: ClassVar[list[str]] = ["id", "item", "quantity"]  # Die Inventarinfos
+        fields: ClassVar[list[str]] = ["id", "item", "quantity", "current_durability"]  # Die Inventarinfos
+
+class EquipmentSerializer(serializers.ModelSerializer):
+    """Serializer für die ausgerüsteten Items."""
+
+    class Meta:
+        """Meta class for EquipmentSerializer."""
+
+        model = Equipment
+        fields: ClassVar[list[str]] = ["slot", "inventory_item"]
+
+
+class EquipSerializer(serializers.Serializer):
+    """Eingabe für das Ausrüsten eines Inventar-Items."""
+
+    inventory_item = serializers.PrimaryKeyRelatedField(queryset=InventoryItem.objects.select_related("item"))
+
+
+class UnequipSerializer(serializers.Serializer):
+    """Eingabe für das Ablegen eines Slots."""
+
+    slot = serializers.ChoiceField(choices=SlotChoices.choices)
+
+
+class InventoryGrantSerializer(serializers.Serializer):
+    """Eingabe für das Hinzufügen eines Items zum Inventar."""
+
+    item = serializers.PrimaryKeyRelatedField(queryset=Item.objects.all())
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+
+class TradeLineSerializer(serializers.Serializer):
+    """Ein Item und die Menge, die übergeben werden soll."""
+
+    # Nur die Id: die Items werden im Trade-Service in einer Query geladen
+    item = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class TradeSerializer(serializers.Serializer):
+    """Eingabe für die Übergabe mehrerer Items an einen anderen Charakter."""
 
-class CharacterSerializer(serializers.ModelSerializer):
-    """Serializer for the Character model."""
+    to = serializers.IntegerField(min_value=1)
+    items = TradeLineSerializer(many=True, allow_empty=False, max_length=100)
+
+
+class SellSerializer(serializers.Serializer):
+    """Filter für den Verkauf an den Händler; alle angegebenen Filter müssen passen."""
+
+    rarity = serializers.MultipleChoiceField(choices=Item._meta.get_field("rarity").choices, required=False)  # noqa: SLF001
+    item_type = serializers.MultipleChoiceField(choices=Item._meta.get_field("item_type").choices, required=False)  # noqa: SLF001
+    items = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=100)
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Verlange mindestens einen Filter."""
+        if not data:
+            msg = "At least one filter is required."
+            raise serializers.ValidationError(msg)
+        return data
+
+
+class CharacterListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    """List serializer fetching all cached character payloads with one cache lookup."""
+
+    def to_representation(self, data: Any) -> list[dict]:  # noqa: ANN401
+        """Return the payloads of all characters in ``data``."""
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return self.child.to_cached_representation(list(iterable))
+
+
+class CharacterSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """Serializer for the Character model; the output is cached per character (see ``character.cache``)."""
 
     inventory = InventoryItemSerializer(many=True, required=False)
+    equipment = EquipmentSerializer(many=True, read_only=True)
+    effective_stats = serializers.ReadOnlyField()
 
     class Meta:
         """Meta class for CharacterSerializer."""
 
         model = Character
+        list_serializer_class = CharacterListSerializer
         fields: ClassVar[list[str]] = [
             "id",
             "name",
@@ -62,9 +139,32 @@ class CharacterSerializer(serializers.ModelSerializer):
             "mana",
             "hitpoints_max",
             "mana_max",
+            "gold",
             "inventory",
+            "equipment",
+            "effective_stats",
         ]
-        extra_kwargs: ClassVar[dict] = {"user": {"required": False}}
+        extra_kwargs: ClassVar[dict] = {"user": {"required": False}, "gold": {"read_only": True}}
+
+    def to_representation(self, instance: Character) -> dict:
+        """Return the cached payload of ``instance``."""
+        return self.to_cached_representation([instance])[0]
+
+    def to_cached_representation(
+        self, instances: list[Character], load: "Callable[[Character], Character] | None" = None,
+    ) -> list[dict]:
+        """
+        Return the payloads of ``instances``, rendering only cache misses.
+
+        With ``load`` the instances may be stubs that only carry the primary key;
+        ``load`` returns the full character for a stub whose payload is missing.
+        """
+        request = self.context.get("request")
+        variant = request.get_host() if request else ""
+        render = super().to_representation
+        if load is not None:
+            return get_or_render_payloads(instances, lambda stub: render(load(stub)), variant)
+        return get_or_render_payloads(instances, render, variant)
 
     def validate_level(self, value:int) -> int:
         """Validiert, dass der Level immer größer als 0 ist."""
@@ -0,0 +1,55 @@
+"""Signal handlers invalidating cached character payloads and publishing change events."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_active_character, invalidate_all_character_payloads, invalidate_character_payloads
+from .events import character_state, publish_character_event, publish_inventory, stack_state
+from .models import Character, InventoryItem, Item
+
+
+@receiver(post_save, sender=Character)
+@receiver(post_delete, sender=Character)
+def character_changed(sender: type[Character], instance: Character, **kwargs: object) -> None:  # noqa: ARG001
+    """Invalidate the payload and the cached active character of a saved or deleted character."""
+    invalidate_character_payloads([instance.pk])
+    invalidate_active_character(instance.user_id)
+
+
+@receiver(post_save, sender=Character)
+def character_saved(sender: type[Character], instance: Character, **kwargs: object) -> None:  # noqa: ARG001
+    """Publish the new experience, level and resources of a saved character."""
+    publish_character_event(instance.pk, "character", character_state(instance))
+
+
+@receiver(post_save, sender=InventoryItem)
+@receiver(post_delete, sender=InventoryItem)
+def inventory_changed(sender: type[InventoryItem], instance: InventoryItem, **kwargs: object) -> None:  # noqa: ARG001
+    """Invalidate the payload of the character owning the inventory row."""
+    invalidate_character_payloads([instance.character_id])
+
+
+@receiver(post_save, sender=InventoryItem)
+def inventory_saved(sender: type[InventoryItem], instance: InventoryItem, **kwargs: object) -> None:  # noqa: ARG001
+    """Publish the new state of a saved stack."""
+    publish_inventory(instance.character_id, stacks=[stack_state(instance)])
+
+
+@receiver(post_delete, sender=InventoryItem)
+def inventory_deleted(sender: type[InventoryItem], instance: InventoryItem, **kwargs: object) -> None:  # noqa: ARG001
+    """Publish the removal of a stack."""
+    publish_inventory(instance.character_id, removed=[instance.pk])
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def item_changed(sender: type[Item], instance: Item, **kwargs: object) -> None:  # noqa: ARG001
+    """Invalidate all payloads, any character may carry the item."""
+    invalidate_all_character_payloads()
+
+
+@receiver(post_save, sender=Item)
+def equipped_item_changed(sender: type[Item], instance: Item, **kwargs: object) -> None:  # noqa: ARG001
+    """Recalculate the equipment bonus of every character wearing the item, its bonuses may have changed."""
+    for character in Character.objects.filter(equipment__inventory_item__item=instance):
+        character.recalculate_equipment_bonus()
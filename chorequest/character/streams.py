@@ -0,0 +1,88 @@
+"""
+Server-sent event stream of a character.
+
+``GET /api/characters/<id>/events/`` keeps the connection open and streams the
+events of :mod:`character.events` instead of having every open tab poll the
+character endpoint.  An idle stream is one suspended coroutine and a bounded
+queue, so a worker holds thousands of them (see the ``benchmark_event_streams``
+command).  The view needs an ASGI server (``chorequest.asgi:application``); under
+WSGI every stream would block a worker thread.
+
+``EventSource`` cannot send headers, so besides ``Authorization: Bearer`` the
+access token is accepted as ``?token=``.
+"""
+
+from typing import TYPE_CHECKING
+
+from chorequest.events import HEARTBEAT, broker, encode_event
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
+from user.authentication import ClaimsJWTAuthentication
+
+from .events import character_channel, character_state
+from .models import Character
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from chorequest.events import Subscription
+    from user.authentication import ClaimsTokenUser
+
+RETRY_MILLISECONDS = 5000
+
+
+def authenticate_stream(request: HttpRequest) -> "ClaimsTokenUser":
+    """Return the user of the access token in the ``Authorization`` header or the ``token`` parameter."""
+    authentication = ClaimsJWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else request.GET.get("token", "").encode()
+    if not raw_token:
+        raise NotAuthenticated
+    return authentication.get_user(authentication.get_validated_token(raw_token))
+
+
+async def event_stream(subscription: "Subscription", state: dict) -> "AsyncIterator[bytes]":
+    """
+    Yield the current character state, then every event of ``subscription``.
+
+    Without events a comment is sent every ``EVENTS_HEARTBEAT_INTERVAL``
+    seconds, so proxies keep the connection open and closed clients are
+    noticed.  The subscription ends with the stream.
+    """
+    heartbeat = getattr(settings, "EVENTS_HEARTBEAT_INTERVAL", 15)
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n".encode() + encode_event({"type": "character", "data": state})
+        while True:
+            message = await subscription.get(heartbeat)
+            yield HEARTBEAT if message is None else message
+    finally:
+        broker.unsubscribe(subscription)
+
+
+class CharacterEventsView(View):
+    """Async view streaming the change events of one character of the current user."""
+
+    async def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """Open the event stream of the character."""
+        try:
+            user = authenticate_stream(request)
+        except (AuthenticationFailed, NotAuthenticated) as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+            return JsonResponse(detail, status=exc.status_code)
+
+        # Erst abonnieren, dann laden: kein Event zwischen Zustand und Stream geht verloren
+        subscription = broker.subscribe(character_channel(pk))
+        character = await Character.objects.filter(pk=pk, user_id=user.id).afirst()
+        if character is None:
+            broker.unsubscribe(subscription)
+            return JsonResponse({"detail": "Not found."}, status=404)
+
+        response = StreamingHttpResponse(
+            event_stream(subscription, character_state(character)), content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # Nginx soll die Events nicht puffern
+        response["X-Accel-Buffering"] = "no"
+        return response
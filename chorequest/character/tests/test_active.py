@@ -0,0 +1,143 @@
+"""Tests for the active character: constraint, activate() and the cached lookup."""
+
+import pytest
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.factories import UserAccountFactory
+from user.tokens import ChoreQuestRefreshToken
+
+from character.cache import active_character_cache_key, get_active_character_id
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import Character
+
+
+class ActiveCharacterTest(TestCase):
+    """Teste Constraint, Aktivierung und Cache des aktiven Charakters."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Benutzer mit zwei Charakteren, der erste ist aktiv."""
+        cache.clear()
+        self.user = UserAccountFactory()
+        self.first = CharacterFactory(user=self.user, active=True)
+        self.second = CharacterFactory(user=self.user)
+
+    def test_only_one_active_character(self) -> None:
+        """Teste, ob die Datenbank einen zweiten aktiven Charakter ablehnt."""
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Character.objects.filter(pk=self.second.pk).update(active=True)
+        # Inaktive Charaktere und andere Benutzer sind nicht eingeschränkt
+        CharacterFactory(user=self.user)
+        CharacterFactory(active=True)
+
+    def test_activate(self) -> None:
+        """Teste, ob activate() in beide Richtungen genau einen aktiven Charakter hinterlässt."""
+        for character in (self.second, self.first, self.second):
+            with self.captureOnCommitCallbacks(execute=True):
+                character.activate()
+
+            self.assertEqual(
+                list(Character.objects.filter(user=self.user, active=True).values_list("pk", flat=True)),
+                [character.pk],
+            )
+            self.assertEqual(get_active_character_id(self.user.pk), character.pk)
+
+    def test_lookup_is_cached(self) -> None:
+        """Teste, ob die zweite Auflösung ohne Query auskommt, auch ohne aktiven Charakter."""
+        other = UserAccountFactory()
+        self.assertEqual(get_active_character_id(self.user.pk), self.first.pk)
+        self.assertIsNone(get_active_character_id(other.pk))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_active_character_id(self.user.pk), self.first.pk)
+            self.assertIsNone(get_active_character_id(other.pk))
+
+    def test_save_invalidates(self) -> None:
+        """Teste, ob das Speichern oder Löschen eines Charakters den Cache leert."""
+        get_active_character_id(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.delete()
+
+        self.assertIsNone(cache.get(active_character_cache_key(self.user.pk)))
+        self.assertIsNone(get_active_character_id(self.user.pk))
+
+    def test_lookup_uses_partial_index(self) -> None:
+        """Teste, ob die Auflösung den partiellen Index statt eines Tabellenscans nutzt."""
+        queryset = Character.objects.filter(user_id=self.user.pk, active=True).values_list("id", flat=True)
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+
+        self.assertIn("unique_active_character", plan)
+
+
+class ActiveCharacterViewTest(APITestCase):
+    """Teste die Endpunkte für den aktiven Charakter."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Benutzer mit zwei Charakteren."""
+        cache.clear()
+        self.user = UserAccountFactory()
+        self.first = CharacterFactory(user=self.user, active=True)
+        self.second = CharacterFactory(user=self.user)
+        token = ChoreQuestRefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_active_is_served_from_cache(self) -> None:
+        """Teste, ob der zweite Abruf keine Query mehr braucht."""
+        response = self.client.get("/api/characters/active/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], self.first.pk)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/characters/active/")
+        self.assertEqual(response.data["id"], self.first.pk)
+
+    def test_activate_switches_active(self) -> None:
+        """Teste, ob nach dem Wechsel der neue Charakter geliefert wird."""
+        self.client.get("/api/characters/active/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/api/characters/{self.second.pk}/activate/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.client.get("/api/characters/active/").data["id"], self.second.pk)
+
+    def test_no_active_character(self) -> None:
+        """Teste die Antwort ohne aktiven Charakter."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.active = False
+            self.first.save()
+
+        self.assertEqual(self.client.get("/api/characters/active/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_actions_on_active_character(self) -> None:
+        """Teste, ob Spielaktionen den aktiven Charakter über den Cache statt über den Token-Claim auflösen."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/characters/{self.second.pk}/activate/")
+
+        item = ItemFactory(max_durability=10, is_repairable=True, value=0)
+        InventoryItemFactory(character=self.second, item=item, current_durability=1)
+
+        response = self.client.post("/api/characters/active/repair/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["repaired"], 1)
+        self.assertEqual(self.client.post("/api/characters/active/compact/").status_code, status.HTTP_200_OK)
+
+    def test_actions_without_active_character(self) -> None:
+        """Teste, ob ``active`` ohne aktiven Charakter 404 liefert."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.active = False
+            self.first.save()
+
+        self.assertEqual(self.client.post("/api/characters/active/repair/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_foreign_character_cannot_be_activated(self) -> None:
+        """Teste, ob fremde Charaktere nicht aktiviert werden können."""
+        response = self.client.post(f"/api/characters/{CharacterFactory().pk}/activate/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,65 @@
+"""Query-count tests for the changelists of the character admin."""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from user.factories import UserAccountFactory
+
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import SlotChoices
+
+
+class ChangelistQueryCountTest(TestCase):
+    """Die Anzahl der Queries einer Changelist hängt nicht von der Zahl der Zeilen ab."""
+
+    def setUp(self) -> None:
+        """Melde einen Superuser am Admin an."""
+        self.client.force_login(UserAccountFactory(is_staff=True, is_superuser=True))
+
+    def add_rows(self, count: int) -> None:
+        """Erstelle ``count`` Charaktere mit je einem ausgerüsteten Item."""
+        for _ in range(count):
+            stack = InventoryItemFactory(item=ItemFactory(slot=SlotChoices.HEAD))
+            stack.character.equip(stack)
+
+    def changelist_queries(self, url: str) -> list[str]:
+        """Rufe die Changelist auf und gib die ausgeführten Queries zurück."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [query["sql"] for query in queries.captured_queries]
+
+    def assert_constant_queries(self, url: str) -> None:
+        """Prüfe, ob weitere Zeilen keine zusätzlichen Queries auslösen."""
+        self.add_rows(2)
+        few = self.changelist_queries(url)
+        self.add_rows(8)
+        many = self.changelist_queries(url)
+        self.assertEqual(len(few), len(many))
+
+    def test_character_changelist(self) -> None:
+        """Teste die Charakterliste inklusive Bereichsfiltern."""
+        self.assert_constant_queries("/admin/character/character/")
+        queries = self.changelist_queries("/admin/character/character/")
+        self.assertFalse([sql for sql in queries if "DISTINCT" in sql.upper()])
+
+    def test_inventory_changelist(self) -> None:
+        """Teste die Inventarliste, deren __str__ Item und Charakter braucht."""
+        self.assert_constant_queries("/admin/character/inventoryitem/")
+
+    def test_equipment_changelist(self) -> None:
+        """Teste die Ausrüstungsliste."""
+        self.assert_constant_queries("/admin/character/equipment/")
+
+    def test_item_changelist(self) -> None:
+        """Teste die Itemliste."""
+        self.assert_constant_queries("/admin/character/item/")
+
+    def test_level_range_filter(self) -> None:
+        """Teste, ob der Bereichsfilter nur Charaktere im gewählten Bereich liefert."""
+        CharacterFactory(name="Novice", level=3)
+        CharacterFactory(name="Veteran", level=45)
+
+        response = self.client.get("/admin/character/character/", {"level_range": "40-"})
+
+        self.assertEqual([character.name for character in response.context["cl"].result_list], ["Veteran"])
@@ -0,0 +1,91 @@
+"""Module contains tests for the cached CharacterSerializer payloads."""
+
+import os
+import tempfile
+
+from chorequest.cache import cache_metrics
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from character.models import Character, InventoryItem, Item
+from character.serializers import CharacterSerializer
+
+
+class CharacterPayloadCacheTest(TestCase):
+    """Teste das Caching der Character-Payloads."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter mit Inventar."""
+        cache.clear()
+        cache_metrics.reset()
+        self.user = get_user_model().objects.create_user(
+            username="testuser_cache",
+            email="testuser_cache@example.com",
+            password="password123",  # noqa: S106
+        )
+        self.character = Character.objects.create(user=self.user, name="CacheHero")
+        self.item = Item.objects.create(name="CachePotion", stacksize=10, weight=1.0)
+        InventoryItem.objects.create(character=self.character, item=self.item, quantity=3)
+
+    def serialize(self) -> dict:
+        """Serialisiere den Charakter frisch aus der Datenbank."""
+        return CharacterSerializer(Character.objects.get(pk=self.character.pk)).data
+
+    def test_second_render_is_cache_hit(self) -> None:
+        """Teste, ob der zweite Aufruf das Inventar nicht erneut lädt."""
+        first = self.serialize()
+        with self.assertNumQueries(1):
+            second = self.serialize()
+        self.assertEqual(first, second)
+        self.assertEqual(cache_metrics.snapshot()["character"]["hits"], 1)
+        self.assertEqual(cache_metrics.snapshot()["character"]["misses"], 1)
+
+    def test_inventory_change_invalidates_after_commit(self) -> None:
+        """Teste, ob eine Inventaränderung den Payload nach dem Commit invalidiert."""
+        self.serialize()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.add_item_to_inventory(self.item, quantity=2)
+        self.assertEqual(self.serialize()["inventory"][0]["quantity"], 5)
+
+    def test_item_change_invalidates_all_payloads(self) -> None:
+        """Teste, ob eine Item-Änderung alle Payloads invalidiert."""
+        self.serialize()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.description = "Heals a little."
+            self.item.save()
+        self.assertEqual(self.serialize()["inventory"][0]["item"]["description"], "Heals a little.")
+
+    def test_list_uses_one_lookup_per_page(self) -> None:
+        """Teste, ob die Liste alle Payloads aus dem Cache liest."""
+        Character.objects.create(user=self.user, name="CacheHero2")
+        CharacterSerializer(Character.objects.all(), many=True).data  # noqa: B018
+        with self.assertNumQueries(1):
+            payloads = CharacterSerializer(Character.objects.all(), many=True).data
+        self.assertEqual(len(payloads), 2)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tempfile.mkdtemp(prefix="chorequest-cache-"),
+        },
+    },
+)
+class FileBasedCharacterPayloadCacheTest(CharacterPayloadCacheTest):
+    """Teste das Caching der Character-Payloads mit dem dateibasierten Backend."""
+
+
+if os.environ.get("REDIS_URL"):
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": os.environ["REDIS_URL"],
+            },
+        },
+    )
+    class RedisCharacterPayloadCacheTest(CharacterPayloadCacheTest):
+        """Teste das Caching der Character-Payloads gegen einen Redis-Protokoll-Server aus REDIS_URL."""
@@ -0,0 +1,114 @@
+"""Tests for merging fragmented inventory stacks."""
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from character.compaction import compact_inventory, most_fragmented
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import InventoryItem, SlotChoices
+
+
+class CompactionTest(TestCase):
+    """Teste das Zusammenfassen von Stacks."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter mit zersplitterten Pfeil-Stacks."""
+        self.character = CharacterFactory()
+        self.arrows = ItemFactory(stacksize=20)
+        for quantity in (5, 12, 20, 9, 1):
+            InventoryItemFactory(character=self.character, item=self.arrows, quantity=quantity)
+
+    def quantities(self, item: object) -> list[int]:
+        """Lade die Stackgrößen eines Items absteigend."""
+        return sorted(
+            InventoryItem.objects.filter(character=self.character, item=item).values_list("quantity", flat=True),
+            reverse=True,
+        )
+
+    def test_merges_up_to_stacksize(self) -> None:
+        """Teste, ob 47 Pfeile in zwei volle und einen Rest-Stack gepackt werden."""
+        removed = compact_inventory(self.character.pk)
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(self.quantities(self.arrows), [20, 20, 7])
+
+    def test_single_pass(self) -> None:
+        """Teste, ob die Zahl der Queries nicht von der Zahl der Stacks abhängt."""
+        for quantity in (3, 4, 5, 6):
+            InventoryItemFactory(character=self.character, item=self.arrows, quantity=quantity)
+
+        # SELECT, bulk UPDATE und DELETE, plus SAVEPOINT und RELEASE
+        with self.assertNumQueries(5):
+            compact_inventory(self.character.pk)
+
+        self.assertEqual(self.quantities(self.arrows), [20, 20, 20, 5])
+
+    def test_keeps_equipped_and_durability_apart(self) -> None:
+        """Teste, ob ausgerüstete und beschädigte Stacks nicht mit anderen verschmolzen werden."""
+        ring = ItemFactory(slot=SlotChoices.RING, stacksize=10)
+        worn = InventoryItemFactory(character=self.character, item=ring, quantity=1)
+        InventoryItemFactory(character=self.character, item=ring, quantity=1)
+        InventoryItemFactory(character=self.character, item=ring, quantity=2)
+        damaged = InventoryItemFactory(character=self.character, item=ring, quantity=1, current_durability=3)
+        self.character.equip(worn)
+
+        compact_inventory(self.character.pk)
+
+        self.assertEqual(self.quantities(ring), [3, 1, 1])
+        self.assertTrue(InventoryItem.objects.filter(pk=worn.pk, quantity=1).exists())
+        self.assertTrue(InventoryItem.objects.filter(pk=damaged.pk, quantity=1).exists())
+
+    def test_compacted_inventory_is_untouched(self) -> None:
+        """Teste, ob ein kompaktes Inventar nicht geschrieben wird."""
+        compact_inventory(self.character.pk)
+
+        with self.assertNumQueries(3):
+            self.assertEqual(compact_inventory(self.character.pk), 0)
+
+    def test_most_fragmented_first(self) -> None:
+        """Teste die Reihenfolge der Hintergrund-Kompaktierung."""
+        other = CharacterFactory()
+        for _ in range(2):
+            InventoryItemFactory(character=other, item=self.arrows, quantity=1)
+        CharacterFactory()
+
+        self.assertEqual(most_fragmented(), [(self.character.pk, 3), (other.pk, 1)])
+
+    def test_command(self) -> None:
+        """Teste den Management-Befehl."""
+        call_command("compact_inventories", limit=10, verbosity=0)
+
+        self.assertEqual(self.quantities(self.arrows), [20, 20, 7])
+        self.assertEqual(most_fragmented(), [])
+
+
+class CompactionViewTest(APITestCase):
+    """Teste den Endpunkt zum Kompaktieren."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Benutzer mit zwei halben Stacks."""
+        cache.clear()
+        self.character = CharacterFactory()
+        item = ItemFactory(stacksize=10)
+        InventoryItemFactory(character=self.character, item=item, quantity=4)
+        InventoryItemFactory(character=self.character, item=item, quantity=4)
+        token = ChoreQuestRefreshToken.for_user(self.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_compact(self) -> None:
+        """Teste, ob der Endpunkt die Stacks zusammenfasst."""
+        response = self.client.post(f"/api/characters/{self.character.pk}/compact/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"removed_stacks": 1})
+        self.assertEqual(list(self.character.inventory.values_list("quantity", flat=True)), [8])
+
+    def test_foreign_character(self) -> None:
+        """Teste, ob fremde Charaktere nicht kompaktiert werden können."""
+        response = self.client.post(f"/api/characters/{CharacterFactory().pk}/compact/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
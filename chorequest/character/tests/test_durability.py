@@ -0,0 +1,88 @@
+"""Tests for the set-based durability decay and repair."""
+
+from django.core.management import call_command
+from django.test import TestCase
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.services import complete_quest
+
+from character.durability import decay_all_equipment, decay_equipment, repair_inventory
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import InventoryItem, SlotChoices
+
+
+class DurabilityTest(TestCase):
+    """Teste Abnutzung und Reparatur."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter mit ausgerüstetem Schwert und einem Trank im Rucksack."""
+        self.character = CharacterFactory()
+        self.sword = InventoryItemFactory(
+            character=self.character,
+            item=ItemFactory(slot=SlotChoices.WEAPON, max_durability=10, is_repairable=True, value=3),
+        )
+        self.potion = InventoryItemFactory(character=self.character, item=ItemFactory(max_durability=10))
+        self.character.equip(self.sword)
+
+    def durability(self, inventory_item: InventoryItem) -> "int | None":
+        """Lade die aktuelle Haltbarkeit aus der Datenbank."""
+        return InventoryItem.objects.values_list("current_durability", flat=True).get(pk=inventory_item.pk)
+
+    def test_decay_only_equipped(self) -> None:
+        """Teste, ob nur ausgerüstete Items abgenutzt werden."""
+        with self.assertNumQueries(1):
+            self.assertEqual(decay_equipment(self.character.pk, 3), 1)
+        self.assertEqual(self.durability(self.sword), 7)
+        self.assertIsNone(self.durability(self.potion))
+
+    def test_decay_stops_at_zero(self) -> None:
+        """Teste, ob die Haltbarkeit nicht negativ wird."""
+        decay_equipment(self.character.pk, 25)
+        self.assertEqual(self.durability(self.sword), 0)
+
+    def test_repair(self) -> None:
+        """Teste, ob reparierbare Items wieder voll hergestellt werden."""
+        decay_equipment(self.character.pk, 5)
+        InventoryItem.objects.filter(pk=self.potion.pk).update(current_durability=1)
+
+        self.character.gold = 20
+        self.character.save()
+
+        self.assertEqual(repair_inventory(self.character.pk), (1, 15))
+        self.assertIsNone(self.durability(self.sword))
+        self.assertEqual(self.durability(self.potion), 1)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.gold, 5)
+
+    def test_repair_without_enough_gold(self) -> None:
+        """Teste, ob eine Reparatur ohne ausreichend Gold nichts verändert."""
+        decay_equipment(self.character.pk, 5)
+        self.character.gold = 14
+        self.character.save()
+
+        with self.assertRaisesMessage(ValueError, "Not enough gold"):
+            repair_inventory(self.character.pk)
+        self.assertEqual(self.durability(self.sword), 5)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.gold, 14)
+
+    def test_quest_completion_decays_equipment(self) -> None:
+        """Teste, ob ein Questabschluss die Ausrüstung abnutzt."""
+        character_quest = CharacterQuestFactory(character=self.character, quest=QuestFactory(), status="accepted")
+        complete_quest(character_quest.pk)
+        self.assertEqual(self.durability(self.sword), 9)
+
+    def test_decay_all_in_chunks(self) -> None:
+        """Teste die Abnutzung aller Charaktere in kleinen Id-Bereichen."""
+        other = CharacterFactory()
+        ring = InventoryItemFactory(character=other, item=ItemFactory(slot=SlotChoices.RING, max_durability=50))
+        other.equip(ring)
+
+        rows, _ = decay_all_equipment(amount=2, chunk_size=1)
+        self.assertEqual(rows, 2)
+        self.assertEqual(self.durability(self.sword), 8)
+        self.assertEqual(self.durability(ring), 48)
+
+    def test_command(self) -> None:
+        """Teste den Management-Befehl."""
+        call_command("decay_durability", amount=4, verbosity=0)
+        self.assertEqual(self.durability(self.sword), 6)
@@ -0,0 +1,136 @@
+"""Tests for equipping items and the cached effective stats of characters."""
+
+import pytest
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import (
+    CARRY_WEIGHT_PER_STRENGTH,
+    HITPOINTS_PER_CONSTITUTION,
+    Character,
+    Equipment,
+    SlotChoices,
+)
+
+
+class EquipmentTest(TestCase):
+    """Teste equip/unequip und die fortgeschriebenen Boni."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter mit Helm und Schwert im Inventar."""
+        self.character = CharacterFactory(level=5)
+        self.helmet = InventoryItemFactory(
+            character=self.character,
+            item=ItemFactory(slot=SlotChoices.HEAD, constitution_bonus=2, hitpoints_bonus=10),
+        )
+        self.sword = InventoryItemFactory(
+            character=self.character,
+            item=ItemFactory(slot=SlotChoices.WEAPON, strength_bonus=4, required_level=5),
+        )
+
+    def test_equip_adds_bonus(self) -> None:
+        """Teste, ob die Boni aller ausgerüsteten Items summiert werden."""
+        self.character.equip(self.helmet)
+        self.character.equip(self.sword)
+
+        character = Character.objects.get(pk=self.character.pk)
+        self.assertEqual(character.equipment_bonus, {"constitution": 2, "hitpoints": 10, "strength": 4})
+        stats = character.effective_stats
+        self.assertEqual(stats["strength"], character.strength + 4)
+        self.assertEqual(stats["hitpoints_max"], character.hitpoints_max + 10 + 2 * HITPOINTS_PER_CONSTITUTION)
+        self.assertEqual(stats["max_carry_weight"], character.max_carry_weight + 4 * CARRY_WEIGHT_PER_STRENGTH)
+
+    def test_effective_stats_without_queries(self) -> None:
+        """Teste, ob das Lesen der Werte keine Abfragen auslöst."""
+        self.character.equip(self.helmet)
+        character = Character.objects.get(pk=self.character.pk)
+        with self.assertNumQueries(0):
+            _ = character.effective_stats
+
+    def test_equip_replaces_item_in_slot(self) -> None:
+        """Teste, ob ein belegter Slot beim Ausrüsten geleert wird."""
+        self.character.equip(self.helmet)
+        hood = InventoryItemFactory(character=self.character, item=ItemFactory(slot=SlotChoices.HEAD, wisdom_bonus=1))
+        self.character.equip(hood)
+
+        self.assertEqual(Equipment.objects.get(character=self.character).inventory_item, hood)
+        self.assertEqual(self.character.equipment_bonus, {"wisdom": 1})
+
+    def test_unequip_removes_bonus(self) -> None:
+        """Teste, ob das Ablegen die Boni wieder abzieht."""
+        self.character.equip(self.helmet)
+        self.character.unequip(SlotChoices.HEAD)
+
+        self.assertFalse(Equipment.objects.exists())
+        self.assertEqual(Character.objects.get(pk=self.character.pk).equipment_bonus, {})
+
+    def test_requirements(self) -> None:
+        """Teste Slot, Level und Besitzer."""
+        potion = InventoryItemFactory(character=self.character, item=ItemFactory(slot=SlotChoices.NONE))
+        with self.assertRaisesMessage(ValueError, "cannot be equipped"):
+            self.character.equip(potion)
+        self.character.level = 1
+        with self.assertRaisesMessage(ValueError, "Level too low"):
+            self.character.equip(self.sword)
+        with self.assertRaisesMessage(ValueError, "not in the inventory"):
+            CharacterFactory().equip(self.helmet)
+
+    def test_one_item_per_slot_constraint(self) -> None:
+        """Teste die Unique-Constraint pro Slot."""
+        Equipment.objects.create(character=self.character, slot=SlotChoices.HEAD, inventory_item=self.helmet)
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Equipment.objects.create(character=self.character, slot=SlotChoices.HEAD, inventory_item=self.sword)
+
+    def test_remove_item_skips_equipped_stack(self) -> None:
+        """Teste, ob ausgerüstete Stacks nicht entfernt werden."""
+        self.character.equip(self.helmet)
+        with self.assertRaisesMessage(ValueError, "Item not found"):
+            self.character.remove_item_from_inventory(self.helmet.item)
+
+    def test_item_change_recalculates_bonus(self) -> None:
+        """Teste, ob geänderte Item-Boni bei den Trägern nachgeführt werden."""
+        self.character.equip(self.helmet)
+        item = self.helmet.item
+        item.constitution_bonus = 5
+        item.save()
+
+        self.assertEqual(Character.objects.get(pk=self.character.pk).equipment_bonus["constitution"], 5)
+
+
+class EquipmentViewTest(APITestCase):
+    """Teste die equip- und unequip-Endpunkte."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Charakter mit einem Helm."""
+        cache.clear()
+        self.character = CharacterFactory()
+        self.helmet = InventoryItemFactory(
+            character=self.character, item=ItemFactory(slot=SlotChoices.HEAD, strength_bonus=3),
+        )
+        token = ChoreQuestRefreshToken.for_user(self.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_equip_and_unequip(self) -> None:
+        """Teste, ob die Antwort die effektiven Werte enthält."""
+        url = f"/api/characters/{self.character.pk}/"
+        # Die Payload-Invalidierung läuft erst nach dem Commit
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"{url}equip/", {"inventory_item": self.helmet.pk}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["effective_stats"]["strength"], self.character.strength + 3)
+        self.assertEqual(response.data["equipment"], [{"slot": "head", "inventory_item": self.helmet.pk}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"{url}unequip/", {"slot": "head"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["effective_stats"]["strength"], self.character.strength)
+
+    def test_unequip_empty_slot(self) -> None:
+        """Teste, ob ein leerer Slot mit 400 beantwortet wird."""
+        response = self.client.post(f"/api/characters/{self.character.pk}/unequip/", {"slot": "ring"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,199 @@
+"""Tests for the change events of characters and their server-sent event stream."""
+
+import asyncio
+import contextlib
+import json
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from chorequest.events import HEARTBEAT, broker
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from household.factories import HouseholdMembershipFactory
+from household.services import assign_quest
+from quest.factories import CharacterQuestFactory, QuestFactory
+from user.tokens import ChoreQuestRefreshToken
+
+from character.events import character_channel
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.trading import transfer_items
+from character.vendor import sell_items
+
+
+def parse(message: bytes) -> tuple[str, dict]:
+    """Zerlege eine SSE-Nachricht in Event-Typ und Daten."""
+    fields = dict(line.split(": ", 1) for line in message.decode().strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+class CharacterEventTest(TestCase):
+    """Teste, welche Events Änderungen an Charakter, Inventar und Quests auslösen."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter und eine Event-Loop für die Subscriptions."""
+        cache.clear()
+        self.character = CharacterFactory()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.subscription = self.subscribe(self.character)
+
+    def subscribe(self, character: object) -> object:
+        """Abonniere die Events eines Charakters."""
+
+        async def subscribe() -> object:
+            return broker.subscribe(character_channel(character.pk))
+
+        subscription = self.loop.run_until_complete(subscribe())
+        self.addCleanup(broker.unsubscribe, subscription)
+        return subscription
+
+    def events(self, subscription: "object | None" = None) -> list[tuple[str, dict]]:
+        """Gib alle bereits zugestellten Events zurück."""
+        subscription = subscription or self.subscription
+        self.loop.run_until_complete(asyncio.sleep(0))
+        return [parse(message) for message in subscription.messages]
+
+    def test_nothing_before_commit(self) -> None:
+        """Teste, ob Events erst nach dem Commit verschickt werden."""
+        self.character.save()
+
+        self.assertEqual(self.events(), [])
+
+    def test_character_and_quest_changes(self) -> None:
+        """Teste die Events für Erfahrung, Level und Questfortschritt."""
+        character_quest = CharacterQuestFactory(character=self.character, status="accepted", progress=10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.add_experience(150)
+            self.character.save()
+            character_quest.progress = 60
+            character_quest.save()
+
+        # Der Levelaufstieg speichert selbst, die Events folgen der Reihenfolge der Saves
+        *_, (kind, state), (quest_kind, quest) = self.events()
+        self.assertEqual((kind, state["level"], state["experience_points"]), ("character", 2, 50))
+        self.assertEqual(quest_kind, "quest")
+        self.assertEqual(quest, {"id": character_quest.pk, "quest": character_quest.quest_id,
+                                 "status": "accepted", "progress": 60})
+
+    def test_inventory_changes(self) -> None:
+        """Teste die Events für geänderte und gelöschte Stacks."""
+        with self.captureOnCommitCallbacks(execute=True):
+            stack = InventoryItemFactory(character=self.character, quantity=3)
+            stack_id = stack.pk
+            stack.delete()
+
+        self.assertEqual(self.events(), [
+            ("inventory", {"stacks": [{"id": stack_id, "item": stack.item_id, "quantity": 3,
+                                       "current_durability": None}], "removed": []}),
+            ("inventory", {"stacks": [], "removed": [stack_id]}),
+        ])
+
+    def test_trade_publishes_both_inventories(self) -> None:
+        """Teste, ob ein Trade die Stacks von Sender und Empfänger meldet."""
+        receiver = CharacterFactory(max_carry_weight=1000)
+        membership = HouseholdMembershipFactory(user=self.character.user)
+        HouseholdMembershipFactory(household=membership.household, user=receiver.user)
+        receiver_subscription = self.subscribe(receiver)
+        arrows = ItemFactory(stacksize=20, weight=1)
+        given = InventoryItemFactory(character=self.character, item=arrows, quantity=5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transfer_items(self.character.pk, receiver.pk, [(arrows.pk, 5)])
+
+        self.assertEqual(self.events(), [("inventory", {"stacks": [], "removed": [given.pk]})])
+        [(kind, data)] = self.events(receiver_subscription)
+        self.assertEqual((kind, data["stacks"][0]["item"], data["stacks"][0]["quantity"]), ("inventory", arrows.pk, 5))
+
+    def test_set_based_writes_request_resync(self) -> None:
+        """Teste, ob Verkäufe ohne Zeilendaten ein resync auslösen."""
+        stack = InventoryItemFactory(character=self.character, quantity=2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            sell_items(self.character.pk, item_ids=[stack.item_id])
+
+        self.assertEqual(self.events(), [("resync", {})])
+
+    def test_household_assignment(self) -> None:
+        """Teste, ob eine Haushaltszuweisung jedem Charakter ein Quest-Event schickt."""
+        membership = HouseholdMembershipFactory(user=self.character.user)
+        quest = QuestFactory()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_quest(membership.household_id, quest.pk)
+
+        self.assertEqual(self.events(), [("quest", {"quest": quest.pk, "status": "open", "progress": 0})])
+
+
+class CharacterStreamViewTest(TestCase):
+    """Teste den SSE-Endpunkt eines Charakters."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter und ein Access Token seines Besitzers."""
+        cache.clear()
+        self.character = CharacterFactory(level=3)
+        self.token = str(ChoreQuestRefreshToken.for_user(self.character.user).access_token)
+
+    def url(self, character: object) -> str:
+        """Gib die Stream-URL eines Charakters zurück."""
+        return f"/api/characters/{character.pk}/events/"
+
+    async def test_stream(self) -> None:
+        """Teste Anfangszustand, zugestellte Events und das Ende der Subscription."""
+        response = await self.async_client.get(
+            self.url(self.character), headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content.__aiter__()
+
+        first = await stream.__anext__()
+        self.assertTrue(first.startswith(b"retry: "))
+        kind, state = parse(first.split(b"\n\n", 1)[1])
+        self.assertEqual((kind, state["level"]), ("character", 3))
+
+        broker.publish(character_channel(self.character.pk), {"type": "quest", "data": {"quest": 1}})
+        self.assertEqual(parse(await stream.__anext__()), ("quest", {"quest": 1}))
+
+        # Trennt der Client die Verbindung, bricht der ASGI-Handler das Lesen ab
+        count = broker.subscriber_count()
+        reading = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        reading.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reading
+        self.assertEqual(broker.subscriber_count(), count - 1)
+
+    @override_settings(EVENTS_HEARTBEAT_INTERVAL=0.01)
+    async def test_heartbeat_and_query_token(self) -> None:
+        """Teste den Heartbeat ohne Events und die Anmeldung über den Query-Parameter."""
+        response = await self.async_client.get(self.url(self.character), {"token": self.token})
+        stream = response.streaming_content.__aiter__()
+        await stream.__anext__()
+
+        self.assertEqual(await stream.__anext__(), HEARTBEAT)
+        await stream.aclose()
+
+    async def test_requires_token(self) -> None:
+        """Teste, ob ohne oder mit ungültigem Token kein Stream geöffnet wird."""
+        self.assertEqual((await self.async_client.get(self.url(self.character))).status_code, 401)
+        response = await self.async_client.get(self.url(self.character), {"token": "invalid"})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_foreign_character(self) -> None:
+        """Teste, ob fremde Charaktere nicht abonniert werden können."""
+        other = await sync_to_async(CharacterFactory)()
+        count = broker.subscriber_count()
+
+        response = await self.async_client.get(self.url(other), headers={"Authorization": f"Bearer {self.token}"})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(broker.subscriber_count(), count)
+
+    def test_benchmark_command(self) -> None:
+        """Teste den Benchmark mit wenigen Streams."""
+        out = StringIO()
+        call_command("benchmark_event_streams", connections=50, stdout=out)
+
+        self.assertIn("50 idle streams", out.getvalue())
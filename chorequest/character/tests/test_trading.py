@@ -0,0 +1,220 @@
+"""Tests for the atomic item transfer between characters."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from household.factories import HouseholdFactory, HouseholdMembershipFactory
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import InventoryItem, SlotChoices
+from character.trading import transfer_items
+
+
+def quantities(character: object, item: object) -> list[int]:
+    """Lade die Stackgrößen eines Items absteigend."""
+    return sorted(
+        InventoryItem.objects.filter(character=character, item=item).values_list("quantity", flat=True),
+        reverse=True,
+    )
+
+
+def share_household(*characters: object) -> None:
+    """Mache die Besitzer der Charaktere zu Mitgliedern eines gemeinsamen Haushalts."""
+    household = HouseholdFactory()
+    for character in characters:
+        HouseholdMembershipFactory(household=household, user=character.user)
+
+
+class TransferTest(TestCase):
+    """Teste die Übergabe von Items."""
+
+    def setUp(self) -> None:
+        """Erstelle zwei Charaktere, der erste besitzt Pfeile und Tränke."""
+        self.alice = CharacterFactory()
+        self.bob = CharacterFactory(max_carry_weight=1000)
+        share_household(self.alice, self.bob)
+        self.arrows = ItemFactory(stacksize=20, weight=1)
+        self.potion = ItemFactory(stacksize=5, weight=1)
+        for quantity in (20, 8, 3):
+            InventoryItemFactory(character=self.alice, item=self.arrows, quantity=quantity)
+        InventoryItemFactory(character=self.alice, item=self.potion, quantity=5)
+        InventoryItemFactory(character=self.bob, item=self.arrows, quantity=15)
+
+    def test_moves_many_items(self) -> None:
+        """Teste, ob kleine Stacks zuerst abgegeben und beim Empfänger aufgefüllt werden."""
+        moved = transfer_items(self.alice.pk, self.bob.pk, [(self.arrows.pk, 10), (self.potion.pk, 2)])
+
+        self.assertEqual(moved, {self.arrows.pk: 10, self.potion.pk: 2})
+        self.assertEqual(quantities(self.alice, self.arrows), [20, 1])
+        self.assertEqual(quantities(self.bob, self.arrows), [20, 5])
+        self.assertEqual(quantities(self.alice, self.potion), [3])
+        self.assertEqual(quantities(self.bob, self.potion), [2])
+
+    def test_constant_queries(self) -> None:
+        """Teste, ob die Zahl der Queries nicht von der Zahl der Items abhängt."""
+        items = [(self.arrows.pk, 31), (self.potion.pk, 5)]
+
+        # SAVEPOINT, Sperre, Haushalt, Sperre, Auslastung, UPDATE, INSERT, DELETE, RELEASE
+        with self.assertNumQueries(9):
+            transfer_items(self.alice.pk, self.bob.pk, items)
+
+        self.assertFalse(InventoryItem.objects.filter(character=self.alice).exists())
+        self.assertEqual(quantities(self.bob, self.arrows), [20, 20, 6])
+
+    def test_missing_items_change_nothing(self) -> None:
+        """Teste, ob ein unvollständiger Trade nichts verändert."""
+        with self.assertRaisesMessage(ValueError, "Not enough items to trade."):
+            transfer_items(self.alice.pk, self.bob.pk, [(self.arrows.pk, 10), (self.potion.pk, 6)])
+
+        self.assertEqual(quantities(self.alice, self.arrows), [20, 8, 3])
+        self.assertEqual(quantities(self.bob, self.arrows), [15])
+
+    def test_capacity_is_checked(self) -> None:
+        """Teste Slot- und Gewichtsgrenze des Empfängers."""
+        self.bob.max_inventory_slots = 2
+        self.bob.save()
+        with self.assertRaisesMessage(ValueError, "Not enough space"):
+            transfer_items(self.alice.pk, self.bob.pk, [(self.arrows.pk, 26)])
+
+        self.bob.max_inventory_slots = 10
+        self.bob.max_carry_weight = 20
+        self.bob.save()
+        with self.assertRaisesMessage(ValueError, "Not enough space"):
+            transfer_items(self.alice.pk, self.bob.pk, [(self.arrows.pk, 6)])
+
+    def test_equipped_and_damaged_stacks(self) -> None:
+        """Teste, ob ausgerüstete Stacks bleiben und die Haltbarkeit erhalten wird."""
+        ring = ItemFactory(slot=SlotChoices.RING, stacksize=10, weight=1)
+        worn = InventoryItemFactory(character=self.alice, item=ring, quantity=1)
+        InventoryItemFactory(character=self.alice, item=ring, quantity=1, current_durability=4)
+        self.alice.equip(worn)
+
+        with self.assertRaisesMessage(ValueError, "Not enough items to trade."):
+            transfer_items(self.alice.pk, self.bob.pk, [(ring.pk, 2)])
+        transfer_items(self.alice.pk, self.bob.pk, [(ring.pk, 1)])
+
+        self.assertEqual(list(InventoryItem.objects.filter(character=self.bob, item=ring).values_list(
+            "quantity", "current_durability")), [(1, 4)])
+        self.assertTrue(InventoryItem.objects.filter(pk=worn.pk, character=self.alice).exists())
+
+    def test_invalid_trades(self) -> None:
+        """Teste Trades mit sich selbst und ungültige Mengen."""
+        with self.assertRaisesMessage(ValueError, "same character"):
+            transfer_items(self.alice.pk, self.alice.pk, [(self.arrows.pk, 1)])
+        with self.assertRaisesMessage(ValueError, "positive"):
+            transfer_items(self.alice.pk, self.bob.pk, [(self.arrows.pk, 0)])
+
+    def test_requires_shared_household(self) -> None:
+        """Teste, ob Charaktere ohne gemeinsamen Haushalt nicht handeln können."""
+        stranger = CharacterFactory(max_carry_weight=1000)
+        HouseholdMembershipFactory(user=stranger.user)
+
+        with self.assertRaisesMessage(ValueError, "shared household"):
+            transfer_items(self.alice.pk, stranger.pk, [(self.arrows.pk, 1)])
+
+        self.assertEqual(quantities(self.alice, self.arrows), [20, 8, 3])
+        self.assertFalse(InventoryItem.objects.filter(character=stranger).exists())
+
+    def test_own_characters_can_trade(self) -> None:
+        """Teste, ob ein Benutzer zwischen seinen eigenen Charakteren handeln kann."""
+        alt = CharacterFactory(user=self.alice.user, max_carry_weight=1000)
+
+        transfer_items(self.alice.pk, alt.pk, [(self.arrows.pk, 1)])
+
+        self.assertEqual(quantities(alt, self.arrows), [1])
+
+
+class ConcurrentTransferTest(TransactionTestCase):
+    """Teste gegenläufige Trades zwischen denselben Charakteren."""
+
+    def test_opposing_trades(self) -> None:
+        """Teste, ob parallele Trades in beide Richtungen weder blockieren noch Items verlieren."""
+        alice, bob = CharacterFactory(), CharacterFactory()
+        share_household(alice, bob)
+        arrows = ItemFactory(stacksize=20, weight=0)
+        InventoryItemFactory(character=alice, item=arrows, quantity=20)
+        InventoryItemFactory(character=bob, item=arrows, quantity=20)
+
+        def trade(sender: int, receiver: int) -> None:
+            try:
+                done = 0
+                while done < 10:  # noqa: PLR2004
+                    try:
+                        transfer_items(sender, receiver, [(arrows.pk, 1)])
+                        done += 1
+                    except OperationalError as exc:  # noqa: PERF203
+                        # Die In-Memory-Testdatenbank (shared cache) ignoriert den busy timeout
+                        if "locked" not in str(exc):
+                            raise
+                        time.sleep(0.001)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(trade, alice.pk, bob.pk), pool.submit(trade, bob.pk, alice.pk)]
+            for future in futures:
+                future.result(timeout=60)
+
+        self.assertEqual(sum(quantities(alice, arrows)), 20)
+        self.assertEqual(sum(quantities(bob, arrows)), 20)
+
+
+class TradeViewTest(APITestCase):
+    """Teste den Endpunkt für Trades."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Benutzer mit Tränken und einen Empfänger."""
+        cache.clear()
+        self.character = CharacterFactory()
+        self.receiver = CharacterFactory()
+        share_household(self.character, self.receiver)
+        self.potion = ItemFactory(stacksize=10, weight=1)
+        InventoryItemFactory(character=self.character, item=self.potion, quantity=6)
+        token = ChoreQuestRefreshToken.for_user(self.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def url(self, character: object) -> str:
+        """Gib die Trade-URL eines Charakters zurück."""
+        return f"/api/characters/{character.pk}/trade/"
+
+    def test_trade(self) -> None:
+        """Teste einen erfolgreichen Trade."""
+        payload = {"to": self.receiver.pk, "items": [{"item": self.potion.pk, "quantity": 4}]}
+
+        response = self.client.post(self.url(self.character), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["items"], [{"item": self.potion.pk, "quantity": 4}])
+        self.assertEqual(quantities(self.receiver, self.potion), [4])
+
+    def test_not_enough_items(self) -> None:
+        """Teste, ob ein fehlgeschlagener Trade 400 liefert."""
+        payload = {"to": self.receiver.pk, "items": [{"item": self.potion.pk, "quantity": 7}]}
+
+        response = self.client.post(self.url(self.character), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(quantities(self.character, self.potion), [6])
+
+    def test_receiver_outside_household(self) -> None:
+        """Teste, ob Trades an Charaktere außerhalb der eigenen Haushalte mit 400 abgelehnt werden."""
+        payload = {"to": CharacterFactory().pk, "items": [{"item": self.potion.pk, "quantity": 1}]}
+
+        response = self.client.post(self.url(self.character), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(quantities(self.character, self.potion), [6])
+
+    def test_foreign_sender(self) -> None:
+        """Teste, ob nur aus eigenen Charakteren gegeben werden kann."""
+        payload = {"to": self.character.pk, "items": [{"item": self.potion.pk, "quantity": 1}]}
+
+        response = self.client.post(self.url(self.receiver), payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,107 @@
+"""Tests for selling inventory stacks to the vendor."""
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import Character, InventoryItem, SlotChoices
+from character.vendor import sell_items
+
+
+class SellItemsTest(TestCase):
+    """Teste den mengenbasierten Verkauf."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Charakter mit Schrott, Tränken und einem ausgerüsteten Schrotthelm."""
+        self.character = CharacterFactory(gold=5)
+        self.bones = ItemFactory(name="Bones", rarity="trash", item_type="consumable", value=2)
+        self.rags = ItemFactory(name="Rags", rarity="trash", item_type="equipment", value=3)
+        self.potion = ItemFactory(name="Potion", rarity="common", item_type="consumable", value=10)
+        self.helmet = ItemFactory(name="Rusty Helmet", rarity="trash", slot=SlotChoices.HEAD, value=50)
+        for quantity in (4, 6):
+            InventoryItemFactory(character=self.character, item=self.bones, quantity=quantity)
+        InventoryItemFactory(character=self.character, item=self.rags, quantity=1)
+        InventoryItemFactory(character=self.character, item=self.potion, quantity=3)
+        self.character.equip(InventoryItemFactory(character=self.character, item=self.helmet))
+
+    def test_sell_trash(self) -> None:
+        """Teste, ob aller Schrott außer der Ausrüstung verkauft und bezahlt wird."""
+        receipt = sell_items(self.character.pk, rarities=["trash"])
+
+        self.assertEqual(receipt["lines"], [
+            {"item": self.bones.pk, "name": "Bones", "price": 2, "quantity": 10, "gold": 20},
+            {"item": self.rags.pk, "name": "Rags", "price": 3, "quantity": 1, "gold": 3},
+        ])
+        self.assertEqual((receipt["stacks"], receipt["quantity"], receipt["gold"]), (3, 11, 23))
+        self.assertEqual(receipt["balance"], 28)
+        self.assertEqual(Character.objects.get(pk=self.character.pk).gold, 28)
+        self.assertEqual(
+            sorted(InventoryItem.objects.filter(character=self.character).values_list("item__name", flat=True)),
+            ["Potion", "Rusty Helmet"],
+        )
+
+    def test_constant_queries(self) -> None:
+        """Teste, ob die Zahl der Queries nicht von der Zahl der Stacks abhängt."""
+        for _ in range(20):
+            InventoryItemFactory(character=self.character, item=self.bones, quantity=1)
+
+        # SAVEPOINT, Sperre, Quittung, DELETE, Gold-UPDATE, RELEASE
+        with self.assertNumQueries(6):
+            receipt = sell_items(self.character.pk, rarities=["trash"], item_types=["consumable"])
+
+        self.assertEqual(receipt["quantity"], 30)
+
+    def test_filters_combine(self) -> None:
+        """Teste, ob alle Filter gemeinsam gelten."""
+        receipt = sell_items(self.character.pk, item_types=["consumable"], item_ids=[self.potion.pk])
+
+        self.assertEqual(receipt["gold"], 30)
+        self.assertFalse(InventoryItem.objects.filter(item=self.potion).exists())
+        self.assertTrue(InventoryItem.objects.filter(item=self.bones).exists())
+
+    def test_nothing_matches(self) -> None:
+        """Teste einen Verkauf ohne Treffer und ohne Filter."""
+        receipt = sell_items(self.character.pk, rarities=["legendary"])
+
+        self.assertEqual((receipt["lines"], receipt["gold"], receipt["balance"]), ([], 0, 5))
+        with self.assertRaisesMessage(ValueError, "At least one filter"):
+            sell_items(self.character.pk)
+
+
+class SellViewTest(APITestCase):
+    """Teste den Endpunkt für den Händler."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Benutzer mit Schrott im Inventar."""
+        cache.clear()
+        self.character = CharacterFactory()
+        InventoryItemFactory(character=self.character, item=ItemFactory(rarity="trash", value=4), quantity=5)
+        token = ChoreQuestRefreshToken.for_user(self.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_sell(self) -> None:
+        """Teste den Verkauf und den neuen Kontostand im Charakter."""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/api/characters/{self.character.pk}/sell/", {"rarity": ["trash"]},
+                                        format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["gold"], response.data["balance"]), (20, 20))
+        character = self.client.get(f"/api/characters/{self.character.pk}/").data
+        self.assertEqual((character["gold"], character["inventory"]), (20, []))
+
+    def test_filter_required(self) -> None:
+        """Teste, ob ein Verkauf ohne Filter abgelehnt wird."""
+        response = self.client.post(f"/api/characters/{self.character.pk}/sell/", {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_gold_is_read_only(self) -> None:
+        """Teste, ob Gold nicht über die API gesetzt werden kann."""
+        self.client.patch(f"/api/characters/{self.character.pk}/", {"gold": 9999, "level": 1, "experience_points": 0},
+                          format="json")
+
+        self.assertEqual(Character.objects.get(pk=self.character.pk).gold, 0)
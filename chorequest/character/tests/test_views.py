@@ -1,11 +1,14 @@
 """Module containing tests for the CharacterViewSet."""
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 from user.models import UserAccount
+from user.tokens import ChoreQuestRefreshToken
 
-from character.models import Character
+from character.models import Character, InventoryItem, Item
 
 
 class CharacterViewSetTest(APITestCase):
@@ -13,6 +16,8 @@ class CharacterViewSetTest(APITestCase):
 
     def setUp(self) -> None:
         """Setze die Testdaten."""
+        # Gecachte Payloads früherer Tests können dieselben Charakter-IDs tragen
+        cache.clear()
         UserAccount.objects.all().delete()
         Character.objects.all().delete()
 
@@ -165,3 +170,86 @@ class CharacterViewSetTest(APITestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(BENCHMARK_ENDPOINTS=True)
+    def test_grant_item(self) -> None:
+        """Teste, ob ein Item dem eigenen Charakter hinzugefügt werden kann."""
+        item = Item.objects.create(name="Potion", stacksize=10)
+        response = self.client.post(
+            f"/api/characters/{self.character1.id}/inventory/",
+            {"item": item.id, "quantity": 3},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["inventory"][0]["quantity"], 3)
+        self.assertEqual(self.character1.inventory.get().quantity, 3)
+
+    @override_settings(BENCHMARK_ENDPOINTS=True)
+    def test_grant_item_without_space(self) -> None:
+        """Teste, ob ein volles Inventar mit 400 abgelehnt wird."""
+        item = Item.objects.create(name="Anvil", weight=40)
+        response = self.client.post(
+            f"/api/characters/{self.character1.id}/inventory/",
+            {"item": item.id, "quantity": 2},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(self.character1.inventory.exists())
+
+    @override_settings(BENCHMARK_ENDPOINTS=True)
+    def test_grant_item_to_other_users_character(self) -> None:
+        """Teste, ob fremden Charakteren keine Items hinzugefügt werden können."""
+        item = Item.objects.create(name="Potion")
+        response = self.client.post(
+            f"/api/characters/{self.character2.id}/inventory/",
+            {"item": item.id},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_repair_costs_gold(self) -> None:
+        """Teste, ob eine Reparatur Gold kostet und ohne genug Gold mit 400 abgelehnt wird."""
+        item = Item.objects.create(name="Shield", max_durability=10, is_repairable=True, value=2)
+        InventoryItem.objects.create(character=self.character1, item=item, current_durability=4)
+        url = f"/api/characters/{self.character1.id}/repair/"
+
+        response = self.client.post(url, HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        Character.objects.filter(pk=self.character1.pk).update(gold=20)
+        response = self.client.post(url, HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        self.assertEqual(response.data, {"repaired": 1, "cost": 12})
+        self.assertEqual(Character.objects.get(pk=self.character1.pk).gold, 8)
+
+    def test_grant_item_requires_staff(self) -> None:
+        """Teste, ob normale Spieler ohne Benchmark-Modus keine Items vergeben können."""
+        item = Item.objects.create(name="Potion")
+        response = self.client.post(
+            f"/api/characters/{self.character1.id}/inventory/",
+            {"item": item.id},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {self.access_token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(self.character1.inventory.exists())
+
+    def test_grant_item_as_staff(self) -> None:
+        """Teste, ob Staff-Benutzer Items vergeben können."""
+        self.user1.is_staff = True
+        self.user1.save()
+        item = Item.objects.create(name="Potion")
+        response = self.client.post(
+            f"/api/characters/{self.character1.id}/inventory/",
+            {"item": item.id},
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {ChoreQuestRefreshToken.for_user(self.user1).access_token}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -0,0 +1,177 @@
+"""
+Atomic item transfers between two characters.
+
+:func:`transfer_items` moves any number of ``(item, quantity)`` pairs in one
+transaction with a constant number of queries:
+
+1. both characters are locked in primary key order, so two opposing trades
+   between the same pair queue up instead of deadlocking, and their owners
+   must be the same account or share a household,
+2. the affected, unequipped stacks of both characters are loaded and locked
+   in one query,
+3. slots and carry weight of the receiver are checked once for the whole
+   trade,
+4. the stacks are written back with one ``bulk_update``, one ``bulk_create``
+   and one ``DELETE``.
+
+The sender gives its smallest stacks first; the receiver's partially filled
+stacks of the same item and durability are topped up before new stacks are
+created.  Equipped stacks are never traded.
+"""
+
+from collections import Counter, defaultdict
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from chorequest.db import delete_rows
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Sum
+from household.models import HouseholdMembership
+
+from .cache import invalidate_character_payloads
+from .events import publish_inventory, stack_state
+from .models import Character, InventoryItem
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def _receiver_load(character_id: int) -> tuple[int, Decimal]:
+    """Return the number of stacks and the carried weight of a character."""
+    load = InventoryItem.objects.filter(character_id=character_id).aggregate(
+        stacks=Count("id"),
+        weight=Sum(F("quantity") * F("item__weight"), output_field=DecimalField()),
+    )
+    return load["stacks"], Decimal(load["weight"] or 0)
+
+
+def _check_owners(sender: Character, receiver: Character) -> None:
+    """Raise ``ValueError`` unless both characters belong to one account or to members of a common household."""
+    if sender.user_id == receiver.user_id:
+        return
+    if not HouseholdMembership.objects.filter(
+        user_id=sender.user_id, household__memberships__user_id=receiver.user_id,
+    ).exists():
+        msg = "Characters can only trade within a shared household."
+        raise ValueError(msg)
+
+
+def transfer_items(sender_id: int, receiver_id: int, items: "Iterable[tuple[int, int]]") -> dict[int, int]:
+    """
+    Move ``items`` (pairs of item id and quantity) from one character to another.
+
+    Raises ``ValueError`` if the owners share no household, the sender lacks
+    an item or the receiver lacks slots or carry capacity; nothing is written
+    in that case.  Returns the
+    moved quantity per item id.
+    """
+    wanted: Counter[int] = Counter()
+    for item_id, quantity in items:
+        if quantity < 1:
+            msg = "Quantity must be positive."
+            raise ValueError(msg)
+        wanted[item_id] += quantity
+    if sender_id == receiver_id:
+        msg = "Cannot trade with the same character."
+        raise ValueError(msg)
+    if not wanted:
+        return {}
+
+    with transaction.atomic():
+        # Feste Sperrreihenfolge: gegenläufige Trades warten aufeinander statt sich zu blockieren
+        locked = Character.objects.select_for_update().filter(pk__in=[sender_id, receiver_id]).order_by("pk")
+        characters = {character.pk: character for character in locked}
+        if len(characters) != 2:  # noqa: PLR2004
+            msg = "Character not found."
+            raise ValueError(msg)
+        receiver = characters[receiver_id]
+        _check_owners(characters[sender_id], receiver)
+        stacks = list(
+            InventoryItem.objects.select_for_update(of=("self",))
+            .filter(character_id__in=[sender_id, receiver_id], item_id__in=list(wanted), equipped__isnull=True)
+            .select_related("item")
+            .order_by("quantity", "pk"),
+        )
+        updates, creates, deletes, moved_weight = _plan(sender_id, receiver_id, wanted, stacks)
+
+        stack_count, weight = _receiver_load(receiver_id)
+        if (
+            stack_count + len(creates) > receiver.max_inventory_slots
+            or weight + moved_weight > Decimal(receiver.effective_stats["max_carry_weight"])
+        ):
+            msg = "Not enough space or weight capacity in inventory."
+            raise ValueError(msg)
+
+        if updates:
+            InventoryItem.objects.bulk_update(updates, ["quantity"])
+        if creates:
+            InventoryItem.objects.bulk_create(creates)
+        if deletes:
+            delete_rows(InventoryItem.objects.filter(pk__in=deletes))
+        _publish(sender_id, receiver_id, updates + creates, deletes)
+    invalidate_character_payloads([sender_id, receiver_id])
+    return dict(wanted)
+
+
+def _publish(sender_id: int, receiver_id: int, changed: list[InventoryItem], deletes: list[int]) -> None:
+    """Publish the changed stacks of both characters and the removed stacks of the sender."""
+    for character_id in (sender_id, receiver_id):
+        publish_inventory(
+            character_id,
+            stacks=[stack_state(stack) for stack in changed if stack.character_id == character_id],
+            removed=deletes if character_id == sender_id else (),
+        )
+
+
+def _moved(stacks: list[InventoryItem], wanted: Counter[int], sender_id: int) -> "Iterable[tuple[InventoryItem, int]]":
+    """Yield the sender stacks with the quantity taken from each, smallest stacks first."""
+    remaining = Counter(wanted)
+    for stack in stacks:
+        if stack.character_id != sender_id or not remaining[stack.item_id]:
+            continue
+        taken = min(stack.quantity, remaining[stack.item_id])
+        remaining[stack.item_id] -= taken
+        yield stack, taken
+    if +remaining:
+        msg = "Not enough items to trade."
+        raise ValueError(msg)
+
+
+def _plan(
+    sender_id: int, receiver_id: int, wanted: Counter[int], stacks: list[InventoryItem],
+) -> tuple[list[InventoryItem], list[InventoryItem], list[int], Decimal]:
+    """Return the stacks to update, to create, the ids to delete and the moved weight of the transfer."""
+    updates, creates, deletes = [], [], []
+    moved_weight = Decimal(0)
+    incoming: dict[tuple[int, int | None], int] = defaultdict(int)
+    for stack, taken in _moved(stacks, wanted, sender_id):
+        incoming[stack.item_id, stack.current_durability] += taken
+        moved_weight += stack.item.weight * taken
+        if taken == stack.quantity:
+            deletes.append(stack.pk)
+        else:
+            stack.quantity -= taken
+            updates.append(stack)
+
+    items = {stack.item_id: stack.item for stack in stacks}
+    for stack in stacks:
+        key = (stack.item_id, stack.current_durability)
+        if stack.character_id != receiver_id or not incoming.get(key):
+            continue
+        added = min(max(stack.item.stacksize - stack.quantity, 0), incoming[key])
+        if added:
+            stack.quantity += added
+            incoming[key] -= added
+            updates.append(stack)
+    for (item_id, durability), quantity in incoming.items():
+        stacksize = max(items[item_id].stacksize, 1)
+        creates.extend(
+            InventoryItem(
+                character_id=receiver_id,
+                item_id=item_id,
+                quantity=min(stacksize, quantity - offset),
+                current_durability=durability,
+            )
+            for offset in range(0, quantity, stacksize)
+        )
+    return updates, creates, deletes, moved_weight
@@ -3,6 +3,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from .streams import CharacterEventsView
 from .views import CharacterViewSet
 
 # Router für ViewSets erstellen
@@ -11,5 +12,6 @@ router.register(r"characters", CharacterViewSet)
 
 # URLs für die API registrieren
 urlpatterns = [
+    path("api/characters/<int:pk>/events/", CharacterEventsView.as_view(), name="character-events"),
     path("api/", include(router.urls)),  # Fügt die URLs des Routers hinzu
 ]
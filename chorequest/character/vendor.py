@@ -0,0 +1,99 @@
+"""
+Set-based selling of inventory stacks to the vendor.
+
+:func:`sell_items` sells every unequipped stack of a character that matches
+the filters (rarity, item type, explicit item ids) for ``Item.value`` per
+unit.  The cost does not depend on the number of matching stacks:
+
+1. the character row is locked, the same lock trades take,
+2. the receipt is aggregated per item in SQL,
+3. the stacks are removed with one ``DELETE``,
+4. the gold is credited with one ``UPDATE ... SET gold = gold + <total>``.
+
+The writes bypass the model signals, so the payload cache is invalidated
+explicitly.
+"""
+
+from typing import TYPE_CHECKING
+
+from chorequest.db import delete_rows
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from .cache import invalidate_character_payloads
+from .events import publish_resync
+from .models import Character, InventoryItem
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+
+def sellable_stacks(
+    character_id: int,
+    *,
+    rarities: "Iterable[str] | None" = None,
+    item_types: "Iterable[str] | None" = None,
+    item_ids: "Iterable[int] | None" = None,
+) -> "QuerySet[InventoryItem]":
+    """Return the unequipped stacks of a character matching all given filters."""
+    queryset = InventoryItem.objects.filter(character_id=character_id, equipped__isnull=True)
+    if rarities is not None:
+        queryset = queryset.filter(item__rarity__in=list(rarities))
+    if item_types is not None:
+        queryset = queryset.filter(item__item_type__in=list(item_types))
+    if item_ids is not None:
+        queryset = queryset.filter(item_id__in=list(item_ids))
+    return queryset
+
+
+def sell_items(
+    character_id: int,
+    *,
+    rarities: "Iterable[str] | None" = None,
+    item_types: "Iterable[str] | None" = None,
+    item_ids: "Iterable[int] | None" = None,
+) -> dict:
+    """
+    Sell the matching stacks of a character and return the receipt.
+
+    At least one filter is required, so a request can never sell a whole
+    inventory by accident.  The receipt lists quantity and gold per item
+    plus the totals and the new gold balance.
+    """
+    if rarities is None and item_types is None and item_ids is None:
+        msg = "At least one filter is required."
+        raise ValueError(msg)
+    stacks = sellable_stacks(character_id, rarities=rarities, item_types=item_types, item_ids=item_ids)
+
+    with transaction.atomic():
+        balance = Character.objects.select_for_update().values_list("gold", flat=True).get(pk=character_id)
+        lines = list(
+            stacks.values("item_id", "item__name", "item__value")
+            .annotate(stacks=Count("id"), units=Sum("quantity"), revenue=Sum(F("quantity") * F("item__value")))
+            .order_by("item__name"),
+        )
+        gold = sum(line["revenue"] for line in lines)
+        if lines:
+            delete_rows(stacks)
+            Character.objects.filter(pk=character_id).update(gold=F("gold") + gold)
+            publish_resync([character_id])
+    if lines:
+        invalidate_character_payloads([character_id])
+    return {
+        "lines": [
+            {
+                "item": line["item_id"],
+                "name": line["item__name"],
+                "price": line["item__value"],
+                "quantity": line["units"],
+                "gold": line["revenue"],
+            }
+            for line in lines
+        ],
+        "stacks": sum(line["stacks"] for line in lines),
+        "quantity": sum(line["units"] for line in lines),
+        "gold": gold,
+        "balance": balance + gold,
+    }
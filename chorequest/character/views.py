@@ -2,12 +2,30 @@
 
 from typing import ClassVar
 
+from django.db import transaction
 from django.db.models.query import QuerySet
-from rest_framework import serializers, viewsets
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
+from .cache import get_active_character_id
+from .compaction import compact_inventory
+from .durability import repair_inventory
 from .models import Character
-from .serializers import CharacterSerializer
+from .permissions import CanGrantItems
+from .serializers import (
+    CharacterSerializer,
+    EquipSerializer,
+    InventoryGrantSerializer,
+    SellSerializer,
+    TradeSerializer,
+    UnequipSerializer,
+)
+from .trading import transfer_items
+from .vendor import sell_items
 
 
 class CharacterViewSet(viewsets.ModelViewSet):
@@ -22,8 +40,8 @@ class CharacterViewSet(viewsets.ModelViewSet):
         # Überprüfen, ob der Benutzer im Request vorhanden ist
         user = self.request.user
         if user.is_authenticated:
-            # Benutzer zuweisen
-            serializer.save(user=user)
+            # Benutzer über die ID zuweisen, request.user kann ein Token-User sein
+            serializer.save(user_id=user.pk)
         else:
             msg = "User is not authenticated."
             raise serializers.ValidationError(msg)
@@ -32,5 +50,133 @@ class CharacterViewSet(viewsets.ModelViewSet):
         """Gib nur die Charaktere des aktuellen Benutzers zurück."""
         user = self.request.user
         if user.is_authenticated:
-            return Character.objects.filter(user=user)
+            return Character.objects.filter(user_id=user.pk)
         return Character.objects.none()
+
+    def get_object(self) -> Character:
+        """
+        Gib den Charakter der URL zurück; ``active`` steht für den aktiven Charakter.
+
+        So können Spielaktionen (``/api/characters/active/sell/`` usw.) den
+        handelnden Charakter über den Cache auflösen, statt über den Claim des
+        Tokens, der nach einem Charakterwechsel veraltet ist.
+        """
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        if self.kwargs.get(lookup) == "active":
+            character_id = get_active_character_id(self.request.user.pk)
+            if character_id is None:
+                msg = "No active character."
+                raise NotFound(msg)
+            self.kwargs[lookup] = str(character_id)
+        return super().get_object()
+
+    @action(detail=False, methods=["get"])
+    def active(self, request: Request) -> Response:
+        """
+        Gib den aktiven Charakter des Benutzers zurück.
+
+        Id und Payload kommen aus dem Cache; die Datenbank wird nur bei einem
+        Cache-Miss über den partiellen Index gefragt.
+        """
+        msg = "No active character."
+        character_id = get_active_character_id(request.user.pk)
+        if character_id is None:
+            raise NotFound(msg)
+        try:
+            payload = self.get_serializer().to_cached_representation(
+                [Character(pk=character_id)], load=lambda stub: self.get_queryset().get(pk=stub.pk),
+            )[0]
+        except Character.DoesNotExist as exc:
+            raise NotFound(msg) from exc
+        return Response(payload)
+
+    @action(detail=True, methods=["post"])
+    def activate(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Mache den Charakter zum aktiven Charakter des Benutzers."""
+        character = self.get_object()
+        character.activate()
+        return Response(self.get_serializer(character).data)
+
+    @action(detail=True, methods=["post"], url_path="inventory", permission_classes=[IsAuthenticated, CanGrantItems])
+    def grant_item(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Füge dem Charakter ein Item hinzu (nur Staff oder mit ``BENCHMARK_ENDPOINTS``)."""
+        character = self.get_object()
+        grant = InventoryGrantSerializer(data=request.data)
+        grant.is_valid(raise_exception=True)
+        try:
+            with transaction.atomic():
+                character.add_item_to_inventory(grant.validated_data["item"], grant.validated_data["quantity"])
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response(self.get_serializer(character).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"])
+    def equip(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Rüste ein Item aus dem Inventar des Charakters aus."""
+        character = self.get_object()
+        data = EquipSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        try:
+            character.equip(data.validated_data["inventory_item"])
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response(self.get_serializer(character).data)
+
+    @action(detail=True, methods=["post"])
+    def unequip(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Lege das Item in einem Slot ab."""
+        character = self.get_object()
+        data = UnequipSerializer(data=request.data)
+        data.is_valid(raise_exception=True)
+        try:
+            character.unequip(data.validated_data["slot"])
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response(self.get_serializer(character).data)
+
+    @action(detail=True, methods=["post"])
+    def repair(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Repariere alle beschädigten, reparierbaren Items des Charakters gegen Gold."""
+        character = self.get_object()
+        try:
+            repaired, cost = repair_inventory(character.pk)
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response({"repaired": repaired, "cost": cost})
+
+    @action(detail=True, methods=["post"])
+    def compact(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Fasse die teilweise gefüllten Stacks des Inventars zusammen."""
+        character = self.get_object()
+        return Response({"removed_stacks": compact_inventory(character.pk)})
+
+    @action(detail=True, methods=["post"])
+    def trade(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Übergib mehrere Items atomar an einen anderen Charakter."""
+        character = self.get_object()
+        trade = TradeSerializer(data=request.data)
+        trade.is_valid(raise_exception=True)
+        lines = [(line["item"], line["quantity"]) for line in trade.validated_data["items"]]
+        try:
+            moved = transfer_items(character.pk, trade.validated_data["to"], lines)
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response({
+            "from": character.pk,
+            "to": trade.validated_data["to"],
+            "items": [{"item": item_id, "quantity": quantity} for item_id, quantity in moved.items()],
+        })
+
+    @action(detail=True, methods=["post"])
+    def sell(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Verkaufe alle passenden Stacks an den Händler und gib die Quittung zurück."""
+        character = self.get_object()
+        sale = SellSerializer(data=request.data)
+        sale.is_valid(raise_exception=True)
+        receipt = sell_items(
+            character.pk,
+            rarities=sale.validated_data.get("rarity"),
+            item_types=sale.validated_data.get("item_type"),
+            item_ids=sale.validated_data.get("items"),
+        )
+        return Response(receipt)
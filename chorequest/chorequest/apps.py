@@ -0,0 +1,14 @@
+"""Module contains the configuration for the project wide ChoreQuest app."""
+
+from django.apps import AppConfig
+
+
+class ChoreQuestConfig(AppConfig):
+    """Configuration for the project wide infrastructure (database tuning, caching, instrumentation)."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "chorequest"
+
+    def ready(self) -> None:
+        """Connect the database hooks."""
+        from . import db  # noqa: F401, PLC0415
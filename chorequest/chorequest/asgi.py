@@ -3,6 +3,9 @@ ASGI config for chorequest project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve the project with an ASGI server (e.g. ``uvicorn chorequest.asgi:application``)
+to use the server-sent event streams of :mod:`character.streams`.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -0,0 +1,87 @@
+"""
+Shared helpers of the caching layer.
+
+The backend itself is configured in ``settings.CACHES`` (locmem, file based or a
+Redis protocol server).  This module adds two things on top of it:
+
+* versioned keys: a namespace keeps a version token per object; bumping the
+  token invalidates every cached variant of that object with a single write,
+* hit/miss counters per namespace, exposed through ``cache_metrics``.
+"""
+
+import threading
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.core.cache import cache
+
+
+def _ratio(counts: dict[str, int]) -> float:
+    """Return the share of hits among all lookups."""
+    total = counts["hits"] + counts["misses"]
+    return round(counts["hits"] / total, 4) if total else 0.0
+
+
+class CacheMetrics:
+    """Thread-safe hit and miss counters per cache namespace of this process."""
+
+    def __init__(self) -> None:
+        """Start with empty counters."""
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    def record(self, namespace: str, hits: int = 0, misses: int = 0) -> None:
+        """Add ``hits`` and ``misses`` to the counters of ``namespace``."""
+        with self._lock:
+            counts = self._counts[namespace]
+            counts["hits"] += hits
+            counts["misses"] += misses
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return a copy of all counters including the hit ratio."""
+        with self._lock:
+            return {namespace: {**counts, "hit_ratio": _ratio(counts)} for namespace, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._counts.clear()
+
+
+cache_metrics = CacheMetrics()
+
+
+def version_key(namespace: str, object_id: "int | str") -> str:
+    """Return the key holding the version token of an object."""
+    return f"{namespace}:{object_id}:version"
+
+
+def new_version() -> str:
+    """Return a fresh, unique version token."""
+    return uuid.uuid4().hex[:12]
+
+
+def get_versions(namespace: str, object_ids: Iterable["int | str"]) -> dict["int | str", str]:
+    """
+    Return the version tokens of ``object_ids`` with one cache round trip.
+
+    Missing tokens are created with ``add`` so concurrent readers agree on them.
+    Version keys never expire on their own.
+    """
+    keys = {object_id: version_key(namespace, object_id) for object_id in object_ids}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for object_id, key in keys.items():
+        if key not in found:
+            cache.add(key, new_version(), timeout=None)
+            found[key] = cache.get(key)
+        versions[object_id] = found[key]
+    return versions
+
+
+def bump_versions(namespace: str, object_ids: Iterable["int | str"]) -> None:
+    """Invalidate every cached entry of ``object_ids`` by writing new version tokens."""
+    tokens = {version_key(namespace, object_id): new_version() for object_id in set(object_ids)}
+    if tokens:
+        cache.set_many(tokens, timeout=None)
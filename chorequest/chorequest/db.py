@@ -0,0 +1,104 @@
+"""
+Database connection tuning.
+
+For the ``sqlite`` profile every new connection is configured with the PRAGMAs
+from ``settings.SQLITE_PRAGMAS`` (WAL journal, ``synchronous=NORMAL``, busy
+timeout, mmap).  Together with persistent connections (``CONN_MAX_AGE``) this
+runs once per connection instead of once per request.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.db.models import Max, Min, Model, QuerySet
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender: type, connection: BaseDatabaseWrapper, **kwargs: object) -> None:  # noqa: ARG001
+    """Apply the configured PRAGMAs to a freshly opened SQLite connection."""
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", {})
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def stream_queryset(queryset: QuerySet, chunk_size: int = 2000) -> Iterator[Model]:
+    """
+    Iterate over ``queryset`` without loading it into memory.
+
+    On PostgreSQL this uses a server-side cursor (``DISABLE_SERVER_SIDE_CURSORS``
+    is off in the ``postgres`` profile), on SQLite rows are fetched in chunks.
+    """
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def pk_ranges(queryset: QuerySet, chunk_size: int = 5000) -> Iterator[tuple[int, int]]:
+    """
+    Yield inclusive primary key ranges of at most ``chunk_size`` ids covering ``queryset``.
+
+    Set-based jobs run one ``UPDATE``/``DELETE`` per range; only the two bounds
+    are loaded, so memory stays constant whatever the size of the table.
+    """
+    bounds = queryset.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is None:
+        return
+    for start in range(bounds["low"], bounds["high"] + 1, chunk_size):
+        yield start, min(start + chunk_size - 1, bounds["high"])
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of ``size`` items from ``iterable``; bulk jobs insert one list per query batch."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def estimated_count(model: type[Model], using: str = "default") -> int:
+    """
+    Return a cheap estimate of the number of rows in ``model``'s table.
+
+    PostgreSQL reports the planner statistics from ``pg_class.reltuples``
+    (``0`` for tables that were never analysed), SQLite the highest rowid,
+    which is read from the end of the primary key B-tree.  Neither scans the
+    table, but both may be off after deletes or before ``ANALYZE``.
+    """
+    connection = connections[using]
+    table = model._meta.db_table  # noqa: SLF001
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+        else:
+            cursor.execute(f"SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}")  # noqa: S608
+        row = cursor.fetchone()
+    return max(int(row[0] or 0) if row else 0, 0)
+
+
+def delete_rows(queryset: QuerySet) -> int:
+    """
+    Delete the rows of ``queryset`` with a single ``DELETE`` and return their number.
+
+    ``QuerySet.delete()`` loads every row as soon as a model has ``post_delete``
+    receivers (inventory stacks do) and sends one signal per row.  Set-based
+    jobs lock their rows, handle dependent rows themselves and publish one
+    event for the whole change, so they delete without collector and signals.
+
+    The statement is ``DELETE FROM table WHERE pk IN (<queryset as subquery>)``,
+    so filters across joins work as well.  Foreign keys pointing at the rows are
+    not collected: the database constraints still refuse to delete referenced
+    rows (e.g. equipped inventory stacks).
+    """
+    connection = connections[queryset.db]
+    meta = queryset.model._meta  # noqa: SLF001
+    select_sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    quote = connection.ops.quote_name
+    sql = f"DELETE FROM {quote(meta.db_table)} WHERE {quote(meta.pk.column)} IN ({select_sql})"  # noqa: S608
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
@@ -0,0 +1,239 @@
+"""
+In-process publish/subscribe for server-sent events.
+
+Every open event stream holds a :class:`Subscription` on a channel (e.g.
+``character:42``).  Publishing goes through a pluggable backend chosen with
+``settings.EVENTS_BACKEND``:
+
+* :class:`LocalBackend` hands the event straight to the subscribers of this
+  process (one worker, tests),
+* :class:`RedisBackend` sends it through Redis pub/sub, a listener thread in
+  every worker delivers it to the local subscribers.  When the connection
+  drops, the listener reconnects with exponential backoff and sends every
+  local subscriber a ``resync``, since events may have been lost meanwhile.
+
+Events may be published from any thread.  They are encoded once per channel
+and handed to the event loop of each subscriber with ``call_soon_threadsafe``.
+Each subscription buffers at most ``EVENTS_QUEUE_SIZE`` messages; a client that
+falls behind loses its backlog and receives a single ``resync`` event telling
+it to reload the full state, so a slow reader never grows the worker's memory.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+REDIS_CHANNEL_PREFIX = "chorequest:events:"
+REDIS_RECONNECT_DELAY = 0.5
+REDIS_RECONNECT_DELAY_MAX = 30.0
+HEARTBEAT = b": ping\n\n"
+
+logger = logging.getLogger(__name__)
+
+
+def encode_event(event: dict) -> bytes:
+    """Return ``event`` (``{"type": ..., "data": ...}``) in the ``text/event-stream`` format."""
+    data = json.dumps(event.get("data", {}), cls=DjangoJSONEncoder, separators=(",", ":"))
+    return f"event: {event['type']}\ndata: {data}\n\n".encode()
+
+
+RESYNC = encode_event({"type": "resync"})
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Resolve ``waiter`` unless it is already done."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Subscription:
+    """
+    Bounded message buffer of one event stream, bound to the event loop it was created in.
+
+    An idle subscription is a deque and, while a reader waits, one future and
+    one timer handle; no task per stream and wait.
+    """
+
+    __slots__ = ("channel", "dropped", "loop", "maxsize", "messages", "waiter")
+
+    def __init__(self, channel: str, maxsize: int) -> None:
+        """Create the buffer in the running event loop."""
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.maxsize = maxsize
+        self.messages: deque[bytes] = deque()
+        self.waiter: asyncio.Future | None = None
+        self.dropped = 0
+
+    def push(self, message: bytes) -> None:
+        """Buffer ``message``; on overflow replace the backlog with a ``resync`` event."""
+        if len(self.messages) >= self.maxsize:
+            # Langsamer Client: Rückstand verwerfen, der Client lädt den Stand neu
+            self.dropped += len(self.messages)
+            self.messages.clear()
+            message = RESYNC
+        self.messages.append(message)
+        if self.waiter is not None:
+            _wake(self.waiter)
+
+    async def get(self, timeout: float) -> "bytes | None":
+        """Return the next message or ``None`` if none arrived within ``timeout`` seconds."""
+        if not self.messages:
+            self.waiter = self.loop.create_future()
+            timer = self.loop.call_later(timeout, _wake, self.waiter)
+            try:
+                await self.waiter
+            finally:
+                timer.cancel()
+                self.waiter = None
+        return self.messages.popleft() if self.messages else None
+
+
+class LocalBackend:
+    """Deliver events to the subscribers of this process only."""
+
+    def __init__(self, broker: "EventBroker") -> None:
+        """Remember the broker to deliver to."""
+        self.broker = broker
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Deliver ``event`` directly."""
+        self.broker.deliver(channel, event)
+
+    def start(self) -> None:
+        """Nothing to start for in-process delivery."""
+
+
+class RedisBackend:
+    """
+    Fan events out to all workers through Redis pub/sub.
+
+    Requires the ``redis`` package and ``settings.EVENTS_REDIS_URL``.  The
+    listener thread is started with the first subscription of the worker.
+    """
+
+    def __init__(self, broker: "EventBroker") -> None:
+        """Connect to the Redis server."""
+        import redis  # noqa: PLC0415 - optional dependency, only needed for this backend
+
+        self.broker = broker
+        self.client = redis.Redis.from_url(settings.EVENTS_REDIS_URL)
+        self._connection_errors = (redis.ConnectionError, redis.TimeoutError)
+        self._listener: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Send ``event`` to every worker subscribed to the Redis channel prefix."""
+        self.client.publish(REDIS_CHANNEL_PREFIX + channel, json.dumps(event, cls=DjangoJSONEncoder))
+
+    def start(self) -> None:
+        """Start the listener thread unless it is running."""
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, daemon=True, name="events")
+                self._listener.start()
+
+    def _listen(self) -> None:
+        """Deliver every message received from Redis to the local subscribers, reconnecting after connection errors."""
+        failures = 0
+        try:
+            while True:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                try:
+                    pubsub.psubscribe(REDIS_CHANNEL_PREFIX + "*")
+                    if failures:
+                        logger.info("Reconnected to Redis after %d failed attempts.", failures)
+                        failures = 0
+                        # Während der Unterbrechung verpasste Events: die Clients laden ihren Stand neu
+                        self.broker.resync_all()
+                    for message in pubsub.listen():
+                        channel = message["channel"].decode()[len(REDIS_CHANNEL_PREFIX):]
+                        self.broker.deliver(channel, json.loads(message["data"]))
+                except self._connection_errors:
+                    failures += 1
+                    delay = min(REDIS_RECONNECT_DELAY_MAX, REDIS_RECONNECT_DELAY * 2 ** (failures - 1))
+                    logger.warning("Lost the connection to Redis, reconnecting in %.1f s.", delay, exc_info=True)
+                    time.sleep(delay)
+                finally:
+                    pubsub.close()
+        except Exception:
+            logger.exception("The Redis event listener stopped; the next subscription starts a new one.")
+            with self._lock:
+                self._listener = None
+
+
+class EventBroker:
+    """Registry of the subscriptions of this process and entry point for publishing."""
+
+    def __init__(self) -> None:
+        """Start without subscriptions; the backend is created on first use."""
+        self._lock = threading.Lock()
+        self._channels: dict[str, set[Subscription]] = defaultdict(set)
+        self._backend: LocalBackend | RedisBackend | None = None
+
+    @property
+    def backend(self) -> "LocalBackend | RedisBackend":
+        """Return the configured backend."""
+        if self._backend is None:
+            path = getattr(settings, "EVENTS_BACKEND", "chorequest.events.LocalBackend")
+            self._backend = import_string(path)(self)
+        return self._backend
+
+    def subscribe(self, channel: str, maxsize: "int | None" = None) -> Subscription:
+        """Return a new subscription on ``channel``; must be called from a running event loop."""
+        subscription = Subscription(channel, maxsize or getattr(settings, "EVENTS_QUEUE_SIZE", 64))
+        self.backend.start()
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove ``subscription``; no more messages are delivered to it."""
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Publish ``event`` to the subscribers of ``channel`` in all workers."""
+        self.backend.publish(channel, event)
+
+    def deliver(self, channel: str, event: dict) -> None:
+        """Hand ``event`` to the local subscribers of ``channel``; safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        if not subscribers:
+            return
+        self._push(subscribers, encode_event(event))
+
+    def resync_all(self) -> None:
+        """Send a ``resync`` to every local subscriber, e.g. after events may have been lost."""
+        with self._lock:
+            subscribers = [subscription for channel in self._channels.values() for subscription in channel]
+        self._push(subscribers, RESYNC)
+
+    def _push(self, subscribers: list[Subscription], message: bytes) -> None:
+        """Hand ``message`` to the event loops of ``subscribers``."""
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, message)
+            except RuntimeError:  # noqa: PERF203
+                # Die Event-Loop des Streams ist bereits geschlossen
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self) -> int:
+        """Return the number of subscriptions of this process."""
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._channels.values())
+
+
+broker = EventBroker()
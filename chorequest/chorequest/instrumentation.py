@@ -0,0 +1,166 @@
+"""
+Per-request SQL and timing instrumentation.
+
+``QueryInstrumentationMiddleware`` counts the queries of a request and the time
+spent in the database with ``connection.execute_wrapper``.  Together with the
+view time and the serializer time (recorded by ``TimedSerializerMixin``) the
+numbers are returned as ``Server-Timing`` and ``X-Query-Count`` headers.
+
+Requests running more queries than ``REQUEST_QUERY_BUDGET`` are logged with the
+fingerprints of their repeated statements, which makes N+1 patterns visible.
+The middleware is opt-in: it removes itself unless
+``REQUEST_INSTRUMENTATION_ENABLED`` is set.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+def fingerprint(sql: str) -> str:
+    """Return ``sql`` with whitespace, literals and placeholder lists normalized."""
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _NUMBER.sub("?", sql)
+
+
+class RequestMetrics:
+    """Queries and timings collected while one request is served."""
+
+    def __init__(self) -> None:
+        """Start with empty counters."""
+        self.queries: list[str] = []
+        self.db_seconds = 0.0
+        self.timings: dict[str, float] = {}
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: dict,  # noqa: ANN401, FBT001
+    ) -> Any:  # noqa: ANN401
+        """Execute wrapper recording the statement and its duration."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self.queries.append(sql)
+
+    def add_timing(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to the timing ``name``."""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def duplicates(self) -> list[tuple[str, int]]:
+        """Return the fingerprints executed more than once, most frequent first."""
+        counts = Counter(fingerprint(sql) for sql in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count > 1]
+
+
+_current_metrics: ContextVar["RequestMetrics | None"] = ContextVar("request_metrics", default=None)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Record the duration of the block as timing ``name`` of the current request, if instrumented."""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_timing(name, time.perf_counter() - start)
+
+
+class TimedSerializerMixin:
+    """Serializer mixin recording the time spent building ``serializer.data``."""
+
+    @property
+    def data(self) -> Any:  # noqa: ANN401
+        """Return the serialized data and record the time as ``serializer``."""
+        with timed("serializer"):
+            return super().data
+
+
+class QueryInstrumentationMiddleware:
+    """Add ``Server-Timing`` and ``X-Query-Count`` headers and log requests over the query budget."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Disable the middleware unless ``REQUEST_INSTRUMENTATION_ENABLED`` is set."""
+        if not getattr(settings, "REQUEST_INSTRUMENTATION_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.query_budget = getattr(settings, "REQUEST_QUERY_BUDGET", 20)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Serve the request with all database connections instrumented."""
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics))
+                response = self.get_response(request)
+            self._record_view(request)
+        finally:
+            _current_metrics.reset(token)
+        total = time.perf_counter() - start
+
+        response["X-Query-Count"] = str(len(metrics.queries))
+        response["Server-Timing"] = self.server_timing(metrics, total)
+        if len(metrics.queries) > self.query_budget:
+            self.log_over_budget(request, metrics)
+        return response
+
+    def process_view(self, request: HttpRequest, *args: object) -> None:  # noqa: ARG002
+        """Remember when the view started."""
+        request._instrumentation_view_start = time.perf_counter()  # noqa: SLF001
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """Record the view time before the response is rendered."""
+        self._record_view(request)
+        return response
+
+    def _record_view(self, request: HttpRequest) -> None:
+        """Record the time since the view started as ``view``."""
+        start = getattr(request, "_instrumentation_view_start", None)
+        metrics = _current_metrics.get()
+        if start is not None and metrics is not None:
+            metrics.add_timing("view", time.perf_counter() - start)
+            request._instrumentation_view_start = None  # noqa: SLF001
+
+    def server_timing(self, metrics: RequestMetrics, total: float) -> str:
+        """Return the ``Server-Timing`` header value for ``metrics``."""
+        entries = [f'db;dur={metrics.db_seconds * 1000:.2f};desc="{len(metrics.queries)} queries"']
+        entries += [f"{name};dur={seconds * 1000:.2f}" for name, seconds in metrics.timings.items()]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+    def log_over_budget(self, request: HttpRequest, metrics: RequestMetrics) -> None:
+        """Log a request exceeding the query budget with its duplicated statements."""
+        duplicates = "\n".join(f"  {count}x {sql}" for sql, count in metrics.duplicates()[:10])
+        logger.warning(
+            "%s %s ran %d queries (budget %d) in %.1f ms of database time.\nDuplicated statements:\n%s",
+            request.method,
+            request.path,
+            len(metrics.queries),
+            self.query_budget,
+            metrics.db_seconds * 1000,
+            duplicates or "  none",
+        )
@@ -0,0 +1 @@
+"""Management commands of the project wide infrastructure."""
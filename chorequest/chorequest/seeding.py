@@ -0,0 +1,268 @@
+"""
+Synthetic world generator for load and performance tests.
+
+``WorldSeeder`` fills the database with users, characters, items, inventories,
+quests and character quests.  The volumes follow skewed distributions instead
+of uniform ones: most players have a single character, a few carry full
+inventories, popular items and quests are picked far more often than the long
+tail, and levels and quest timestamps decay exponentially.
+
+All rows are written with chunked ``bulk_create`` while the model signals are
+muted, one transaction per chunk of users.  Every user shares one password that
+is hashed once.  The same seed always produces the same world; ``prefix`` keeps
+the unique names of several seeded worlds apart.
+"""
+
+import random
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from character.models import (
+    Character,
+    InventoryItem,
+    Item,
+    SlotChoices,
+    calculate_experience_to_next_level,
+    calculate_hitpoints_and_mana,
+)
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+from factory.django import mute_signals
+from quest.models import CharacterQuest, Quest
+
+CHARACTERS_PER_USER = {1: 70, 2: 20, 3: 7, 4: 3}
+RARITIES = {"trash": 30, "common": 45, "rare": 15, "epic": 8, "legendary": 2}
+RARITY_VALUE = {"trash": 1, "common": 10, "rare": 75, "epic": 400, "legendary": 2500}
+QUEST_STATUSES = {"completed": 60, "accepted": 25, "open": 15}
+STACK_SIZES = (1, 1, 5, 10, 20, 99)
+MAX_LEVEL = 60
+HISTORY_DAYS = 365
+
+
+@dataclass
+class SeedResult:
+    """Counters and timing of a seeding run."""
+
+    counts: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        """Return the total number of inserted rows."""
+        return sum(self.counts.values())
+
+    @property
+    def rows_per_minute(self) -> float:
+        """Return the number of inserted rows per minute."""
+        return self.rows / self.seconds * 60 if self.seconds else 0.0
+
+    def add(self, name: str, count: int) -> None:
+        """Add ``count`` inserted rows of ``name``."""
+        self.counts[name] = self.counts.get(name, 0) + count
+
+
+def _weighted(rng: random.Random, weights: dict) -> Callable[[], object]:
+    """Return a function drawing keys of ``weights`` with their relative weight."""
+    keys, cumulative = list(weights), list(accumulate(weights.values()))
+    return lambda: rng.choices(keys, cum_weights=cumulative)[0]
+
+
+def _zipf_cumulative(size: int, exponent: float = 1.1) -> list[float]:
+    """Return cumulative Zipf weights for ``size`` ranks (rank 1 is the most popular)."""
+    return list(accumulate(1 / rank**exponent for rank in range(1, size + 1)))
+
+
+class WorldSeeder:
+    """Generate a reproducible world with skewed, realistic distributions."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        users: int,
+        items: int = 500,
+        quests: int = 2000,
+        *,
+        seed: int = 0,
+        prefix: str = "seed",
+        password: str = "chorequest",  # noqa: S107
+        chunk_size: int = 2000,
+    ) -> None:
+        """Store the volumes; nothing is written before :meth:`run`."""
+        self.users = users
+        self.items = items
+        self.quests = quests
+        self.seed = seed
+        self.prefix = prefix
+        self.password = password
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)  # noqa: S311 - reproducible test data, not security relevant
+        self.now = timezone.now()
+        self.stack_sizes: dict[int, int] = {}
+
+    def run(self) -> SeedResult:
+        """Write the whole world and return the counters."""
+        result = SeedResult()
+        start = time.perf_counter()
+        with mute_signals(pre_save, post_save, pre_delete, post_delete, m2m_changed):
+            item_ids = self.create_items(result)
+            quest_ids = self.create_quests(result)
+            password = make_password(self.password)
+            for offset in range(0, self.users, self.chunk_size):
+                size = min(self.chunk_size, self.users - offset)
+                with transaction.atomic():
+                    self.create_players(offset, size, password, item_ids, quest_ids, result)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def create_items(self, result: SeedResult) -> list[int]:
+        """Create the item catalogue and return the ids ordered by popularity."""
+        rarity = _weighted(self.rng, RARITIES)
+        slots = [choice for choice, _ in SlotChoices.choices]
+        items = []
+        for index in range(self.items):
+            item_rarity = rarity()
+            items.append(
+                Item(
+                    name=f"{self.prefix}-item-{index}",
+                    rarity=item_rarity,
+                    slot=self.rng.choice(slots),
+                    item_type=self.rng.choice(["consumable", "equipment", "equipment", "quest"]),
+                    weight=Decimal(self.rng.randint(1, 500)) / 100,
+                    value=int(RARITY_VALUE[item_rarity] * self.rng.uniform(0.5, 1.5)),
+                    stacksize=self.rng.choice(STACK_SIZES),
+                ),
+            )
+        with transaction.atomic():
+            Item.objects.bulk_create(items, batch_size=self.chunk_size)
+        result.add("items", len(items))
+        self.stack_sizes = {item.pk: item.stacksize for item in self._with_ids(Item, items)}
+        return [item.pk for item in items]
+
+    def create_quests(self, result: SeedResult) -> list[int]:
+        """Create the quest catalogue and return the ids ordered by popularity."""
+        quests = [
+            Quest(
+                name=f"{self.prefix}-quest-{index}",
+                description="Generated quest",
+                due_date=self.now + timedelta(days=self.rng.randint(-30, 60)),
+                is_active=self.rng.random() < 0.8,  # noqa: PLR2004
+                experience_points=self.rng.choice([50, 100, 100, 150, 250, 500]),
+                gold=self.rng.randint(5, 100),
+            )
+            for index in range(self.quests)
+        ]
+        with transaction.atomic():
+            Quest.objects.bulk_create(quests, batch_size=self.chunk_size)
+        result.add("quests", len(quests))
+        return [quest.pk for quest in self._with_ids(Quest, quests)]
+
+    def create_players(  # noqa: PLR0913, PLR0917
+        self,
+        offset: int,
+        size: int,
+        password: str,
+        item_ids: list[int],
+        quest_ids: list[int],
+        result: SeedResult,
+    ) -> None:
+        """Create ``size`` users with their characters, inventories and quests."""
+        user_model = get_user_model()
+        users = [
+            user_model(
+                username=f"{self.prefix}-user-{index}",
+                email=f"{self.prefix}-user-{index}@example.com",
+                password=password,
+                date_joined=self._past(HISTORY_DAYS),
+            )
+            for index in range(offset, offset + size)
+        ]
+        user_model.objects.bulk_create(users, batch_size=self.chunk_size)
+        result.add("users", len(users))
+
+        characters = list(self._characters(self._with_ids(user_model, users, "username")))
+        Character.objects.bulk_create(characters, batch_size=self.chunk_size)
+        characters = self._with_ids(Character, characters)
+        result.add("characters", len(characters))
+
+        inventory = list(self._inventory(characters, item_ids))
+        InventoryItem.objects.bulk_create(inventory, batch_size=self.chunk_size)
+        result.add("inventory_items", len(inventory))
+
+        character_quests = list(self._character_quests(characters, quest_ids))
+        CharacterQuest.objects.bulk_create(character_quests, batch_size=self.chunk_size)
+        result.add("character_quests", len(character_quests))
+
+    def _characters(self, users: list) -> Iterator[Character]:
+        """Yield 1-4 characters per user, most users having exactly one."""
+        count = _weighted(self.rng, CHARACTERS_PER_USER)
+        for user in users:
+            for number in range(count()):
+                level = min(MAX_LEVEL, 1 + int(self.rng.expovariate(1 / 8)))
+                hitpoints, mana = calculate_hitpoints_and_mana(level)
+                to_next_level = calculate_experience_to_next_level(level)
+                yield Character(
+                    user_id=user.pk,
+                    name=f"{user.username}-hero-{number}",
+                    active=number == 0,
+                    level=level,
+                    experience_points=self.rng.randrange(to_next_level),
+                    experience_points_to_next_level=to_next_level,
+                    hitpoints=hitpoints,
+                    hitpoints_max=hitpoints,
+                    mana=mana,
+                    mana_max=mana,
+                    max_carry_weight=1000.0,
+                )
+
+    def _inventory(self, characters: list[Character], item_ids: list[int]) -> Iterator[InventoryItem]:
+        """Yield Pareto distributed inventories of Zipf distributed items."""
+        cumulative = _zipf_cumulative(len(item_ids))
+        for character in characters:
+            stacks = min(character.max_inventory_slots, int(self.rng.paretovariate(1.2)) * 2 - 1)
+            for item_id in set(self.rng.choices(item_ids, cum_weights=cumulative, k=stacks)):
+                yield InventoryItem(
+                    character_id=character.pk,
+                    item_id=item_id,
+                    quantity=self.rng.randint(1, self.stack_sizes[item_id]),
+                )
+
+    def _character_quests(self, characters: list[Character], quest_ids: list[int]) -> Iterator[CharacterQuest]:
+        """Yield quests per character growing with the level, popular quests first."""
+        cumulative = _zipf_cumulative(len(quest_ids))
+        status = _weighted(self.rng, QUEST_STATUSES)
+        for character in characters:
+            count = min(len(quest_ids), int(self.rng.paretovariate(1.5) * character.level))
+            for quest_id in set(self.rng.choices(quest_ids, cum_weights=cumulative, k=count)):
+                quest_status = status()
+                accepted_at = self._past(HISTORY_DAYS) if quest_status != "open" else None
+                completed_at = None
+                if quest_status == "completed":
+                    completed_at = min(self.now, accepted_at + timedelta(hours=self.rng.expovariate(1 / 24)))
+                yield CharacterQuest(
+                    character_id=character.pk,
+                    quest_id=quest_id,
+                    status=quest_status,
+                    progress={"open": 0, "accepted": self.rng.randint(0, 99), "completed": 100}[quest_status],
+                    accepted_at=accepted_at,
+                    completed_at=completed_at,
+                )
+
+    def _past(self, days: int) -> datetime:
+        """Return a point in the last ``days`` days, recent points being more likely."""
+        return self.now - timedelta(days=min(days, self.rng.expovariate(3 / days)))
+
+    def _with_ids(self, model: type, objects: list, unique_field: str = "name") -> list:
+        """Fill in missing primary keys on backends that do not return them from ``bulk_create``."""
+        if all(obj.pk is not None for obj in objects):
+            return objects
+        values = [getattr(obj, unique_field) for obj in objects]
+        ids = dict(model.objects.filter(**{f"{unique_field}__in": values}).values_list(unique_field, "id"))
+        for obj in objects:
+            obj.pk = ids[getattr(obj, unique_field)]
+        return objects
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +46,11 @@ INSTALLED_APPS = [
     "user",
     "character",
     "quest",
+    "search",
+    "household",
+    "analytics",
+    "backup",
+    "chorequest",
 
 
 ]
@@ -58,8 +64,17 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "chorequest.instrumentation.QueryInstrumentationMiddleware",
 ]
 
+# Server-Timing- und X-Query-Count-Header pro Request (opt-in, z.B. REQUEST_INSTRUMENTATION=1).
+# Requests mit mehr als REQUEST_QUERY_BUDGET Queries werden mit doppelten SQL-Fingerprints geloggt.
+REQUEST_INSTRUMENTATION_ENABLED = os.environ.get("REQUEST_INSTRUMENTATION", "") == "1"
+REQUEST_QUERY_BUDGET = int(os.environ.get("REQUEST_QUERY_BUDGET", "20"))
+
+# Endpunkte nur für Lasttests (z.B. Items ohne Gegenleistung vergeben), in Produktion aus lassen.
+BENCHMARK_ENDPOINTS = os.environ.get("CHOREQUEST_BENCHMARK_ENDPOINTS", "") == "1"
+
 ROOT_URLCONF = "chorequest.urls"
 
 TEMPLATES = [
@@ -84,13 +99,119 @@ WSGI_APPLICATION = "chorequest.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
+# Das Profil wird über CHOREQUEST_DB_PROFILE gewählt:
+#   sqlite        SQLite mit WAL, synchronous=NORMAL, busy timeout, mmap und
+#                 persistenten Verbindungen (PRAGMAs in chorequest.db)
+#   sqlite-plain  SQLite ohne Tuning (Vergleichsbasis für benchmarks/db_profiles.py)
+#   postgres      PostgreSQL mit Djangos Connection-Pool (benötigt psycopg[pool])
+DATABASE_PROFILE = os.environ.get("CHOREQUEST_DB_PROFILE", "sqlite")
+
+if DATABASE_PROFILE == "postgres":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("POSTGRES_DB", "chorequest"),
+            "USER": os.environ.get("POSTGRES_USER", "chorequest"),
+            "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+            "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+            "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+            # Der Pool verwaltet die Verbindungen, CONN_MAX_AGE muss 0 bleiben
+            "CONN_MAX_AGE": 0,
+            # Server-side cursors für QuerySet.iterator() bei großen Exporten
+            "DISABLE_SERVER_SIDE_CURSORS": False,
+            "OPTIONS": {
+                "pool": {
+                    "min_size": int(os.environ.get("POSTGRES_POOL_MIN_SIZE", "2")),
+                    "max_size": int(os.environ.get("POSTGRES_POOL_MAX_SIZE", "20")),
+                    "timeout": int(os.environ.get("POSTGRES_POOL_TIMEOUT", "10")),
+                },
+            },
+        },
+    }
+elif DATABASE_PROFILE == "sqlite-plain":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+        },
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": int(os.environ.get("SQLITE_CONN_MAX_AGE", "600")),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # Sekunden, die auf eine gesperrte Datenbank gewartet wird
+                "timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT", "20")),
+                # Schreibtransaktionen sofort sperren statt später zu eskalieren
+                "transaction_mode": "IMMEDIATE",
+            },
+        },
+    }
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT", "20")) * 1000,
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+} if DATABASE_PROFILE == "sqlite" else {}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+#
+# CHOREQUEST_CACHE_BACKEND wählt das Backend:
+#   locmem  Speicher des Prozesses (Standard, nicht zwischen Workern geteilt)
+#   file    Dateibasierter Cache in CACHE_DIR
+#   redis   Redis-Protokoll (Redis, Valkey oder lokaler Stand-in) unter REDIS_URL
+CACHE_BACKEND = os.environ.get("CHOREQUEST_CACHE_BACKEND", "locmem")
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "chorequest",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("CACHE_DIR", BASE_DIR / ".cache"),
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/0"),
+    },
+}
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        "KEY_PREFIX": "chorequest",
+        "TIMEOUT": 300,
     },
 }
 
+# Lebensdauer eines gecachten CharacterSerializer-Payloads in Sekunden
+CHARACTER_CACHE_TIMEOUT = 300
+
+
+# Server-Sent Events (siehe chorequest.events), nur unter ASGI
+#
+# CHOREQUEST_EVENTS_BACKEND wählt die Verteilung der Events:
+#   local  nur an Streams dieses Prozesses (Standard, ein Worker)
+#   redis  über Redis Pub/Sub an alle Worker, Server unter REDIS_URL
+EVENTS_BACKENDS = {
+    "local": "chorequest.events.LocalBackend",
+    "redis": "chorequest.events.RedisBackend",
+}
+EVENTS_BACKEND = EVENTS_BACKENDS[os.environ.get("CHOREQUEST_EVENTS_BACKEND", "local")]
+EVENTS_REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/0")
+# Sekunden ohne Event, nach denen ein Kommentar die Verbindung offen hält
+EVENTS_HEARTBEAT_INTERVAL = 15
+# Gepufferte Events pro Stream, bevor der Rückstand durch "resync" ersetzt wird
+EVENTS_QUEUE_SIZE = 64
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -134,17 +255,66 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "user.UserAccount"
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+EMAIL_BACKEND = os.environ.get("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.environ.get("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "") == "1"
+
+# Fortschritt von Quests (siehe quest.progress): Meldungen werden pro Quest gesammelt
+# und gebündelt geschrieben.
+#   buffered   Schreiben spätestens nach QUEST_PROGRESS_FLUSH_INTERVAL Sekunden,
+#              bei einem Absturz gehen die Meldungen dieses Intervalls verloren
+#   immediate  jede Meldung wird vor der Antwort geschrieben
+QUEST_PROGRESS_DURABILITY = os.environ.get("CHOREQUEST_PROGRESS_DURABILITY", "buffered")
+QUEST_PROGRESS_FLUSH_INTERVAL = float(os.environ.get("CHOREQUEST_PROGRESS_FLUSH_INTERVAL", "5"))
+# Mehr gepufferte Quests lösen sofort ein Schreiben aus
+QUEST_PROGRESS_MAX_PENDING = 10000
+# Ab diesem Fortschritt gilt eine Quest als abgeschlossen
+QUEST_COMPLETION_THRESHOLD = 100
+
+# Abgeschlossene Quests wandern nach so vielen Tagen ins Archiv (python manage.py archive_quests)
+QUEST_ARCHIVE_AFTER_DAYS = int(os.environ.get("CHOREQUEST_QUEST_ARCHIVE_AFTER_DAYS", "180"))
+
+# Export (backup.export): Zeilen pro Datenbank-Roundtrip des Server-Side-Cursors
+EXPORT_CHUNK_SIZE = 2000
+
+# E-Mail-Outbox (python manage.py deliver_outbox): Wiederholungen mit exponentiellem Backoff
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BACKOFF = 30
+OUTBOX_RETRY_BACKOFF_MAX = 3600
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # Liest user_id, is_active und den aktiven Charakter aus den Token-Claims,
+        # ohne UserAccount-Abfrage. Datenbankgestützte Alternative:
+        # "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "user.authentication.ClaimsJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",  # Offen für Registrierung
     ],
 }
 
+SIMPLE_JWT = {
+    "TOKEN_USER_CLASS": "user.authentication.ClaimsTokenUser",
+    "TOKEN_REFRESH_SERIALIZER": "user.serializers.ClaimsTokenRefreshSerializer",
+}
+
+# Lebensdauer des gecachten UserAccount-Objekts in Sekunden
+USER_CACHE_TIMEOUT = 60
+
+# Passwort-Hashing (Login/Registrierung) läuft in einem eigenen Thread-Pool.
+# Mehr als PASSWORD_HASHING_MAX_CONCURRENCY laufende + wartende Hashes werden
+# sofort mit 429 und Retry-After abgelehnt.
+PASSWORD_HASHING_THREADS = 4
+PASSWORD_HASHING_MAX_CONCURRENCY = 16
+PASSWORD_HASHING_RETRY_AFTER = 1
+
+# Login prüft Passwörter über den Hashing-Pool statt im Request-Worker
+AUTHENTICATION_BACKENDS = ["user.backends.PooledModelBackend"]
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 CORS_ALLOWED_ORIGINS = [
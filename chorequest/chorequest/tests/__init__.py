@@ -0,0 +1,7 @@
+"""Initializes the Django environment for the tests of the project wide infrastructure."""
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chorequest.settings")
+django.setup()
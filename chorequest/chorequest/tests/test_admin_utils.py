@@ -0,0 +1,56 @@
+"""Tests for the estimated-count paginator and the range filters of the admin."""
+
+from unittest import mock
+
+from character.factories import CharacterFactory
+from character.models import Character
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from user.factories import UserAccountFactory
+
+from chorequest.admin_utils import EstimatedCountPaginator
+from chorequest.db import estimated_count
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    """Teste, wann geschätzt und wann exakt gezählt wird."""
+
+    def setUp(self) -> None:
+        """Erstelle drei Charaktere."""
+        self.characters = CharacterFactory.create_batch(3)
+
+    def test_estimate(self) -> None:
+        """Teste die Schätzung über die höchste rowid."""
+        self.assertGreaterEqual(estimated_count(Character), 3)
+
+    def test_small_table_is_counted(self) -> None:
+        """Teste, ob kleine Tabellen exakt gezählt werden."""
+        paginator = EstimatedCountPaginator(Character.objects.order_by("pk"), 2)
+
+        self.assertEqual(paginator.count, 3)
+
+    def test_big_table_is_estimated(self) -> None:
+        """Teste, ob große ungefilterte Tabellen ohne COUNT(*) auskommen."""
+        with mock.patch("chorequest.admin_utils.ESTIMATE_THRESHOLD", 1), CaptureQueriesContext(connection) as queries:
+            count = EstimatedCountPaginator(Character.objects.order_by("pk"), 2).count
+
+        self.assertEqual(count, estimated_count(Character))
+        self.assertFalse([query for query in queries.captured_queries if "COUNT(" in query["sql"].upper()])
+
+    def test_filtered_queryset_is_counted(self) -> None:
+        """Teste, ob gefilterte Querysets exakt gezählt werden."""
+        with mock.patch("chorequest.admin_utils.ESTIMATE_THRESHOLD", 1):
+            paginator = EstimatedCountPaginator(Character.objects.filter(pk=self.characters[0].pk).order_by("pk"), 2)
+
+            self.assertEqual(paginator.count, 1)
+
+    def test_changelist_uses_estimate(self) -> None:
+        """Teste, ob die Charakter-Changelist große Tabellen nicht zählt."""
+        self.client.force_login(UserAccountFactory(is_staff=True, is_superuser=True))
+
+        with mock.patch("chorequest.admin_utils.ESTIMATE_THRESHOLD", 1), CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/character/character/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries.captured_queries if "COUNT(" in query["sql"].upper()])
@@ -0,0 +1,62 @@
+"""Tests for the database connection tuning."""
+
+import pytest
+from character.factories import CharacterFactory, InventoryItemFactory, ItemFactory
+from character.models import Equipment, InventoryItem
+from django.db import IntegrityError, connection, transaction
+from django.test import SimpleTestCase, TestCase
+
+from chorequest.db import chunked, delete_rows
+
+
+class SqliteConnectionTest(TestCase):
+    """Teste die PRAGMAs des sqlite-Profils."""
+
+    def test_pragmas_applied(self) -> None:
+        """Teste, ob synchronous=NORMAL und der busy timeout gesetzt sind."""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertGreater(cursor.fetchone()[0], 0)
+
+
+class ChunkedTest(SimpleTestCase):
+    """Teste die Aufteilung von Iterables in Blöcke."""
+
+    def test_chunked(self) -> None:
+        """Teste, ob ein Generator vollständig in Blöcke fester Größe zerlegt wird."""
+        self.assertEqual(list(chunked((n for n in range(5)), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
+
+
+class DeleteRowsTest(TestCase):
+    """Teste das Löschen per einzelnem DELETE."""
+
+    def setUp(self) -> None:
+        """Lege einen Charakter mit einem ausgerüsteten und zwei losen Stapeln an."""
+        self.character = CharacterFactory()
+        self.equipped = InventoryItemFactory(character=self.character, item=ItemFactory(rarity="rare"))
+        Equipment.objects.create(character=self.character, slot="weapon", inventory_item=self.equipped)
+        self.loose = [
+            InventoryItemFactory(character=self.character, item=ItemFactory(rarity="trash")) for _ in range(2)
+        ]
+
+    def test_deletes_filtered_rows(self) -> None:
+        """Teste, ob auch Filter über Joins mit einer Abfrage gelöscht werden."""
+        with self.assertNumQueries(1):
+            deleted = delete_rows(InventoryItem.objects.filter(character=self.character, item__rarity="trash"))
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(list(InventoryItem.objects.filter(character=self.character)), [self.equipped])
+
+    def test_equipped_stack_is_restricted(self) -> None:
+        """Teste, ob die Datenbank das Löschen eines ausgerüsteten Stapels weiterhin verweigert."""
+        with transaction.atomic():
+            delete_rows(InventoryItem.objects.filter(pk=self.equipped.pk))
+            # Fremdschlüssel sind verzögert und werden erst beim Commit geprüft
+            with pytest.raises(IntegrityError):
+                connection.check_constraints()
+            transaction.set_rollback(True)
+
+        self.assertTrue(InventoryItem.objects.filter(pk=self.equipped.pk).exists())
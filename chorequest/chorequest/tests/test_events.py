@@ -0,0 +1,86 @@
+"""Tests for the in-process publish/subscribe of the event streams."""
+
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from chorequest.events import HEARTBEAT, RESYNC, EventBroker, encode_event
+
+
+class EventBrokerTest(SimpleTestCase):
+    """Teste Zustellung, Gegendruck und Abmeldung der Subscriptions."""
+
+    def setUp(self) -> None:
+        """Erstelle einen eigenen Broker mit einer Event-Loop."""
+        self.broker = EventBroker()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def subscribe(self, channel: str, maxsize: int = 4) -> object:
+        """Abonniere ``channel`` innerhalb der Event-Loop."""
+
+        async def subscribe() -> object:
+            return self.broker.subscribe(channel, maxsize)
+
+        return self.loop.run_until_complete(subscribe())
+
+    def receive(self, subscription: object, timeout: float = 0.5) -> "bytes | None":
+        """Warte auf die nächste Nachricht einer Subscription."""
+        return self.loop.run_until_complete(subscription.get(timeout))
+
+    def test_delivers_to_channel(self) -> None:
+        """Teste, ob nur die Abonnenten des Kanals das Event erhalten."""
+        first, second = self.subscribe("character:1"), self.subscribe("character:1")
+        other = self.subscribe("character:2")
+        event = {"type": "quest", "data": {"quest": 3, "progress": 50}}
+
+        self.broker.publish("character:1", event)
+
+        self.assertEqual(self.receive(first), b'event: quest\ndata: {"quest":3,"progress":50}\n\n')
+        self.assertEqual(self.receive(second), encode_event(event))
+        self.assertIsNone(self.receive(other, timeout=0.01))
+
+    def test_publish_from_other_thread(self) -> None:
+        """Teste, ob Events aus anderen Threads die wartende Subscription wecken."""
+        subscription = self.subscribe("character:1")
+        timer = threading.Timer(0.05, self.broker.publish, ("character:1", {"type": "resync"}))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(self.receive(subscription, timeout=5), RESYNC)
+
+    def test_overflow_becomes_resync(self) -> None:
+        """Teste, ob ein langsamer Client seinen Rückstand gegen ein einziges resync tauscht."""
+        subscription = self.subscribe("character:1", maxsize=3)
+        for progress in range(5):
+            self.broker.publish("character:1", {"type": "quest", "data": {"progress": progress}})
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(self.receive(subscription), RESYNC)
+        self.assertIn(b'"progress":4', self.receive(subscription))
+        self.assertEqual(subscription.dropped, 3)
+
+    def test_unsubscribe(self) -> None:
+        """Teste, ob abgemeldete Subscriptions nichts mehr erhalten."""
+        subscription = self.subscribe("character:1")
+        self.assertEqual(self.broker.subscriber_count(), 1)
+
+        self.broker.unsubscribe(subscription)
+        self.broker.publish("character:1", {"type": "resync"})
+
+        self.assertEqual(self.broker.subscriber_count(), 0)
+        self.assertIsNone(self.receive(subscription, timeout=0.01))
+
+    def test_resync_all(self) -> None:
+        """Teste, ob nach einem Verbindungsabbruch alle Abonnenten ein resync erhalten."""
+        subscriptions = [self.subscribe("character:1"), self.subscribe("character:2")]
+
+        self.broker.resync_all()
+
+        self.assertEqual([self.receive(subscription) for subscription in subscriptions], [RESYNC, RESYNC])
+
+    def test_heartbeat_format(self) -> None:
+        """Teste, ob der Heartbeat ein SSE-Kommentar ist."""
+        self.assertTrue(HEARTBEAT.startswith(b":"))
+        self.assertTrue(HEARTBEAT.endswith(b"\n\n"))
@@ -0,0 +1,55 @@
+"""Tests for the per-request SQL and timing instrumentation."""
+
+from character.models import Character, InventoryItem, Item
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from chorequest.instrumentation import fingerprint
+
+
+class FingerprintTest(SimpleTestCase):
+    """Teste die Normalisierung von SQL-Statements."""
+
+    def test_placeholder_lists_and_numbers_collapse(self) -> None:
+        """Teste, ob IN-Listen und Zahlen zusammengefasst werden."""
+        self.assertEqual(
+            fingerprint('SELECT *  FROM "a"\n WHERE "id" IN (%s, %s, %s) LIMIT 21'),
+            'SELECT * FROM "a" WHERE "id" IN (...) LIMIT ?',
+        )
+
+
+@override_settings(REQUEST_INSTRUMENTATION_ENABLED=True, REQUEST_QUERY_BUDGET=2)
+class QueryInstrumentationMiddlewareTest(APITestCase):
+    """Teste die Server-Timing- und X-Query-Count-Header."""
+
+    def setUp(self) -> None:
+        """Erstelle drei Charaktere mit Inventar und leere den Payload-Cache."""
+        cache.clear()
+        user = get_user_model().objects.create_user(
+            username="testuser_timing", email="timing@example.com", password="password123",  # noqa: S106
+        )
+        item = Item.objects.create(name="TimingPotion")
+        for name in ("TimingHero1", "TimingHero2", "TimingHero3"):
+            character = Character.objects.create(user=user, name=name)
+            InventoryItem.objects.create(character=character, item=item)
+        token = AccessToken()
+        token["user_id"] = str(user.pk)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_headers_present(self) -> None:
+        """Teste, ob die Header gesetzt werden."""
+        response = self.client.get("/api/characters/")
+        self.assertGreater(int(response["X-Query-Count"]), 0)
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn("serializer;dur=", response["Server-Timing"])
+        self.assertIn("view;dur=", response["Server-Timing"])
+
+    def test_over_budget_logs_duplicates(self) -> None:
+        """Teste, ob die N+1-Abfragen des Inventars geloggt werden."""
+        with self.assertLogs("chorequest.instrumentation", level="WARNING") as logs:
+            self.client.get("/api/characters/")
+        self.assertIn("3x SELECT", logs.output[0])
+        self.assertIn("character_inventoryitem", logs.output[0])
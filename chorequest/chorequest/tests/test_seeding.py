@@ -0,0 +1,61 @@
+"""Tests for the synthetic world generator and the model factories."""
+
+from character.models import Character, InventoryItem, Item
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from quest.factories import CharacterQuestFactory
+from quest.models import CharacterQuest, Quest
+
+from chorequest.seeding import WorldSeeder
+
+
+class WorldSeederTest(TestCase):
+    """Teste den Generator für synthetische Welten."""
+
+    def test_counts_match_database(self) -> None:
+        """Teste, ob die gemeldeten Zähler den geschriebenen Zeilen entsprechen."""
+        result = WorldSeeder(30, items=20, quests=15, seed=7, chunk_size=8).run()
+
+        self.assertEqual(result.counts["users"], get_user_model().objects.count())
+        self.assertEqual(result.counts["characters"], Character.objects.count())
+        self.assertEqual(result.counts["items"], Item.objects.count())
+        self.assertEqual(result.counts["quests"], Quest.objects.count())
+        self.assertEqual(result.counts["inventory_items"], InventoryItem.objects.count())
+        self.assertEqual(result.counts["character_quests"], CharacterQuest.objects.count())
+        self.assertGreaterEqual(result.counts["characters"], 30)
+        # Genau ein aktiver Charakter pro Benutzer
+        self.assertEqual(Character.objects.filter(active=True).count(), 30)
+
+    def test_same_seed_same_world(self) -> None:
+        """Teste, ob derselbe Seed dieselben Verteilungen erzeugt."""
+        WorldSeeder(20, items=10, quests=10, seed=3, prefix="a").run()
+        WorldSeeder(20, items=10, quests=10, seed=3, prefix="b").run()
+
+        def levels(prefix: str) -> list[int]:
+            return list(
+                Character.objects.filter(name__startswith=f"{prefix}-").order_by("id").values_list("level", flat=True),
+            )
+
+        self.assertEqual(levels("a"), levels("b"))
+
+    def test_seeded_users_can_log_in(self) -> None:
+        """Teste, ob die Benutzer mit dem gemeinsamen Passwort angemeldet werden können."""
+        WorldSeeder(2, items=5, quests=5, password="secret-pass").run()  # noqa: S106
+        user = get_user_model().objects.get(username="seed-user-1")
+        self.assertTrue(user.check_password("secret-pass"))
+
+    def test_command(self) -> None:
+        """Teste den Management-Befehl."""
+        call_command("seed_world", users=5, items=5, quests=5, verbosity=0)
+        self.assertEqual(get_user_model().objects.filter(username__startswith="seed-user-").count(), 5)
+
+
+class CharacterQuestFactoryTest(TestCase):
+    """Teste die Factory mit ihrer Character-SubFactory."""
+
+    def test_factory_creates_character(self) -> None:
+        """Teste, ob die CharacterQuestFactory einen Charakter samt Benutzer erzeugt."""
+        character_quest = CharacterQuestFactory()
+        self.assertIsNotNone(character_quest.character.user_id)
+        self.assertTrue(character_quest.character.user.check_password("chorequest"))
@@ -26,6 +26,8 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from .views import CacheMetricsView
+
 schema_view = get_schema_view(
     openapi.Info(
         title="Meine API",
@@ -60,6 +62,12 @@ urlpatterns = [
         name="password_reset_complete",
     ),
     path("", include("character.urls")),
+    path("", include("quest.urls")),
+    path("", include("search.urls")),
+    path("", include("household.urls")),
+    path("", include("analytics.urls")),
+    path("", include("backup.urls")),
+    path("api/metrics/cache/", CacheMetricsView.as_view(), name="cache_metrics"),
 ]
 
 if settings.DEBUG:
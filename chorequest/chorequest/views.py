@@ -0,0 +1,18 @@
+"""Module contains the project wide operational views of the ChoreQuest API."""
+
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cache import cache_metrics
+
+
+class CacheMetricsView(APIView):
+    """API View exposing the cache hit/miss counters of the serving process."""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request: Request) -> Response:  # noqa: ARG002
+        """Return the counters per cache namespace."""
+        return Response(cache_metrics.snapshot())
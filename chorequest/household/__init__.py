@@ -0,0 +1 @@
+"""Households grouping players and their characters."""
@@ -0,0 +1,32 @@
+"""Admin configuration for the household app."""
+
+from django.contrib import admin
+
+from .models import Household, HouseholdInvite, HouseholdMembership
+
+
+class HouseholdMembershipInline(admin.TabularInline):
+    """Inline for the members of a household."""
+
+    model = HouseholdMembership
+    extra = 0
+    autocomplete_fields = ("user",)
+
+
+class HouseholdInviteInline(admin.TabularInline):
+    """Inline for the pending invitations of a household."""
+
+    model = HouseholdInvite
+    fk_name = "household"
+    extra = 0
+    autocomplete_fields = ("user", "invited_by")
+
+
+@admin.register(Household)
+class HouseholdAdmin(admin.ModelAdmin):
+    """Admin configuration for the Household model."""
+
+    list_display = ("name", "created_at")
+    search_fields = ("name",)
+    ordering = ("-created_at",)
+    inlines = (HouseholdMembershipInline, HouseholdInviteInline)
@@ -0,0 +1,10 @@
+"""Module contains the configuration for the household app."""
+
+from django.apps import AppConfig
+
+
+class HouseholdConfig(AppConfig):
+    """Configuration for the household app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "household"
@@ -0,0 +1,30 @@
+"""Factories for household models using factory_boy."""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from household.models import Household, HouseholdMembership, HouseholdRole
+
+
+class HouseholdFactory(DjangoModelFactory):
+    """Factory for Household model."""
+
+    name = factory.Faker("last_name")
+
+    class Meta:
+        """Meta information for the HouseholdFactory."""
+
+        model = Household
+
+
+class HouseholdMembershipFactory(DjangoModelFactory):
+    """Factory for HouseholdMembership model."""
+
+    household = factory.SubFactory(HouseholdFactory)
+    user = factory.SubFactory("user.factories.UserAccountFactory")
+    role = HouseholdRole.MEMBER
+
+    class Meta:
+        """Meta information for the HouseholdMembershipFactory."""
+
+        model = HouseholdMembership
@@ -0,0 +1 @@
+"""Initializes the migrations of the household module."""
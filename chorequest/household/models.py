@@ -0,0 +1,74 @@
+"""
+Models of the household app.
+
+A ``Household`` groups the accounts of a family, flat share or dorm; the
+characters of its members are the characters of the household.  Owners
+invite users with a ``HouseholdInvite``; only the invited user can turn it
+into a membership.
+"""
+
+from typing import ClassVar
+
+from django.conf import settings
+from django.db import models
+
+
+class HouseholdRole(models.TextChoices):
+    """Roles of a household member."""
+
+    OWNER = "owner", "Owner"
+    MEMBER = "member", "Member"
+
+
+class Household(models.Model):
+    """A group of players sharing chores."""
+
+    name = models.CharField(max_length=100)
+    members = models.ManyToManyField(settings.AUTH_USER_MODEL, through="HouseholdMembership", related_name="households")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        """Return the string representation of the household."""
+        return self.name
+
+
+class HouseholdMembership(models.Model):
+    """Membership of a user in a household."""
+
+    household = models.ForeignKey(Household, on_delete=models.CASCADE, related_name="memberships")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="household_memberships")
+    role = models.CharField(max_length=20, choices=HouseholdRole.choices, default=HouseholdRole.MEMBER)
+    joined_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta information for the HouseholdMembership model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(fields=["household", "user"], name="unique_household_member"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the membership."""
+        return f"{self.user_id} in {self.household_id} ({self.role})"
+
+
+class HouseholdInvite(models.Model):
+    """Pending invitation of a user into a household."""
+
+    household = models.ForeignKey(Household, on_delete=models.CASCADE, related_name="invites")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="household_invites")
+    invited_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta information for the HouseholdInvite model."""
+
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(fields=["household", "user"], name="unique_household_invite"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the string representation of the invite."""
+        return f"{self.user_id} invited to {self.household_id}"
@@ -0,0 +1,60 @@
+"""Serializers for the household app."""
+
+from typing import ClassVar
+
+from quest.models import Quest
+from rest_framework import serializers
+
+from .models import Household, HouseholdInvite, HouseholdMembership
+
+
+class HouseholdMembershipSerializer(serializers.ModelSerializer):
+    """Serializer für die Mitglieder eines Haushalts."""
+
+    username = serializers.CharField(source="user.username", read_only=True)
+
+    class Meta:
+        """Meta class for HouseholdMembershipSerializer."""
+
+        model = HouseholdMembership
+        fields: ClassVar[list[str]] = ["user", "username", "role", "joined_at"]
+        read_only_fields: ClassVar[list[str]] = ["role", "joined_at"]
+
+
+class HouseholdInviteSerializer(serializers.ModelSerializer):
+    """Serializer für offene Einladungen in einen Haushalt."""
+
+    username = serializers.CharField(source="user.username", read_only=True)
+    household_name = serializers.CharField(source="household.name", read_only=True)
+
+    class Meta:
+        """Meta class for HouseholdInviteSerializer."""
+
+        model = HouseholdInvite
+        fields: ClassVar[list[str]] = ["household", "household_name", "user", "username", "invited_by", "created_at"]
+        read_only_fields: ClassVar[list[str]] = fields
+
+
+class HouseholdSerializer(serializers.ModelSerializer):
+    """Serializer für Haushalte mit ihren Mitgliedern und offenen Einladungen."""
+
+    members = HouseholdMembershipSerializer(source="memberships", many=True, read_only=True)
+    invites = HouseholdInviteSerializer(many=True, read_only=True)
+
+    class Meta:
+        """Meta class for HouseholdSerializer."""
+
+        model = Household
+        fields: ClassVar[list[str]] = ["id", "name", "created_at", "members", "invites"]
+
+
+class AddMembersSerializer(serializers.Serializer):
+    """Eingabe für das Einladen von Benutzern in einen Haushalt."""
+
+    users = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000)
+
+
+class AssignQuestSerializer(serializers.Serializer):
+    """Eingabe für die Zuweisung einer Quest an alle Charaktere eines Haushalts."""
+
+    quest = serializers.PrimaryKeyRelatedField(queryset=Quest.objects.all())
@@ -0,0 +1,79 @@
+"""
+Household operations that touch the characters of all members at once.
+
+:func:`assign_quest` fans a quest out to every character of a household with
+one ``SELECT`` for the missing assignments and one batched ``INSERT``;
+``ignore_conflicts`` lets the ``(character, quest)`` unique constraint drop
+rows a concurrent assignment inserted first.  The returned count and the
+published events therefore cover the attempted assignments; rows dropped
+that way are counted as well, and their characters get a second event with
+the same ``open``/``0`` state.  :func:`quest_board` aggregates
+the assignments of the household per quest in a single ``GROUP BY``.
+"""
+
+from typing import TYPE_CHECKING
+
+from character.events import publish_character_events
+from character.models import Character
+from django.db import transaction
+from django.db.models import Count, Q
+from quest.models import CharacterQuest
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+ASSIGN_BATCH_SIZE = 2000
+
+
+def household_characters(household_id: int) -> "QuerySet[Character]":
+    """Return the characters of all members of a household."""
+    return Character.objects.filter(user__household_memberships__household_id=household_id)
+
+
+def assign_quest(household_id: int, quest_id: int, batch_size: int = ASSIGN_BATCH_SIZE) -> int:
+    """
+    Weist eine Quest allen Charakteren eines Haushalts zu und gibt die Zahl versuchter Zuweisungen zurück.
+
+    Charaktere, denen die Quest bereits zugewiesen ist, werden übersprungen,
+    sodass wiederholte Aufrufe idempotent sind.  Zeilen, die eine gleichzeitige
+    Zuweisung zuerst eingefügt hat, verwirft die Datenbank stillschweigend; sie
+    sind in der Zahl trotzdem enthalten.
+    """
+    character_ids = list(
+        household_characters(household_id)
+        .exclude(pk__in=CharacterQuest.objects.filter(quest_id=quest_id).values("character_id"))
+        .values_list("pk", flat=True),
+    )
+    rows = [CharacterQuest(character_id=character_id, quest_id=quest_id) for character_id in character_ids]
+    with transaction.atomic():
+        CharacterQuest.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+        # Die Quest-Id identifiziert die Zuweisung, (character, quest) ist eindeutig
+        publish_character_events(character_ids, "quest", {"quest": quest_id, "status": "open", "progress": 0})
+    return len(rows)
+
+
+def quest_board(household_id: int) -> list[dict]:
+    """Gib pro Quest des Haushalts die Zahl der offenen, angenommenen und abgeschlossenen Zuweisungen zurück."""
+    board = (
+        CharacterQuest.objects.filter(character__user__household_memberships__household_id=household_id)
+        .values("quest_id", "quest__name", "quest__due_date")
+        .annotate(
+            assigned=Count("id"),
+            open=Count("id", filter=Q(status="open")),
+            accepted=Count("id", filter=Q(status="accepted")),
+            completed=Count("id", filter=Q(status="completed")),
+        )
+        .order_by("quest__due_date", "quest_id")
+    )
+    return [
+        {
+            "quest": row["quest_id"],
+            "name": row["quest__name"],
+            "due_date": row["quest__due_date"],
+            "assigned": row["assigned"],
+            "open": row["open"],
+            "accepted": row["accepted"],
+            "completed": row["completed"],
+        }
+        for row in board
+    ]
@@ -0,0 +1,7 @@
+"""Initializes the Django environment for the tests of the household module."""
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chorequest.settings")
+django.setup()
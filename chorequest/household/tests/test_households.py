@@ -0,0 +1,188 @@
+"""Tests for households, the quest fan-out and the household quest board."""
+
+from character.factories import CharacterFactory
+from django.test import TestCase
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.models import CharacterQuest
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.factories import UserAccountFactory
+from user.tokens import ChoreQuestRefreshToken
+
+from household.factories import HouseholdFactory, HouseholdMembershipFactory
+from household.models import HouseholdInvite, HouseholdMembership, HouseholdRole
+from household.services import assign_quest, quest_board
+
+
+class AssignQuestTest(TestCase):
+    """Teste die Zuweisung einer Quest an alle Charaktere eines Haushalts."""
+
+    def setUp(self) -> None:
+        """Erstelle einen Haushalt mit zwei Mitgliedern und drei Charakteren."""
+        self.household = HouseholdFactory()
+        self.characters = []
+        for count in (2, 1):
+            membership = HouseholdMembershipFactory(household=self.household)
+            self.characters += [CharacterFactory(user=membership.user) for _ in range(count)]
+        self.outsider = CharacterFactory()
+        self.quest = QuestFactory()
+
+    def test_assigns_every_member_character(self) -> None:
+        """Teste, ob genau die Charaktere der Mitglieder die Quest erhalten."""
+        self.assertEqual(assign_quest(self.household.pk, self.quest.pk), 3)
+
+        self.assertEqual(
+            set(CharacterQuest.objects.filter(quest=self.quest).values_list("character_id", flat=True)),
+            {character.pk for character in self.characters},
+        )
+        self.assertEqual(CharacterQuest.objects.filter(quest=self.quest, status="open").count(), 3)
+
+    def test_existing_assignments_are_kept(self) -> None:
+        """Teste, ob bestehende Zuweisungen erhalten bleiben und erneute Aufrufe nichts anlegen."""
+        existing = CharacterQuestFactory(character=self.characters[0], quest=self.quest, status="accepted")
+
+        self.assertEqual(assign_quest(self.household.pk, self.quest.pk), 2)
+        self.assertEqual(assign_quest(self.household.pk, self.quest.pk), 0)
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.status, "accepted")
+        self.assertEqual(CharacterQuest.objects.filter(quest=self.quest).count(), 3)
+
+    def test_constant_queries(self) -> None:
+        """Teste, ob die Zahl der Queries nicht von der Zahl der Charaktere abhängt."""
+        for _ in range(20):
+            CharacterFactory(user=self.characters[0].user)
+
+        # SELECT, SAVEPOINT, INSERT, RELEASE
+        with self.assertNumQueries(4):
+            self.assertEqual(assign_quest(self.household.pk, self.quest.pk), 23)
+
+    def test_quest_board(self) -> None:
+        """Teste, ob das Board die Zuweisungen des Haushalts pro Quest und Status zählt."""
+        assign_quest(self.household.pk, self.quest.pk)
+        CharacterQuest.objects.filter(character=self.characters[0], quest=self.quest).update(status="completed")
+        CharacterQuestFactory(character=self.outsider, quest=self.quest, status="open")
+        chore = QuestFactory()
+        CharacterQuestFactory(character=self.characters[2], quest=chore, status="accepted")
+
+        with self.assertNumQueries(1):
+            board = {row["quest"]: row for row in quest_board(self.household.pk)}
+
+        self.assertEqual(
+            {key: board[self.quest.pk][key] for key in ("assigned", "open", "accepted", "completed")},
+            {"assigned": 3, "open": 2, "accepted": 0, "completed": 1},
+        )
+        self.assertEqual((board[chore.pk]["assigned"], board[chore.pk]["accepted"]), (1, 1))
+
+
+class HouseholdViewTest(APITestCase):
+    """Teste die Endpunkte für Haushalte."""
+
+    def setUp(self) -> None:
+        """Erstelle einen angemeldeten Besitzer eines Haushalts mit einem Charakter."""
+        self.owner = UserAccountFactory()
+        self.household = HouseholdFactory()
+        HouseholdMembershipFactory(household=self.household, user=self.owner, role=HouseholdRole.OWNER)
+        self.character = CharacterFactory(user=self.owner)
+        self.login(self.owner)
+
+    def login(self, user: object) -> None:
+        """Melde einen Benutzer mit einem Access Token an."""
+        token = ChoreQuestRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_create_makes_owner(self) -> None:
+        """Teste, ob der Ersteller eines Haushalts sein Besitzer wird."""
+        response = self.client.post("/api/households/", {"name": "WG"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["members"][0]["user"], self.owner.pk)
+        self.assertEqual(response.data["members"][0]["role"], HouseholdRole.OWNER)
+
+    def test_list_only_own_households(self) -> None:
+        """Teste, ob nur Haushalte gelistet werden, in denen der Benutzer Mitglied ist."""
+        HouseholdFactory()
+
+        response = self.client.get("/api/households/")
+
+        self.assertEqual([entry["id"] for entry in response.data], [self.household.pk])
+
+    def test_invite_accept_and_assign(self) -> None:
+        """Teste Einladung, Annahme durch den Eingeladenen und die Zuweisung einer Quest."""
+        member = UserAccountFactory()
+        CharacterFactory(user=member)
+        quest = QuestFactory()
+
+        response = self.client.post(
+            f"/api/households/{self.household.pk}/members/", {"users": [member.pk, self.owner.pk]}, format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["members"]), 1)
+        self.assertEqual([invite["user"] for invite in response.data["invites"]], [member.pk])
+        self.assertEqual(
+            HouseholdMembership.objects.get(household=self.household, user=self.owner).role, HouseholdRole.OWNER,
+        )
+
+        self.login(member)
+        self.assertEqual(
+            [invite["household"] for invite in self.client.get("/api/households/invitations/").data],
+            [self.household.pk],
+        )
+        response = self.client.post(f"/api/households/{self.household.pk}/accept/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["members"]), 2)
+        self.assertEqual(response.data["invites"], [])
+        self.login(self.owner)
+
+        response = self.client.post(f"/api/households/{self.household.pk}/assign/", {"quest": quest.pk})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {"attempted": 2})
+
+        response = self.client.get(f"/api/households/{self.household.pk}/board/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(row["quest"], row["open"]) for row in response.data], [(quest.pk, 2)])
+
+    def test_members_cannot_assign(self) -> None:
+        """Teste, ob nur der Besitzer Quests zuweisen darf, Mitglieder aber das Board sehen."""
+        member = HouseholdMembershipFactory(household=self.household).user
+        self.login(member)
+
+        response = self.client.post(f"/api/households/{self.household.pk}/assign/", {"quest": QuestFactory().pk})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get(f"/api/households/{self.household.pk}/board/").status_code, status.HTTP_200_OK)
+
+    def test_foreign_household(self) -> None:
+        """Teste, ob fremde Haushalte nicht sichtbar sind."""
+        response = self.client.get(f"/api/households/{HouseholdFactory().pk}/board/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invite_does_not_add_member(self) -> None:
+        """Teste, ob Eingeladene vor der Annahme weder Mitglied sind noch Quests erhalten."""
+        invited = UserAccountFactory()
+        CharacterFactory(user=invited)
+        self.client.post(f"/api/households/{self.household.pk}/members/", {"users": [invited.pk]}, format="json")
+
+        self.assertFalse(HouseholdMembership.objects.filter(user=invited).exists())
+        response = self.client.post(f"/api/households/{self.household.pk}/assign/", {"quest": QuestFactory().pk})
+        self.assertEqual(response.data, {"attempted": 1})
+
+    def test_decline_invite(self) -> None:
+        """Teste, ob eine abgelehnte Einladung verschwindet und nicht mehr angenommen werden kann."""
+        invited = UserAccountFactory()
+        HouseholdInvite.objects.create(household=self.household, user=invited, invited_by=self.owner)
+        self.login(invited)
+
+        response = self.client.post(f"/api/households/{self.household.pk}/decline/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.post(f"/api/households/{self.household.pk}/accept/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(HouseholdMembership.objects.filter(user=invited).exists())
+
+    def test_accept_without_invite(self) -> None:
+        """Teste, ob niemand einem Haushalt ohne Einladung beitreten kann."""
+        self.login(UserAccountFactory())
+
+        response = self.client.post(f"/api/households/{self.household.pk}/accept/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
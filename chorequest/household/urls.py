@@ -0,0 +1,13 @@
+"""URL configuration for the household app."""
+
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import HouseholdViewSet
+
+router = DefaultRouter()
+router.register(r"households", HouseholdViewSet, basename="household")
+
+urlpatterns = [
+    path("api/", include(router.urls)),
+]
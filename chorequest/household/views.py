@@ -0,0 +1,121 @@
+"""Views for the households of the current user."""
+
+from typing import ClassVar
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.query import QuerySet
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import Household, HouseholdInvite, HouseholdMembership, HouseholdRole
+from .serializers import AddMembersSerializer, AssignQuestSerializer, HouseholdInviteSerializer, HouseholdSerializer
+from .services import assign_quest, quest_board
+
+
+class HouseholdViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """ViewSet für die Haushalte des aktuellen Benutzers."""
+
+    permission_classes: ClassVar[list] = [IsAuthenticated]
+    serializer_class = HouseholdSerializer
+
+    def get_queryset(self) -> QuerySet:
+        """Gib nur die Haushalte zurück, in denen der Benutzer Mitglied ist (oder eingeladen für accept/decline)."""
+        if self.action in {"accept", "decline"}:
+            households = Household.objects.filter(invites__user_id=self.request.user.pk)
+        else:
+            households = Household.objects.filter(memberships__user_id=self.request.user.pk)
+        return households.prefetch_related("memberships__user", "invites__user").order_by("id")
+
+    def perform_create(self, serializer: HouseholdSerializer) -> None:
+        """Lege den Haushalt an; der Ersteller wird sein Besitzer."""
+        with transaction.atomic():
+            household = serializer.save()
+            HouseholdMembership.objects.create(
+                household=household, user_id=self.request.user.pk, role=HouseholdRole.OWNER,
+            )
+
+    def get_owned_object(self) -> Household:
+        """Gib den Haushalt zurück, wenn der Benutzer sein Besitzer ist."""
+        household = self.get_object()
+        if not household.memberships.filter(user_id=self.request.user.pk, role=HouseholdRole.OWNER).exists():
+            msg = "Only the owner of the household can do this."
+            raise PermissionDenied(msg)
+        return household
+
+    @action(detail=True, methods=["post"])
+    def members(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """
+        Lade bestehende Benutzer in den Haushalt ein.
+
+        Mitglied wird erst, wer die Einladung annimmt; Mitglieder und bereits
+        Eingeladene bleiben unverändert.
+        """
+        household = self.get_owned_object()
+        serializer = AddMembersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user_ids = (
+            get_user_model()
+            .objects.filter(pk__in=serializer.validated_data["users"])
+            .exclude(household_memberships__household=household)
+            .values_list("pk", flat=True)
+        )
+        HouseholdInvite.objects.bulk_create(
+            [
+                HouseholdInvite(household=household, user_id=user_id, invited_by_id=request.user.pk)
+                for user_id in user_ids
+            ],
+            ignore_conflicts=True,
+        )
+        return Response(self.get_serializer(self.get_object()).data)
+
+    @action(detail=False, methods=["get"])
+    def invitations(self, request: Request) -> Response:
+        """Gib die offenen Einladungen des Benutzers zurück."""
+        invites = HouseholdInvite.objects.filter(user_id=request.user.pk).select_related("household", "user")
+        return Response(HouseholdInviteSerializer(invites.order_by("id"), many=True).data)
+
+    @action(detail=True, methods=["post"])
+    def accept(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Nimm die Einladung in den Haushalt an und werde Mitglied."""
+        household = self.get_object()
+        with transaction.atomic():
+            deleted, _per_model = HouseholdInvite.objects.filter(household=household, user_id=request.user.pk).delete()
+            if not deleted:
+                msg = "No invitation into this household."
+                raise NotFound(msg)
+            HouseholdMembership.objects.get_or_create(household=household, user_id=request.user.pk)
+        # Leert auch die vorab geladenen Mitglieder und Einladungen
+        household.refresh_from_db()
+        return Response(self.get_serializer(household).data)
+
+    @action(detail=True, methods=["post"])
+    def decline(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Lehne die Einladung in den Haushalt ab."""
+        household = self.get_object()
+        HouseholdInvite.objects.filter(household=household, user_id=request.user.pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["post"])
+    def assign(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Weise eine Quest allen Charakteren des Haushalts zu."""
+        household = self.get_owned_object()
+        serializer = AssignQuestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        attempted = assign_quest(household.pk, serializer.validated_data["quest"].pk)
+        return Response({"attempted": attempted}, status=status.HTTP_201_CREATED if attempted else status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"])
+    def board(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Gib das Quest-Board des Haushalts zurück."""
+        household = self.get_object()
+        return Response(quest_board(household.pk))
@@ -9,20 +9,26 @@ Filepath: ChoreQuest/chorequest/quest/admin.py
 Classes:
     QuestAdmin: Admin configuration for the Quest model.
     CharacterQuestAdmin: Admin configuration for the CharacterQuest model.
+    ArchivedCharacterQuestAdmin: Read-only admin for the archived CharacterQuest rows.
     QuestRewardAdmin: Admin configuration for the QuestReward model.
     QuestRewardItemLootAdmin: Admin configuration for the QuestRewardItemLoot model.
     LootTableAdmin: Admin configuration for the LootTable model.
 """
 
+from chorequest.admin_utils import EstimatedCountPaginator, range_filter
 from django.contrib import admin
+from search.mixins import FullTextSearchMixin
 
-from .models import CharacterQuest, LootTable, Quest, QuestRewardItemLoot
+from .models import ArchivedCharacterQuest, CharacterQuest, LootTable, Quest, QuestRewardItemLoot
+
+PROGRESS_BUCKETS = [(0, 1), (1, 50), (50, 100), (100, None)]
 
 
 @admin.register(Quest)
-class QuestAdmin(admin.ModelAdmin):
-    """Admin configuration for the Quest model."""
+class QuestAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    """Admin configuration for the Quest model; the search uses the full-text index."""
 
+    search_kind = "quest"
     list_display = ("name", "due_date", "is_active", "created_at", "updated_at")
     list_filter = ("is_active", "due_date", "created_at")
     search_fields = ("name", "description")
@@ -35,9 +41,34 @@ class CharacterQuestAdmin(admin.ModelAdmin):
     """Admin configuration for the CharacterQuest model."""
 
     list_display = ("character", "quest", "status", "progress", "accepted_at", "completed_at")
-    list_filter = ("status", "accepted_at", "completed_at")
+    list_select_related = ("character", "quest")
+    list_filter = ("status", range_filter("progress", PROGRESS_BUCKETS), "accepted_at", "completed_at")
     search_fields = ("character__name", "quest__name")
+    autocomplete_fields = ("character", "quest")
     ordering = ("-accepted_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(ArchivedCharacterQuest)
+class ArchivedCharacterQuestAdmin(admin.ModelAdmin):
+    """Read-only admin for the archived CharacterQuest rows."""
+
+    list_display = ("character", "quest", "progress", "accepted_at", "completed_at", "archived_at")
+    list_select_related = ("character", "quest")
+    list_filter = ("completed_at", "archived_at")
+    search_fields = ("character__name", "quest__name")
+    ordering = ("-completed_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request: object) -> bool:  # noqa: ARG002
+        """Forbid adding, the archive is filled by ``archive_quests`` only."""
+        return False
+
+    def has_change_permission(self, request: object, obj: object = None) -> bool:  # noqa: ARG002
+        """Forbid changes, archived rows are history."""
+        return False
 
 
 @admin.register(QuestRewardItemLoot)
@@ -45,8 +76,10 @@ class QuestRewardItemLootAdmin(admin.ModelAdmin):
     """Admin configuration for the QuestRewardItemLoot model."""
 
     list_display = ("item", "quantity", "probability")
-    list_filter = ("item",)
+    list_select_related = ("item",)
+    list_filter = (("item", admin.RelatedOnlyFieldListFilter),)
     search_fields = ("item__name",)
+    autocomplete_fields = ("item",)
 
 
 @admin.register(LootTable)
@@ -15,3 +15,7 @@ class QuestConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "quest"
+
+    def ready(self) -> None:
+        """Connect the signal handlers of the quest app."""
+        from . import signals  # noqa: F401, PLC0415
@@ -0,0 +1,98 @@
+"""
+Hot/cold storage of the ``CharacterQuest`` history.
+
+Completed quests are only read again by reports and exports, but in the hot
+table they slow down every board, admin and progress query.
+:func:`archive_completed_quests` moves completed rows older than
+``QUEST_ARCHIVE_AFTER_DAYS`` into ``ArchivedCharacterQuest``: per range of
+``chunk_size`` ids one ``INSERT ... SELECT`` copies the rows and one
+``DELETE`` with the same condition removes them, both in one short
+transaction, so no rows are loaded into Python and locks are held briefly.
+
+Readers of the full history (analytics, export) use :func:`quest_history`,
+which runs the same query on both tables and combines them with
+``UNION ALL``.
+
+An archived assignment no longer blocks assigning the same quest to the
+character again.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from chorequest.db import pk_ranges
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import DateTimeField, QuerySet, Value
+from django.utils import timezone
+
+from .models import ArchivedCharacterQuest, CharacterQuest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ARCHIVED_FIELDS = ("id", "character", "quest", "status", "progress", "accepted_at", "completed_at")
+
+
+@dataclass
+class ArchiveResult:
+    """Counters and timing of an archive run."""
+
+    archived: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+
+def get_archive_cutoff(days: "int | None" = None) -> datetime:
+    """Return the completion time before which quests are archived."""
+    if days is None:
+        days = getattr(settings, "QUEST_ARCHIVE_AFTER_DAYS", 180)
+    return timezone.now() - timedelta(days=days)
+
+
+def quest_history(build: "Callable[[QuerySet], QuerySet]") -> QuerySet:
+    """
+    Return ``build`` applied to the hot and the archive table, combined with ``UNION ALL``.
+
+    ``build`` receives a queryset of either model (both have the same field
+    names) and must return a ``values()``/``values_list()`` queryset without
+    ordering; order the combined queryset by its selected columns only.
+    """
+    return build(CharacterQuest.objects.all()).union(build(ArchivedCharacterQuest.objects.all()), all=True)
+
+
+def _insert_select_sql(rows: QuerySet, archived_at: datetime) -> tuple[str, tuple]:
+    """Return the ``INSERT INTO archive ... SELECT`` statement copying ``rows``."""
+    select = rows.annotate(archived=Value(archived_at, output_field=DateTimeField())).values_list(
+        *ARCHIVED_FIELDS, "archived",
+    )
+    select_sql, params = select.query.sql_with_params()
+    meta = ArchivedCharacterQuest._meta  # noqa: SLF001
+    columns = [meta.get_field(name).column for name in (*ARCHIVED_FIELDS, "archived_at")]
+    quote = connection.ops.quote_name
+    return f"INSERT INTO {quote(meta.db_table)} ({', '.join(map(quote, columns))}) {select_sql}", params
+
+
+def archive_completed_quests(before: datetime, chunk_size: int = 5000) -> ArchiveResult:
+    """Move the quests completed before ``before`` into the archive, ``chunk_size`` ids per transaction."""
+    result = ArchiveResult()
+    start = time.perf_counter()
+    candidates = CharacterQuest.objects.filter(status="completed", completed_at__lt=before)
+    archived_at = timezone.now()
+    for low, high in pk_ranges(candidates, chunk_size):
+        rows = candidates.filter(pk__range=(low, high))
+        sql, params = _insert_select_sql(rows, archived_at)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            # Ohne Signale und abhängige Zeilen ist das ein einzelnes DELETE
+            deleted, _per_model = rows.delete()
+            if deleted != cursor.rowcount:
+                # Eine Zeile hat sich zwischen Kopieren und Löschen geändert: Block zurückrollen
+                msg = f"Archiving ids {low}-{high} copied {cursor.rowcount} rows but deleted {deleted}."
+                raise DatabaseError(msg)
+        result.archived += deleted
+        result.chunks += 1
+    result.seconds = time.perf_counter() - start
+    return result
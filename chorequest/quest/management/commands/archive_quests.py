@@ -0,0 +1,38 @@
+"""
+Management command moving old completed quests into the archive.
+
+Keeps the ``CharacterQuest`` table to open, accepted and recently completed
+rows, e.g. run nightly::
+
+    python manage.py archive_quests --older-than-days 180 --chunk-size 5000
+"""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from quest.archive import archive_completed_quests, get_archive_cutoff
+
+
+class Command(BaseCommand):
+    """Archive completed quests older than the configured age."""
+
+    help = "Move completed character quests older than QUEST_ARCHIVE_AFTER_DAYS into the archive table."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument(
+            "--older-than-days", type=int, default=None, help="Age in days (default: QUEST_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Ids moved per transaction.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Run the archival and report the result."""
+        before = get_archive_cutoff(options["older_than_days"])
+        result = archive_completed_quests(before, options["chunk_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {result.archived} quests completed before {before:%Y-%m-%d} "
+                f"in {result.chunks} chunks ({result.seconds:.2f}s).",
+            ),
+        )
@@ -0,0 +1,58 @@
+"""
+Migration adding the archive of completed character quests.
+
+Generated by Django 5.2 on 2026-10-19 11:40
+
+Nothing is moved here; run ``python manage.py archive_quests`` afterwards.
+"""
+
+from typing import ClassVar
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration creates ArchivedCharacterQuest and the index of completed quests."""
+
+    dependencies: ClassVar[list] = [
+        ("character", "0009_character_unique_active_character"),
+        ("quest", "0001_initial"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.CreateModel(
+            name="ArchivedCharacterQuest",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("status", models.CharField(default="completed", max_length=50)),
+                ("progress", models.IntegerField(default=100)),
+                ("accepted_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField()),
+                (
+                    "character",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_quests",
+                        to="character.character",
+                    ),
+                ),
+                (
+                    "quest",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="quest.quest",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["character", "completed_at"], name="archived_quest_character_idx")],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="characterquest",
+            index=models.Index(
+                condition=models.Q(("status", "completed")), fields=["completed_at"], name="characterquest_done_idx",
+            ),
+        ),
+    ]
@@ -8,6 +8,7 @@ It includes the following models:
 
 - Quest: Represents a task or activity that needs to be completed.
 - CharacterQuest: Tracks the relationship between a character and a quest.
+- ArchivedCharacterQuest: Completed CharacterQuest rows moved out of the hot table.
 - QuestReward: Defines the rewards for completing a quest.
 - QuestRewardItemLoot: Defines specific item loot for a quest reward.
 - LootTable: Defines conditions for advanced loot logic.
@@ -15,6 +16,8 @@ It includes the following models:
 Each model includes fields and methods relevant to its purpose within the quest system.
 """
 
+from typing import ClassVar
+
 from django.db import models
 from django.utils import timezone
 
@@ -59,12 +62,47 @@ class CharacterQuest(models.Model):
         """Meta information for CharacterQuest model."""
 
         unique_together = ("character", "quest")
+        indexes: ClassVar[list] = [
+            # Partieller Index: Kandidaten von archive_quests ohne Scan der offenen Quests
+            models.Index(
+                fields=["completed_at"], condition=models.Q(status="completed"), name="characterquest_done_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         """Return a string representation of the CharacterQuest."""
         return f"{self.character.name} - {self.quest.name} ({self.status})"
 
 
+class ArchivedCharacterQuest(models.Model):
+    """
+    A completed CharacterQuest moved to the archive by ``archive_quests``.
+
+    Keeps the id and the columns of the original row; read it together with
+    the hot table through :func:`quest.archive.quest_history`.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    character = models.ForeignKey("character.Character", on_delete=models.CASCADE, related_name="archived_quests")
+    quest = models.ForeignKey(Quest, on_delete=models.CASCADE, related_name="+")
+    status = models.CharField(max_length=50, default="completed")
+    progress = models.IntegerField(default=100)
+    accepted_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        """Meta information for ArchivedCharacterQuest model."""
+
+        indexes: ClassVar[list] = [
+            models.Index(fields=["character", "completed_at"], name="archived_quest_character_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return a string representation of the ArchivedCharacterQuest."""
+        return f"{self.character.name} - {self.quest.name} (archived)"
+
+
 class QuestRewardItemLoot(models.Model):
     """Defines specific item loot for a quest reward."""
 
@@ -0,0 +1,206 @@
+"""
+Write-behind buffer for ``CharacterQuest.progress``.
+
+Timers and sensors report progress in many small increments.  Instead of one
+row save per report, :func:`record_progress` adds the increment to a
+process-local buffer that sums them per ``CharacterQuest``.
+:func:`flush_progress` writes all buffered quests at once:
+
+1. the affected, unfinished rows are locked and read in one query,
+2. the increments are applied (capped at 100) and written with one
+   ``bulk_update``,
+3. rows that reached ``QUEST_COMPLETION_THRESHOLD`` are completed through
+   :func:`quest.services.complete_quest`, so rewards are paid exactly once.
+
+The buffer is flushed ``QUEST_PROGRESS_FLUSH_INTERVAL`` seconds after the first
+buffered increment, as soon as a report would reach the threshold, when more
+than ``QUEST_PROGRESS_MAX_PENDING`` quests are buffered and at interpreter
+exit.  ``QUEST_PROGRESS_DURABILITY`` chooses the guarantee:
+
+``buffered``
+    increments of the last interval are lost if the worker crashes,
+``immediate``
+    every report is flushed before the request returns (no loss, no coalescing).
+
+Increments are added to the stored value, so the buffers of several workers
+combine correctly.
+"""
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from character.events import publish_character_event
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import CharacterQuest
+from .services import complete_quest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+MAX_PROGRESS = 100
+
+
+@dataclass
+class FlushResult:
+    """Counters of a flush."""
+
+    updated: int = 0
+    completed: int = 0
+
+
+class ProgressBuffer:
+    """Thread-safe sum of the buffered progress increments per ``CharacterQuest`` of this process."""
+
+    def __init__(self) -> None:
+        """Start with an empty buffer and no scheduled flush."""
+        self._lock = threading.Lock()
+        self._pending: dict[int, int] = {}
+        self._timer: threading.Timer | None = None
+
+    def add(self, character_quest_id: int, increment: int) -> int:
+        """Buffer ``increment`` and return the buffered total of the quest."""
+        with self._lock:
+            total = self._pending.get(character_quest_id, 0) + increment
+            self._pending[character_quest_id] = total
+            return total
+
+    def pending(self, character_quest_id: int) -> int:
+        """Return the buffered total of a quest."""
+        with self._lock:
+            return self._pending.get(character_quest_id, 0)
+
+    def drain(self) -> dict[int, int]:
+        """Return all buffered totals and empty the buffer."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending
+
+    def restore(self, pending: dict[int, int]) -> None:
+        """Put the totals of a failed flush back into the buffer."""
+        with self._lock:
+            for character_quest_id, increment in pending.items():
+                self._pending[character_quest_id] = self._pending.get(character_quest_id, 0) + increment
+
+    def schedule(self, interval: float, callback: "Callable[[], None]") -> None:
+        """Run ``callback`` in ``interval`` seconds unless a run is already scheduled."""
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(interval, self._run, (callback,))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def cancel(self) -> None:
+        """Cancel the scheduled run."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _run(self, callback: "Callable[[], None]") -> None:
+        """Clear the timer, then run ``callback``."""
+        with self._lock:
+            self._timer = None
+        callback()
+
+    def __len__(self) -> int:
+        """Return the number of buffered quests."""
+        with self._lock:
+            return len(self._pending)
+
+
+progress_buffer = ProgressBuffer()
+
+
+def get_completion_threshold() -> int:
+    """Return the progress at which a quest is completed."""
+    return getattr(settings, "QUEST_COMPLETION_THRESHOLD", MAX_PROGRESS)
+
+
+def get_flush_interval() -> float:
+    """Return the seconds between the first buffered increment and the flush."""
+    return getattr(settings, "QUEST_PROGRESS_FLUSH_INTERVAL", 5)
+
+
+def record_progress(character_quest: CharacterQuest, increment: int) -> bool:
+    """
+    Buffer a progress increment of ``character_quest``; return ``True`` if it was written right away.
+
+    ``character_quest.progress`` is the stored progress the caller has loaded;
+    together with the buffered total it decides whether the threshold is
+    reached and the buffer must be flushed now.
+    """
+    total = progress_buffer.add(character_quest.pk, increment)
+    if (
+        getattr(settings, "QUEST_PROGRESS_DURABILITY", "buffered") == "immediate"
+        or character_quest.progress + total >= get_completion_threshold()
+        or len(progress_buffer) > getattr(settings, "QUEST_PROGRESS_MAX_PENDING", 10000)
+    ):
+        flush_progress()
+        return True
+    progress_buffer.schedule(get_flush_interval(), flush_in_background)
+    return False
+
+
+def flush_progress() -> FlushResult:
+    """Write all buffered increments and complete the quests that reached the threshold."""
+    pending = progress_buffer.drain()
+    if not pending:
+        return FlushResult()
+    threshold = get_completion_threshold()
+    try:
+        with transaction.atomic():
+            rows = list(
+                CharacterQuest.objects.select_for_update()
+                .filter(pk__in=list(pending))
+                .exclude(status="completed")
+                .only("id", "character_id", "quest_id", "status", "progress"),
+            )
+            for row in rows:
+                row.progress = min(row.progress + pending[row.pk], MAX_PROGRESS)
+            CharacterQuest.objects.bulk_update(rows, ["progress"])
+
+            completed = [row for row in rows if row.progress >= threshold]
+            for row in rows:
+                if row.progress < threshold:
+                    publish_character_event(
+                        row.character_id,
+                        "quest",
+                        {"id": row.pk, "quest": row.quest_id, "status": row.status, "progress": row.progress},
+                    )
+            for row in completed:
+                complete_quest(row.pk)
+    except Exception:
+        # Auch Fehler beim Abschließen dürfen die geleerten Inkremente nicht verwerfen
+        progress_buffer.restore(pending)
+        raise
+    return FlushResult(updated=len(rows), completed=len(completed))
+
+
+def flush_in_background() -> None:
+    """Flush from the timer thread; after a failure the restored increments are retried one interval later."""
+    try:
+        result = flush_progress()
+        logger.debug("Flushed progress of %d quests, completed %d.", result.updated, result.completed)
+    except Exception:
+        logger.exception("Flushing the quest progress failed, retrying in %s seconds.", get_flush_interval())
+        progress_buffer.schedule(get_flush_interval(), flush_in_background)
+    finally:
+        # Der Timer-Thread hat eine eigene Verbindung
+        connection.close()
+
+
+def flush_at_exit() -> None:
+    """Write what is left in the buffer when the worker shuts down."""
+    progress_buffer.cancel()
+    if len(progress_buffer):
+        flush_in_background()
+
+
+atexit.register(flush_at_exit)
@@ -0,0 +1,49 @@
+"""
+Module: quest.serializers.
+
+Filepath: ChoreQuest/chorequest/quest/serializers.py.
+
+Serializers for the quest API.
+"""
+
+from typing import ClassVar
+
+from rest_framework import serializers
+
+from .models import CharacterQuest, Quest
+
+
+class QuestSerializer(serializers.ModelSerializer):
+    """Serializer für die Quest-Daten."""
+
+    class Meta:
+        """Meta class for QuestSerializer."""
+
+        model = Quest
+        fields: ClassVar[list[str]] = ["id", "name", "description", "due_date", "experience_points", "gold"]
+
+
+class CharacterQuestSerializer(serializers.ModelSerializer):
+    """Serializer für die Quests eines Charakters."""
+
+    quest = QuestSerializer(read_only=True)
+
+    class Meta:
+        """Meta class for CharacterQuestSerializer."""
+
+        model = CharacterQuest
+        fields: ClassVar[list[str]] = ["id", "character", "quest", "status", "progress", "accepted_at", "completed_at"]
+        read_only_fields = fields
+
+
+class CharacterQuestFilterSerializer(serializers.Serializer):
+    """Query-Parameter der Questliste: Status (kommagetrennt) und Charakter."""
+
+    status = serializers.CharField(required=False)
+    character = serializers.IntegerField(min_value=1, required=False)
+
+
+class ProgressSerializer(serializers.Serializer):
+    """Eingabe für eine Fortschrittsmeldung in Prozentpunkten."""
+
+    increment = serializers.IntegerField(min_value=1, max_value=100)
@@ -0,0 +1,49 @@
+"""
+Module: quest.services.
+
+Filepath: ChoreQuest/chorequest/quest/services.py.
+
+Game actions on quests that change several rows at once.
+"""
+
+from analytics.rollups import record_completion
+from character.durability import decay_equipment
+from character.models import Character
+from django.db import transaction
+from django.utils import timezone
+
+from .models import CharacterQuest
+
+
+def complete_quest(character_quest_id: int) -> CharacterQuest:
+    """
+    Schließt eine Quest ab und schreibt dem Charakter Erfahrungspunkte und Gold gut.
+
+    Quest-Zeile und Charakter werden gesperrt, damit parallele Abschlüsse die
+    Belohnungen nicht doppelt vergeben.  Die ausgerüsteten Items nutzen
+    sich dabei ab, und der Abschluss wird in die Wochenstatistik
+    (``analytics.rollups``) übernommen.
+    """
+    with transaction.atomic():
+        character_quest = (
+            CharacterQuest.objects.select_for_update().select_related("quest").get(pk=character_quest_id)
+        )
+        if character_quest.status == "completed":
+            msg = "Quest already completed."
+            raise ValueError(msg)
+
+        now = timezone.now()
+        character_quest.status = "completed"
+        character_quest.progress = 100
+        character_quest.accepted_at = character_quest.accepted_at or now
+        character_quest.completed_at = now
+        character_quest.save(update_fields=["status", "progress", "accepted_at", "completed_at"])
+
+        character = Character.objects.select_for_update().get(pk=character_quest.character_id)
+        character.add_experience(character_quest.quest.experience_points)
+        character.gold += character_quest.quest.gold
+        character.save()
+        record_completion(character.pk, now, character_quest.quest.experience_points, character_quest.quest.gold)
+        decay_equipment(character.pk)
+        character_quest.character = character
+    return character_quest
@@ -0,0 +1,17 @@
+"""Signal handlers publishing quest changes to the event stream of the character."""
+
+from character.events import publish_character_event
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import CharacterQuest
+
+
+@receiver(post_save, sender=CharacterQuest)
+def character_quest_saved(sender: type[CharacterQuest], instance: CharacterQuest, **kwargs: object) -> None:  # noqa: ARG001
+    """Publish status and progress of a saved character quest."""
+    publish_character_event(
+        instance.character_id,
+        "quest",
+        {"id": instance.pk, "quest": instance.quest_id, "status": instance.status, "progress": instance.progress},
+    )
@@ -0,0 +1,50 @@
+"""Query-count tests for the changelists of the quest admin."""
+
+from character.factories import ItemFactory
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from user.factories import UserAccountFactory
+
+from quest.factories import CharacterQuestFactory
+from quest.models import QuestRewardItemLoot
+
+
+class ChangelistQueryCountTest(TestCase):
+    """Die Anzahl der Queries einer Changelist hängt nicht von der Zahl der Zeilen ab."""
+
+    def setUp(self) -> None:
+        """Melde einen Superuser am Admin an."""
+        self.client.force_login(UserAccountFactory(is_staff=True, is_superuser=True))
+
+    def add_rows(self, count: int) -> None:
+        """Erstelle ``count`` Charakterquests und Loot-Einträge."""
+        for _ in range(count):
+            CharacterQuestFactory()
+            QuestRewardItemLoot.objects.create(item=ItemFactory(), quantity=1, probability=0.5)
+
+    def count_queries(self, url: str) -> int:
+        """Rufe die Changelist auf und gib die Anzahl der Queries zurück."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assert_constant_queries(self, url: str) -> None:
+        """Prüfe, ob weitere Zeilen keine zusätzlichen Queries auslösen."""
+        self.add_rows(2)
+        few = self.count_queries(url)
+        self.add_rows(8)
+        self.assertEqual(self.count_queries(url), few)
+
+    def test_character_quest_changelist(self) -> None:
+        """Teste die Liste der Charakterquests, deren __str__ Charakter und Quest braucht."""
+        self.assert_constant_queries("/admin/quest/characterquest/")
+
+    def test_loot_changelist(self) -> None:
+        """Teste die Liste der Loot-Einträge."""
+        self.assert_constant_queries("/admin/quest/questrewarditemloot/")
+
+    def test_quest_changelist(self) -> None:
+        """Teste die Questliste."""
+        self.assert_constant_queries("/admin/quest/quest/")
@@ -0,0 +1,116 @@
+"""
+Module: quest.tests.test_archive.
+
+Filepath: ChoreQuest/chorequest/quest/tests/test_archive.py.
+Tests for moving completed quests into the archive and reading the full history.
+"""
+
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+
+from analytics.models import WeeklyCompletion
+from analytics.rollups import backfill_rollups
+from backup.export import export_records
+from character.factories import CharacterFactory
+from django.core.management import call_command
+from django.test import TestCase
+
+from quest.archive import archive_completed_quests, get_archive_cutoff, quest_history
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.models import ArchivedCharacterQuest, CharacterQuest
+
+CUTOFF = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+class ArchiveTest(TestCase):
+    """Tests for archive_completed_quests and quest_history."""
+
+    def setUp(self) -> None:
+        """Create old and recent completed quests and an open one for one character."""
+        self.character = CharacterFactory()
+        self.old = [
+            CharacterQuestFactory(
+                character=self.character,
+                quest=QuestFactory(experience_points=10, gold=1),
+                status="completed",
+                completed_at=CUTOFF - timedelta(days=days),
+            )
+            for days in (1, 2, 30)
+        ]
+        self.recent = CharacterQuestFactory(
+            character=self.character,
+            quest=QuestFactory(experience_points=20, gold=2),
+            status="completed",
+            completed_at=CUTOFF + timedelta(hours=1),
+        )
+        self.open = CharacterQuestFactory(character=self.character, status="open")
+
+    def test_moves_old_completed_quests(self) -> None:
+        """Old completed rows move with their ids, recent and open rows stay in the hot table."""
+        result = archive_completed_quests(CUTOFF, chunk_size=2)
+
+        self.assertEqual(result.archived, 3)
+        self.assertGreaterEqual(result.chunks, 2)
+        self.assertEqual(
+            set(CharacterQuest.objects.values_list("pk", flat=True)), {self.recent.pk, self.open.pk},
+        )
+        archived = ArchivedCharacterQuest.objects.get(pk=self.old[0].pk)
+        self.assertEqual(
+            (archived.character_id, archived.quest_id, archived.status, archived.completed_at),
+            (self.character.pk, self.old[0].quest_id, "completed", self.old[0].completed_at),
+        )
+        self.assertIsNotNone(archived.archived_at)
+
+    def test_second_run_is_a_noop(self) -> None:
+        """Running the archival again moves nothing."""
+        archive_completed_quests(CUTOFF)
+        self.assertEqual(archive_completed_quests(CUTOFF).archived, 0)
+        self.assertEqual(ArchivedCharacterQuest.objects.count(), 3)
+
+    def test_history_includes_archive(self) -> None:
+        """quest_history returns the rows of both tables."""
+        archive_completed_quests(CUTOFF)
+
+        history = quest_history(lambda queryset: queryset.filter(character=self.character).values_list("pk"))
+
+        self.assertEqual(
+            sorted(pk for (pk,) in history), sorted(row.pk for row in [*self.old, self.recent, self.open]),
+        )
+
+    def test_rollups_and_export_read_archive(self) -> None:
+        """Backfill and export see archived quests; a week split over both tables is summed."""
+        # Gleiche Woche wie die jüngste Quest, aber vor dem Stichtag
+        CharacterQuestFactory(
+            character=self.character,
+            quest=QuestFactory(experience_points=5, gold=0),
+            status="completed",
+            completed_at=CUTOFF - timedelta(minutes=1),
+        )
+        backfill_rollups()
+        before = list(WeeklyCompletion.objects.order_by("week").values_list("week", "completed", "experience_points"))
+
+        archive_completed_quests(CUTOFF)
+        backfill_rollups()
+
+        self.assertEqual(
+            list(WeeklyCompletion.objects.order_by("week").values_list("week", "completed", "experience_points")),
+            before,
+        )
+        quests = [record for record in export_records([self.character.user_id]) if record["type"] == "quest"]
+        self.assertEqual(len(quests), 6)
+
+    def test_command(self) -> None:
+        """The command archives with the given age."""
+        out = StringIO()
+        call_command("archive_quests", "--older-than-days", "0", stdout=out)
+
+        self.assertIn("Archived 4 quests", out.getvalue())
+        self.assertEqual(CharacterQuest.objects.count(), 1)
+
+    def test_default_cutoff(self) -> None:
+        """Without an age the QUEST_ARCHIVE_AFTER_DAYS setting is used."""
+        with self.settings(QUEST_ARCHIVE_AFTER_DAYS=10):
+            cutoff = get_archive_cutoff()
+        self.assertAlmostEqual(
+            (datetime.now(timezone.utc) - cutoff).total_seconds(), timedelta(days=10).total_seconds(), delta=60,
+        )
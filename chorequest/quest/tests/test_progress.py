@@ -0,0 +1,166 @@
+"""
+Module: quest.tests.test_progress.
+
+Filepath: ChoreQuest/chorequest/quest/tests/test_progress.py.
+Tests for the write-behind buffer of the quest progress.
+"""
+
+from unittest import mock
+
+import pytest
+from character.factories import CharacterFactory
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from quest.factories import CharacterQuestFactory, QuestFactory
+from quest.progress import flush_in_background, flush_progress, progress_buffer, record_progress
+
+
+def reset_buffer(test: TestCase) -> None:
+    """Leere den Puffer vor und nach einem Test."""
+    progress_buffer.drain()
+    test.addCleanup(progress_buffer.drain)
+    test.addCleanup(progress_buffer.cancel)
+
+
+@override_settings(QUEST_PROGRESS_DURABILITY="buffered", QUEST_PROGRESS_FLUSH_INTERVAL=3600)
+class ProgressBufferTest(TestCase):
+    """Tests for buffering, coalescing and flushing progress reports."""
+
+    def setUp(self) -> None:
+        """Create accepted quests of one character."""
+        reset_buffer(self)
+        self.character = CharacterFactory()
+        self.quests = [
+            CharacterQuestFactory(character=self.character, status="accepted", progress=10) for _ in range(3)
+        ]
+
+    def test_reports_are_buffered(self) -> None:
+        """Reports below the threshold do not touch the database."""
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                self.assertFalse(record_progress(self.quests[0], 5))
+
+        self.quests[0].refresh_from_db()
+        self.assertEqual(self.quests[0].progress, 10)
+        self.assertEqual(progress_buffer.pending(self.quests[0].pk), 25)
+
+    def test_flush_coalesces(self) -> None:
+        """One flush writes the summed increments of all quests with a constant number of queries."""
+        for index, character_quest in enumerate(self.quests):
+            for _ in range(index + 1):
+                record_progress(character_quest, 10)
+
+        # SAVEPOINT, SELECT ... FOR UPDATE, UPDATE, RELEASE
+        with self.assertNumQueries(4):
+            result = flush_progress()
+
+        self.assertEqual((result.updated, result.completed), (3, 0))
+        for character_quest, expected in zip(self.quests, (20, 30, 40)):
+            character_quest.refresh_from_db()
+            self.assertEqual(character_quest.progress, expected)
+        self.assertEqual(len(progress_buffer), 0)
+
+    def test_threshold_completes_quest(self) -> None:
+        """A report reaching the threshold is flushed at once and completes the quest with its rewards."""
+        character_quest = CharacterQuestFactory(
+            character=self.character,
+            quest=QuestFactory(experience_points=150, gold=30),
+            status="accepted",
+            progress=50,
+        )
+        record_progress(self.quests[0], 5)
+
+        self.assertTrue(record_progress(character_quest, 60))
+
+        character_quest.refresh_from_db()
+        self.character.refresh_from_db()
+        self.assertEqual((character_quest.status, character_quest.progress), ("completed", 100))
+        self.assertEqual((self.character.level, self.character.gold), (2, 30))
+        # Die übrigen Meldungen wurden mitgeschrieben
+        self.quests[0].refresh_from_db()
+        self.assertEqual(self.quests[0].progress, 15)
+
+    @override_settings(QUEST_COMPLETION_THRESHOLD=80)
+    def test_threshold_is_configurable(self) -> None:
+        """The completion threshold is evaluated at flush time."""
+        record_progress(self.quests[0], 30)
+        self.assertEqual(flush_progress().completed, 0)
+        self.quests[0].refresh_from_db()
+
+        self.assertTrue(record_progress(self.quests[0], 40))
+
+        self.quests[0].refresh_from_db()
+        self.assertEqual(self.quests[0].status, "completed")
+
+    def test_completed_quests_are_skipped(self) -> None:
+        """Buffered reports of a quest completed in the meantime are dropped."""
+        record_progress(self.quests[0], 10)
+        self.quests[0].status = "completed"
+        self.quests[0].save()
+
+        self.assertEqual(flush_progress().updated, 0)
+
+    def test_failed_completion_keeps_increments(self) -> None:
+        """Errors while completing a quest put the drained increments back into the buffer."""
+        record_progress(self.quests[0], 10)
+
+        with mock.patch("quest.progress.complete_quest", side_effect=RuntimeError("reward failed")), \
+                pytest.raises(RuntimeError):
+            record_progress(self.quests[1], 90)
+
+        self.assertEqual(progress_buffer.pending(self.quests[0].pk), 10)
+        self.assertEqual(progress_buffer.pending(self.quests[1].pk), 90)
+
+    def test_failed_background_flush_is_rescheduled(self) -> None:
+        """A failed background flush schedules the next attempt one interval later."""
+        with mock.patch("quest.progress.flush_progress", side_effect=RuntimeError("database gone")), \
+                mock.patch("quest.progress.connection"), \
+                mock.patch.object(progress_buffer, "schedule") as schedule, \
+                self.assertLogs("quest.progress", "ERROR"):
+            flush_in_background()
+
+        schedule.assert_called_once_with(3600, flush_in_background)
+
+    @override_settings(QUEST_PROGRESS_DURABILITY="immediate")
+    def test_immediate_durability(self) -> None:
+        """With immediate durability every report is written before returning."""
+        self.assertTrue(record_progress(self.quests[0], 5))
+
+        self.quests[0].refresh_from_db()
+        self.assertEqual(self.quests[0].progress, 15)
+
+
+@override_settings(QUEST_PROGRESS_DURABILITY="buffered", QUEST_PROGRESS_FLUSH_INTERVAL=3600)
+class ProgressViewTest(APITestCase):
+    """Tests for the progress endpoint."""
+
+    def setUp(self) -> None:
+        """Create an accepted quest of the logged in user."""
+        reset_buffer(self)
+        self.character_quest = CharacterQuestFactory(status="accepted", progress=90)
+        token = ChoreQuestRefreshToken.for_user(self.character_quest.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.url = f"/api/character-quests/{self.character_quest.id}/progress/"
+
+    def test_buffered_report(self) -> None:
+        """A buffered report is answered with 202 and the pending increment."""
+        response = self.client.post(self.url, {"increment": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual((response.data["progress"], response.data["pending"]), (90, 5))
+
+    def test_completing_report(self) -> None:
+        """The report completing the quest returns the written quest."""
+        self.client.post(self.url, {"increment": 5})
+        response = self.client.post(self.url, {"increment": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["status"], response.data["progress"]), ("completed", 100))
+        self.assertEqual(self.client.post(self.url, {"increment": 5}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_increment(self) -> None:
+        """Increments must be between 1 and 100."""
+        self.assertEqual(self.client.post(self.url, {"increment": 0}).status_code, status.HTTP_400_BAD_REQUEST)
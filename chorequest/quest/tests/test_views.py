@@ -0,0 +1,79 @@
+"""
+Module: quest.tests.test_views.
+
+Filepath: ChoreQuest/chorequest/quest/tests/test_views.py.
+Tests for the CharacterQuestViewSet.
+"""
+
+from character.factories import CharacterFactory
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.tokens import ChoreQuestRefreshToken
+
+from quest.factories import CharacterQuestFactory, QuestFactory
+
+
+class CharacterQuestViewSetTests(APITestCase):
+    """Tests for listing and completing the quests of the own characters."""
+
+    def setUp(self) -> None:
+        """Create a character with an accepted quest and a quest of another user."""
+        self.character = CharacterFactory()
+        self.character_quest = CharacterQuestFactory(
+            character=self.character,
+            quest=QuestFactory(experience_points=150, gold=30),
+            status="accepted",
+            progress=40,
+        )
+        self.other_quest = CharacterQuestFactory(status="accepted")
+        token = ChoreQuestRefreshToken.for_user(self.character.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_list_own_quests(self) -> None:
+        """Only the quests of the own characters are listed."""
+        response = self.client.get("/api/character-quests/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry["id"] for entry in response.data], [self.character_quest.id])
+
+    def test_status_filter(self) -> None:
+        """The status filter accepts comma separated values."""
+        response = self.client.get("/api/character-quests/?status=open,completed")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+    def test_character_filter(self) -> None:
+        """The character filter lists the quests of one own character and rejects non-integer ids."""
+        response = self.client.get("/api/character-quests/", {"character": self.character.pk})
+        self.assertEqual([entry["id"] for entry in response.data], [self.character_quest.id])
+
+        response = self.client.get("/api/character-quests/", {"character": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("character", response.data)
+
+    def test_complete_awards_experience(self) -> None:
+        """Completing a quest marks it completed, levels the character up and pays the gold."""
+        response = self.client.post(f"/api/character-quests/{self.character_quest.id}/complete/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "completed")
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.level, 2)
+        self.assertEqual(self.character.experience_points, 50)
+        self.assertEqual(self.character.gold, 30)
+
+    def test_complete_twice(self) -> None:
+        """A completed quest cannot be completed again."""
+        self.client.post(f"/api/character-quests/{self.character_quest.id}/complete/")
+        response = self.client.post(f"/api/character-quests/{self.character_quest.id}/complete/")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.experience_points, 50)
+
+    def test_complete_other_users_quest(self) -> None:
+        """Quests of other users cannot be completed."""
+        response = self.client.post(f"/api/character-quests/{self.other_quest.id}/complete/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
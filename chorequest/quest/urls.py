@@ -0,0 +1,13 @@
+"""URL configuration for the quest app."""
+
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import CharacterQuestViewSet
+
+router = DefaultRouter()
+router.register(r"character-quests", CharacterQuestViewSet, basename="character-quest")
+
+urlpatterns = [
+    path("api/", include(router.urls)),
+]
@@ -0,0 +1,72 @@
+"""
+Module: quest.views.
+
+Filepath: ChoreQuest/chorequest/quest/views.py.
+
+Views for the quests of the characters of the current user.
+"""
+
+from typing import ClassVar
+
+from django.db.models.query import QuerySet
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import CharacterQuest
+from .progress import progress_buffer, record_progress
+from .serializers import CharacterQuestFilterSerializer, CharacterQuestSerializer, ProgressSerializer
+from .services import complete_quest
+
+
+class CharacterQuestViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet für die Quests der Charaktere des aktuellen Benutzers."""
+
+    permission_classes: ClassVar[list] = [IsAuthenticated]
+    serializer_class = CharacterQuestSerializer
+
+    def get_queryset(self) -> QuerySet:
+        """Gib die Quests der eigenen Charaktere zurück, gefiltert nach Status (kommagetrennt) und Charakter."""
+        params = CharacterQuestFilterSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = CharacterQuest.objects.filter(character__user_id=self.request.user.pk).select_related("quest")
+        if status_filter := params.validated_data.get("status"):
+            queryset = queryset.filter(status__in=status_filter.split(","))
+        if character := params.validated_data.get("character"):
+            queryset = queryset.filter(character_id=character)
+        return queryset.order_by("id")
+
+    @action(detail=True, methods=["post"])
+    def complete(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """Schließe die Quest ab und vergib die Erfahrungspunkte."""
+        character_quest = self.get_object()
+        try:
+            character_quest = complete_quest(character_quest.pk)
+        except ValueError as exc:
+            raise serializers.ValidationError({"detail": str(exc)}) from exc
+        return Response(self.get_serializer(character_quest).data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"])
+    def progress(self, request: Request, pk: "str | None" = None) -> Response:  # noqa: ARG002
+        """
+        Melde Fortschritt; die Meldungen werden gepuffert und gebündelt geschrieben (siehe ``quest.progress``).
+
+        Antwortet mit 202, solange die Meldung nur gepuffert ist, und mit 200,
+        wenn sie geschrieben wurde, z. B. weil die Quest damit abgeschlossen ist.
+        """
+        character_quest = self.get_object()
+        if character_quest.status == "completed":
+            raise serializers.ValidationError({"detail": "Quest already completed."})
+        serializer = ProgressSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if record_progress(character_quest, serializer.validated_data["increment"]):
+            character_quest.refresh_from_db()
+            return Response(self.get_serializer(character_quest).data, status=status.HTTP_200_OK)
+        pending = progress_buffer.pending(character_quest.pk)
+        return Response(
+            {"id": character_quest.pk, "progress": character_quest.progress, "pending": pending},
+            status=status.HTTP_202_ACCEPTED,
+        )
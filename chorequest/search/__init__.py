@@ -0,0 +1 @@
+"""Full-text search over items and quests."""
@@ -0,0 +1,10 @@
+"""Module contains the configuration for the search app."""
+
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    """Configuration for the search app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "search"
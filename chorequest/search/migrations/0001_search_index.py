@@ -0,0 +1,93 @@
+"""
+Migration creating the full-text search index over items and quests.
+
+On SQLite a contentless FTS5 table ``search_index`` is filled from
+``character_item`` and ``quest_quest`` and kept in sync by triggers, so bulk
+writes that bypass model signals are indexed as well.  The rowid encodes the
+source: ``id * 2`` for items, ``id * 2 + 1`` for quests.
+
+On PostgreSQL GIN expression indexes are created on the search vector of both
+tables (see :mod:`search.vectors`).
+"""
+
+from typing import ClassVar
+
+from django.db import migrations
+
+SOURCES = {"item": ("character_item", 0), "quest": ("quest_quest", 1)}
+
+SQLITE_CREATE = [
+    (
+        "CREATE VIRTUAL TABLE search_index USING fts5("
+        "name, description, content='', tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    ),
+]
+for _kind, (_table, _offset) in SOURCES.items():
+    _new = f"new.id * 2 + {_offset}, new.name, COALESCE(new.description, '')"
+    _old = f"'delete', old.id * 2 + {_offset}, old.name, COALESCE(old.description, '')"
+    # Tabellennamen und Offsets sind Konstanten dieses Moduls, keine Benutzereingaben
+    SQLITE_CREATE += [
+        (
+            "INSERT INTO search_index(rowid, name, description) "  # noqa: S608
+            f"SELECT id * 2 + {_offset}, name, COALESCE(description, '') FROM {_table}"
+        ),
+        (
+            f"CREATE TRIGGER search_{_kind}_insert AFTER INSERT ON {_table} BEGIN "  # noqa: S608
+            f"INSERT INTO search_index(rowid, name, description) VALUES ({_new}); END"
+        ),
+        (
+            f"CREATE TRIGGER search_{_kind}_delete AFTER DELETE ON {_table} BEGIN "  # noqa: S608
+            f"INSERT INTO search_index(search_index, rowid, name, description) VALUES ({_old}); END"
+        ),
+        (
+            f"CREATE TRIGGER search_{_kind}_update AFTER UPDATE OF name, description ON {_table} BEGIN "  # noqa: S608
+            f"INSERT INTO search_index(search_index, rowid, name, description) VALUES ({_old}); "
+            f"INSERT INTO search_index(rowid, name, description) VALUES ({_new}); END"
+        ),
+    ]
+
+SQLITE_DROP = [
+    *(f"DROP TRIGGER IF EXISTS search_{kind}_{event}" for kind in SOURCES for event in ("insert", "delete", "update")),
+    "DROP TABLE IF EXISTS search_index",
+]
+
+PG_INDEXES = {"character": ("Item", "item_search_gin"), "quest": ("Quest", "quest_search_gin")}
+
+
+def create_index(apps: object, schema_editor: object) -> None:
+    """Create the FTS5 table and triggers on SQLite or the GIN indexes on PostgreSQL."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for statement in SQLITE_CREATE:
+            schema_editor.execute(statement)
+    elif vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex  # noqa: PLC0415
+
+        from search.vectors import document_vector  # noqa: PLC0415
+
+        for app_label, (model_name, index_name) in PG_INDEXES.items():
+            schema_editor.add_index(apps.get_model(app_label, model_name), GinIndex(document_vector(), name=index_name))
+
+
+def drop_index(apps: object, schema_editor: object) -> None:  # noqa: ARG001
+    """Remove what :func:`create_index` created."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for statement in SQLITE_DROP:
+            schema_editor.execute(statement)
+    elif vendor == "postgresql":
+        for _model, index_name in PG_INDEXES.values():
+            schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+    """Migration creates the search index and keeps it in sync."""
+
+    dependencies: ClassVar[list] = [
+        ("character", "0007_equipment"),
+        ("quest", "0001_initial"),
+    ]
+
+    operations: ClassVar[list] = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1 @@
+"""Initializes the migrations of the search module."""
@@ -0,0 +1,27 @@
+"""ModelAdmin integration of the full-text search."""
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from .query import search_ids
+
+ADMIN_SEARCH_LIMIT = 1000
+
+
+class FullTextSearchMixin:
+    """
+    ModelAdmin mixin answering the changelist search from the full-text index.
+
+    Replaces the ``LIKE '%term%'`` scans of ``search_fields`` with an index
+    lookup limited to the ``ADMIN_SEARCH_LIMIT`` best matches.
+    """
+
+    search_kind: str
+
+    def get_search_results(self, request: HttpRequest, queryset: QuerySet, search_term: str) -> tuple[QuerySet, bool]:
+        """Filter ``queryset`` to the ids found in the search index."""
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        ids = [pk for _kind, pk, _score in search_ids(search_term, [self.search_kind], ADMIN_SEARCH_LIMIT)]
+        return queryset.filter(pk__in=ids), False
+
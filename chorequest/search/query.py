@@ -0,0 +1,84 @@
+"""
+Ranked full-text search over items and quests.
+
+SQLite queries the FTS5 table ``search_index`` (BM25, name weighted ten times
+higher than the description); PostgreSQL matches the GIN indexed search vector
+and ranks with ``ts_rank``.  Every search term matches as a prefix, so ``sw``
+finds "Sword".  Only the ids of the best hits are ranked in the index; their
+rows are loaded afterwards with one query per kind.
+"""
+
+import re
+
+from character.models import Item
+from django.db import connection
+from quest.models import Quest
+
+KINDS = {"item": (Item, 0), "quest": (Quest, 1)}
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def terms(query: str) -> list[str]:
+    """Split a user query into search terms, dropping all operators and punctuation."""
+    return _TERM.findall(query)
+
+
+def _sqlite_ids(words: list[str], kinds: list[str], limit: int) -> list[tuple[str, int, float]]:
+    """Return ``(kind, id, score)`` of the best FTS5 hits."""
+    match = " ".join(f'"{word}"*' for word in words)
+    offsets = [KINDS[kind][1] for kind in kinds]
+    placeholders = ", ".join(["%s"] * len(offsets))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT rowid, bm25(search_index, 10.0, 1.0) AS score FROM search_index "  # noqa: S608
+            f"WHERE search_index MATCH %s AND rowid %% 2 IN ({placeholders}) ORDER BY score LIMIT %s",
+            [match, *offsets, limit],
+        )
+        rows = cursor.fetchall()
+    kind_of = {offset: kind for kind, (_model, offset) in KINDS.items()}
+    # bm25 ist negativ, kleiner ist besser
+    return [(kind_of[rowid % 2], rowid // 2, -score) for rowid, score in rows]
+
+
+def _postgresql_ids(words: list[str], kinds: list[str], limit: int) -> list[tuple[str, int, float]]:
+    """Return ``(kind, id, score)`` of the best hits of the GIN indexed search vectors."""
+    from django.contrib.postgres.search import SearchQuery, SearchRank  # noqa: PLC0415
+
+    from .vectors import SEARCH_CONFIG, document_vector  # noqa: PLC0415
+
+    query = SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+    hits = []
+    for kind in kinds:
+        model = KINDS[kind][0]
+        ranked = (
+            model.objects.annotate(document=document_vector())
+            .filter(document=query)
+            .annotate(rank=SearchRank(document_vector(), query))
+            .order_by("-rank")
+            .values_list("id", "rank")[:limit]
+        )
+        hits += [(kind, pk, rank) for pk, rank in ranked]
+    return sorted(hits, key=lambda hit: hit[2], reverse=True)[:limit]
+
+
+def search_ids(query: str, kinds: "list[str] | None" = None, limit: int = 20) -> list[tuple[str, int, float]]:
+    """Return ``(kind, id, score)`` of the best matches of ``query``, best first."""
+    words = terms(query)
+    kinds = kinds or list(KINDS)
+    if not words:
+        return []
+    if connection.vendor == "postgresql":
+        return _postgresql_ids(words, kinds, limit)
+    return _sqlite_ids(words, kinds, limit)
+
+
+def search(query: str, kinds: "list[str] | None" = None, limit: int = 20) -> list[dict]:
+    """Return the best matching items and quests of ``query`` as ranked result dictionaries."""
+    hits = search_ids(query, kinds, limit)
+    rows = {}
+    for kind, (model, _offset) in KINDS.items():
+        ids = [pk for hit_kind, pk, _score in hits if hit_kind == kind]
+        if ids:
+            for pk, name, description in model.objects.filter(pk__in=ids).values_list("id", "name", "description"):
+                rows[kind, pk] = {"type": kind, "id": pk, "name": name, "description": description or ""}
+    return [{**rows[kind, pk], "score": score} for kind, pk, score in hits if (kind, pk) in rows]
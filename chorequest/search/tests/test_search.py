@@ -0,0 +1,112 @@
+"""
+Module: search.tests.test_search.
+
+Filepath: ChoreQuest/chorequest/search/tests/test_search.py.
+Tests for the full-text search index, the search API and the admin search.
+"""
+
+from character.factories import CharacterFactory, ItemFactory
+from character.models import Item
+from django.test import Client, TestCase
+from quest.factories import QuestFactory
+from quest.models import Quest
+from rest_framework import status
+from rest_framework.test import APITestCase
+from user.factories import UserAccountFactory
+from user.tokens import ChoreQuestRefreshToken
+
+from search.query import search, search_ids, terms
+
+
+class SearchQueryTests(TestCase):
+    """Tests für Ranking, Präfixsuche und die Synchronisation des Index."""
+
+    def setUp(self) -> None:
+        """Erstellt Items und Quests mit überlappenden Begriffen."""
+        self.sword = ItemFactory(name="Flaming Sword", description="Burns every enemy.")
+        self.shield = ItemFactory(name="Oak Shield", description="Blocks the blow of a sword.")
+        self.quest = QuestFactory(name="Sharpen the sword", description="Visit the smith.")
+
+    def test_name_ranks_above_description(self) -> None:
+        """Ein Treffer im Namen wird vor einem Treffer in der Beschreibung gelistet."""
+        results = search("sword", ["item"])
+
+        self.assertEqual([result["id"] for result in results], [self.sword.id, self.shield.id])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_prefix_and_all_terms(self) -> None:
+        """Jeder Begriff matcht als Präfix, alle Begriffe müssen vorkommen."""
+        self.assertEqual([(r["type"], r["id"]) for r in search("flam sw")], [("item", self.sword.id)])
+        self.assertEqual(search("flaming shield"), [])
+
+    def test_type_filter(self) -> None:
+        """Nur die angefragten Typen werden durchsucht."""
+        results = search("sword", ["quest"])
+
+        self.assertEqual([(r["type"], r["id"]) for r in results], [("quest", self.quest.id)])
+
+    def test_operators_are_ignored(self) -> None:
+        """FTS-Operatoren und Satzzeichen der Eingabe werden verworfen."""
+        self.assertEqual(terms('"oak" OR -shield*'), ["oak", "OR", "shield"])
+        self.assertEqual(search_ids("***"), [])
+
+    def test_index_follows_writes(self) -> None:
+        """Trigger halten den Index bei Updates, Deletes und bulk_create aktuell."""
+        Item.objects.filter(pk=self.sword.pk).update(name="Frozen Axe")
+        self.shield.delete()
+        Quest.objects.bulk_create([Quest(name="Bulk sword quest", description="", due_date=self.quest.due_date)])
+
+        self.assertEqual([r["name"] for r in search("sword")], ["Bulk sword quest", "Sharpen the sword"])
+        self.assertEqual([r["id"] for r in search("frozen")], [self.sword.id])
+
+
+class SearchViewTests(APITestCase):
+    """Tests für den Endpunkt /api/search/."""
+
+    def setUp(self) -> None:
+        """Erstellt einen angemeldeten Benutzer und durchsuchbare Daten."""
+        self.item = ItemFactory(name="Healing Potion", description="Restores hitpoints.")
+        self.quest = QuestFactory(name="Brew a potion", description="Collect herbs.")
+        token = ChoreQuestRefreshToken.for_user(CharacterFactory().user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_search(self) -> None:
+        """Die Ergebnisse enthalten Typ, Name und Score."""
+        response = self.client.get("/api/search/", {"q": "potion", "type": "item"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["query"], "potion")
+        self.assertEqual(
+            [(r["type"], r["id"], r["name"]) for r in response.data["results"]],
+            [("item", self.item.id, "Healing Potion")],
+        )
+
+    def test_empty_query_is_rejected(self) -> None:
+        """Eine leere Suche liefert 400."""
+        response = self.client.get("/api/search/", {"q": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self) -> None:
+        """Ohne Token ist die Suche nicht erreichbar."""
+        self.client.credentials()
+
+        response = self.client.get("/api/search/", {"q": "potion"})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AdminSearchTests(TestCase):
+    """Tests für die Admin-Suche über den Volltextindex."""
+
+    def test_changelist_search(self) -> None:
+        """Die Changelist findet Items über den Index, auch per Präfix."""
+        ItemFactory(name="Mithril Helmet", description="")
+        ItemFactory(name="Leather Boots", description="")
+        client = Client()
+        client.force_login(UserAccountFactory(is_staff=True, is_superuser=True))
+
+        response = client.get("/admin/character/item/", {"q": "mith"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item.name for item in response.context["cl"].result_list], ["Mithril Helmet"])
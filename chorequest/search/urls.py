@@ -0,0 +1,9 @@
+"""URL configuration for the search app."""
+
+from django.urls import path
+
+from .views import SearchView
+
+urlpatterns = [
+    path("api/search/", SearchView.as_view(), name="search"),
+]
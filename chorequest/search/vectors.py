@@ -0,0 +1,19 @@
+"""
+Search vector of the PostgreSQL backend.
+
+The GIN indexes of migration ``0001_search_index`` are built on exactly this
+expression; PostgreSQL only uses an expression index for a query repeating the
+indexed expression.  The module needs a PostgreSQL driver and is only imported
+on that backend.
+"""
+
+from django.contrib.postgres.search import SearchVector
+
+SEARCH_CONFIG = "simple"
+
+
+def document_vector() -> SearchVector:
+    """Return the weighted search vector over ``name`` (A) and ``description`` (B)."""
+    return SearchVector("name", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "description", weight="B", config=SEARCH_CONFIG,
+    )
@@ -0,0 +1,39 @@
+"""Views of the search API."""
+
+from typing import ClassVar
+
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .query import KINDS, search
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """Query parameters of the search endpoint."""
+
+    q = serializers.CharField(max_length=200)
+    type = serializers.MultipleChoiceField(choices=list(KINDS), required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class SearchView(APIView):
+    """Ranked full-text search over items and quests: ``GET /api/search/?q=...&type=item&limit=20``."""
+
+    permission_classes: ClassVar[list] = [IsAuthenticated]
+
+    def get(self, request: Request) -> Response:
+        """Return the best matches for ``q``."""
+        params = SearchQuerySerializer(
+            data={
+                "q": request.query_params.get("q", ""),
+                "type": request.query_params.getlist("type"),
+                "limit": request.query_params.get("limit", 20),
+            },
+        )
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        kinds = sorted(data.get("type") or KINDS)
+        return Response({"query": data["q"], "results": search(data["q"], kinds, data["limit"])})
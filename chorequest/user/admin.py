@@ -1,9 +1,9 @@
-"""Admin configuration for the UserAccount model."""
+"""Admin configuration for the UserAccount and OutgoingEmail models."""
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from .models import UserAccount
+from .models import OutgoingEmail, UserAccount
 
 
 @admin.register(UserAccount)
@@ -25,3 +25,12 @@ class CustomUserAdmin(UserAdmin):
             "fields": ("username", "email", "password1", "password2", "is_staff", "is_active"),
         }),
     )
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """Admin configuration for the email outbox."""
+
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "created_at", "sent_at")
+    list_filter = ("status",)
+    readonly_fields = ("created_at", "sent_at", "last_error")
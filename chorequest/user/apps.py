@@ -8,3 +8,11 @@ class UserConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "user"
+
+    def ready(self) -> None:
+        """Connect the signal handlers of the user app and check the hashing pool settings."""
+        from . import signals  # noqa: F401, PLC0415
+        from .hashing import get_hashing_pool  # noqa: PLC0415
+
+        # Ungültige Pool-Einstellungen schon beim Start melden, nicht erst beim ersten Login
+        get_hashing_pool()
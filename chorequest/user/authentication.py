@@ -0,0 +1,69 @@
+"""
+Database-free JWT authentication for the ChoreQuest API.
+
+``ClaimsJWTAuthentication`` trusts the signed claims of an access token instead
+of loading the ``UserAccount`` on every request.  ``request.user`` becomes a
+``ClaimsTokenUser`` that answers ``id`` and ``is_active`` from the token and
+only resolves the full model (via a short-lived cache) when code asks for
+``instance``.  ``active_character_id`` comes from the active character cache,
+since the claim goes stale when the player switches characters.
+
+Deactivating an account revokes its tokens through a cache marker; without a
+shared cache the revocation still holds once the access token expires.
+"""
+
+from character.cache import get_active_character_id
+from django.contrib.auth.models import AbstractBaseUser
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from .cache import get_cached_user, is_user_revoked
+from .tokens import IS_ACTIVE_CLAIM
+
+
+class ClaimsTokenUser(TokenUser):
+    """Stateless user backed by the claims of a validated ChoreQuest token."""
+
+    @cached_property
+    def id(self) -> int:
+        """Return the user id as stored in the token."""
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def is_active(self) -> bool:
+        """Return the ``is_active`` flag the token was issued with."""
+        return bool(self.token.get(IS_ACTIVE_CLAIM, True))
+
+    @cached_property
+    def active_character_id(self) -> "int | None":
+        """Return the id of the character the user is currently playing, if any."""
+        return get_active_character_id(self.id)
+
+    @cached_property
+    def instance(self) -> AbstractBaseUser:
+        """Return the full ``UserAccount``, served from the user cache where possible."""
+        user = get_cached_user(self.id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        return user
+
+    def __str__(self) -> str:
+        """Return the string representation of the token user."""
+        return f"ClaimsTokenUser {self.id}"
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    """Authenticate requests from the token claims without a ``UserAccount`` query."""
+
+    def get_user(self, validated_token: Token) -> ClaimsTokenUser:
+        """Return a ``ClaimsTokenUser`` unless the token belongs to a deactivated account."""
+        user = super().get_user(validated_token)
+        if not user.is_active or is_user_revoked(user.id):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
@@ -0,0 +1,86 @@
+"""
+Authentication backend that checks passwords on the bounded hashing pool.
+
+``PooledModelBackend`` is a ``ModelBackend`` in every respect (user lookup,
+``user_can_authenticate``, permissions) except for the password check: instead
+of ``user.check_password`` hashing inside the request worker, the check and a
+possible hash upgrade run on the pool from :mod:`user.hashing`.  Going through
+``django.contrib.auth.authenticate`` keeps ``AUTHENTICATION_BACKENDS`` and the
+``user_login_failed`` signal working.
+"""
+
+from typing import TYPE_CHECKING
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import AbstractBaseUser
+
+from .hashing import ahash_password, averify_password, hash_password, verify_password
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """``ModelBackend`` whose password check runs on the password hashing pool."""
+
+    def authenticate(
+        self,
+        request: "HttpRequest | None",  # noqa: ARG002
+        username: "str | None" = None,
+        password: "str | None" = None,
+        **kwargs: str,
+    ) -> "AbstractBaseUser | None":
+        """Return the user for valid credentials, like ``ModelBackend.authenticate``."""
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)  # noqa: SLF001
+        except UserModel.DoesNotExist:
+            # Auch für unbekannte Namen hashen, damit die Antwortzeit nichts verrät
+            hash_password(password)
+            return None
+        if self.check_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    async def aauthenticate(
+        self,
+        request: "HttpRequest | None",  # noqa: ARG002
+        username: "str | None" = None,
+        password: "str | None" = None,
+        **kwargs: str,
+    ) -> "AbstractBaseUser | None":
+        """Async counterpart of :meth:`authenticate`."""
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = await UserModel._default_manager.aget_by_natural_key(username)  # noqa: SLF001
+        except UserModel.DoesNotExist:
+            await ahash_password(password)
+            return None
+        if await self.acheck_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def check_password(self, user: AbstractBaseUser, raw_password: str) -> bool:
+        """Pool based replacement for ``user.check_password``, including the hash upgrade."""
+        is_correct, must_update = verify_password(raw_password, user.password)
+        if is_correct and must_update:
+            user.password = hash_password(raw_password)
+            user.save(update_fields=["password"])
+        return is_correct
+
+    async def acheck_password(self, user: AbstractBaseUser, raw_password: str) -> bool:
+        """Async counterpart of :meth:`check_password`."""
+        is_correct, must_update = await averify_password(raw_password, user.password)
+        if is_correct and must_update:
+            user.password = await ahash_password(raw_password)
+            await user.asave(update_fields=["password"])
+        return is_correct
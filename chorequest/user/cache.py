@@ -0,0 +1,75 @@
+"""
+Cached user resolution for token-authenticated requests.
+
+The claims based authentication in :mod:`user.authentication` never touches the
+database.  Code that really needs the full ``UserAccount`` goes through
+:func:`get_cached_user`, which keeps the model instance in the cache for a short
+time.  The signal handlers in :mod:`user.signals` drop the entry whenever the
+account is saved or deleted and mark deactivated accounts as revoked.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_PREFIX = "user:account"
+REVOKED_CACHE_PREFIX = "user:revoked"
+
+
+def get_user_cache_timeout() -> int:
+    """Return the lifetime of a cached user object in seconds."""
+    return getattr(settings, "USER_CACHE_TIMEOUT", 60)
+
+
+def user_cache_key(user_id: "int | str") -> str:
+    """Return the cache key under which the user with ``user_id`` is stored."""
+    return f"{USER_CACHE_PREFIX}:{user_id}"
+
+
+def revoked_cache_key(user_id: "int | str") -> str:
+    """Return the cache key that marks the user with ``user_id`` as revoked."""
+    return f"{REVOKED_CACHE_PREFIX}:{user_id}"
+
+
+def get_cached_user(user_id: "int | str") -> "object | None":
+    """
+    Return the ``UserAccount`` with ``user_id`` from the cache or the database.
+
+    Returns ``None`` if the user does not exist.  Misses are not cached, so a
+    freshly created account is found on the next call.
+    """
+    key = user_cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user_model = get_user_model()
+        user = user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is not None:
+            cache.set(key, user, get_user_cache_timeout())
+    return user
+
+
+def invalidate_cached_user(user_id: "int | str") -> None:
+    """Remove the cached user object for ``user_id``."""
+    cache.delete(user_cache_key(user_id))
+
+
+def revoke_user_tokens(user_id: "int | str") -> None:
+    """
+    Mark all access tokens of ``user_id`` as revoked.
+
+    The marker lives as long as an access token does; after that every token
+    issued before the revocation has expired on its own.
+    """
+    timeout = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    cache.set(revoked_cache_key(user_id), value=True, timeout=timeout)
+
+
+def clear_user_revocation(user_id: "int | str") -> None:
+    """Remove the revocation marker of ``user_id``, e.g. after reactivation."""
+    cache.delete(revoked_cache_key(user_id))
+
+
+def is_user_revoked(user_id: "int | str") -> bool:
+    """Return ``True`` if the tokens of ``user_id`` have been revoked."""
+    return bool(cache.get(revoked_cache_key(user_id)))
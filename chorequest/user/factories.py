@@ -0,0 +1,24 @@
+"""
+Factories for the user models using factory_boy.
+
+This module defines factories for creating test instances of user accounts.
+"""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from user.models import UserAccount
+
+
+class UserAccountFactory(DjangoModelFactory):
+    """Factory for the UserAccount model."""
+
+    username = factory.Sequence(lambda n: f"player{n}")
+    email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
+    password = factory.django.Password("chorequest")
+
+    class Meta:
+        """Meta information for the UserAccountFactory."""
+
+        model = UserAccount
+        django_get_or_create = ("username",)
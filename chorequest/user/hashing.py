@@ -0,0 +1,131 @@
+"""
+Bounded, off-thread password hashing.
+
+PBKDF2 is deliberately slow.  Running it inside the request worker means a burst
+of logins occupies every worker and stalls unrelated API traffic.  All password
+hashing of the user app goes through a dedicated thread pool instead (hashlib
+releases the GIL while hashing).  The number of hash operations that may be
+running or waiting at the same time is capped; callers beyond the cap are
+rejected immediately with ``429 Too Many Requests`` and a ``Retry-After`` header.
+
+Settings:
+
+``PASSWORD_HASHING_THREADS``
+    Number of threads hashing in parallel (default 4).
+``PASSWORD_HASHING_MAX_CONCURRENCY``
+    Maximum number of running plus queued hash operations (default 16, at least 1).
+``PASSWORD_HASHING_RETRY_AFTER``
+    Seconds clients are asked to wait when the pool is saturated (default 1).
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from rest_framework.exceptions import Throttled
+
+
+class PasswordHashingSaturatedError(Throttled):
+    """Raised when the password hashing pool has no free capacity."""
+
+    default_detail = "Too many concurrent login or registration attempts. Please retry shortly."
+    default_code = "password_hashing_saturated"
+
+
+class PasswordHashingPool:
+    """Thread pool for password hashing with a hard cap on outstanding operations."""
+
+    def __init__(self, threads: int, max_concurrency: int, retry_after: int) -> None:
+        """Create the pool; threads are started lazily by the executor."""
+        if max_concurrency < 1:
+            msg = f"PASSWORD_HASHING_MAX_CONCURRENCY must be at least 1, got {max_concurrency}."
+            raise ImproperlyConfigured(msg)
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="password-hashing")
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:  # noqa: ANN401
+        """Schedule ``fn(*args)`` or raise ``PasswordHashingSaturatedError`` if the cap is reached."""
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingSaturatedError(wait=self.retry_after)
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run ``fn(*args)`` on the pool and wait for the result."""
+        return self.submit(fn, *args).result()
+
+    async def arun(self, fn: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run ``fn(*args)`` on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the pending operations are finished."""
+        self._executor.shutdown(wait=False)
+
+
+_pool: "PasswordHashingPool | None" = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> PasswordHashingPool:
+    """Return the process wide hashing pool, creating it from the settings on first use."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PasswordHashingPool(
+                    threads=getattr(settings, "PASSWORD_HASHING_THREADS", 4),
+                    max_concurrency=getattr(settings, "PASSWORD_HASHING_MAX_CONCURRENCY", 16),
+                    retry_after=getattr(settings, "PASSWORD_HASHING_RETRY_AFTER", 1),
+                )
+    return _pool
+
+
+@receiver(setting_changed)
+def reset_hashing_pool(setting: str, **kwargs: object) -> None:  # noqa: ARG001
+    """Rebuild the pool when one of its settings changes (e.g. ``override_settings`` in tests)."""
+    global _pool  # noqa: PLW0603
+    if setting.startswith("PASSWORD_HASHING_") and _pool is not None:
+        with _pool_lock:
+            _pool.shutdown()
+            _pool = None
+
+
+def _verify(raw_password: str, encoded: str) -> tuple[bool, bool]:
+    """Check ``raw_password`` and report whether the stored hash should be upgraded."""
+    must_update = []
+    is_correct = check_password(raw_password, encoded, setter=must_update.append)
+    return is_correct, bool(must_update)
+
+
+def hash_password(raw_password: "str | None") -> str:
+    """Return the encoded hash of ``raw_password``, computed on the hashing pool."""
+    return get_hashing_pool().run(make_password, raw_password)
+
+
+async def ahash_password(raw_password: "str | None") -> str:
+    """Async counterpart of :func:`hash_password`."""
+    return await get_hashing_pool().arun(make_password, raw_password)
+
+
+def verify_password(raw_password: str, encoded: str) -> tuple[bool, bool]:
+    """Return ``(is_correct, must_update)`` for ``raw_password``, computed on the hashing pool."""
+    return get_hashing_pool().run(_verify, raw_password, encoded)
+
+
+async def averify_password(raw_password: str, encoded: str) -> tuple[bool, bool]:
+    """Async counterpart of :func:`verify_password`."""
+    return await get_hashing_pool().arun(_verify, raw_password, encoded)
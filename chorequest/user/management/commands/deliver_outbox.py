@@ -0,0 +1,45 @@
+"""
+Management command delivering the emails waiting in the outbox.
+
+Run it once (e.g. from cron) or as a long running worker with ``--loop``.  To
+test against a local debugging SMTP server::
+
+    python -m aiosmtpd -n -l 127.0.0.1:1025
+    EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend EMAIL_PORT=1025 \
+        python manage.py deliver_outbox
+"""
+
+import time
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from user.outbox import DeliveryResult, deliver_pending
+
+
+class Command(BaseCommand):
+    """Send pending outbox emails in batches over one reused connection."""
+
+    help = "Send pending outbox emails in batches, retrying failures with exponential backoff."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add the command line options."""
+        parser.add_argument("--batch-size", type=int, default=100, help="Emails claimed per batch.")
+        parser.add_argument("--loop", action="store_true", help="Keep running and poll for new emails.")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds between polls with --loop.")
+
+    def handle(self, *args: object, **options: object) -> None:  # noqa: ARG002
+        """Deliver the outbox once or forever."""
+        while True:
+            result = deliver_pending(batch_size=options["batch_size"])
+            self.report(result)
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
+
+    def report(self, result: DeliveryResult) -> None:
+        """Write the counters of a delivery run."""
+        if result.sent or result.retried or result.failed or self.verbosity > 1:
+            self.stdout.write(
+                f"Sent {result.sent}, scheduled {result.retried} for retry, gave up on {result.failed}.",
+            )
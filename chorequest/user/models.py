@@ -1,7 +1,10 @@
-"""Module containing the custom user model for Chore Quest."""
+"""Module containing the custom user model and the email outbox for Chore Quest."""
+
+from typing import ClassVar
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 
 
 class UserAccount(AbstractUser):
@@ -17,3 +20,41 @@ class UserAccount(AbstractUser):
     def __str__(self) -> str:
         """Return the username of the user."""
         return self.username
+
+
+class OutgoingEmail(models.Model):
+    """
+    Email waiting in the outbox.
+
+    Requests only insert a row; the ``deliver_outbox`` command sends pending
+    emails in batches and retries failures with exponential backoff.
+    """
+
+    class Status(models.TextChoices):
+        """Delivery state of an outgoing email."""
+
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """Meta information for the OutgoingEmail model."""
+
+        indexes: ClassVar[list] = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return the subject and recipients of the email."""
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
@@ -0,0 +1,145 @@
+"""
+Database backed email outbox.
+
+``enqueue_email`` is all a request has to do: it inserts one ``OutgoingEmail``
+row.  ``deliver_pending`` is run by the ``deliver_outbox`` management command; it
+claims due rows in batches and sends them over a single reused connection of the
+configured ``EMAIL_BACKEND``.  Failed emails are retried with exponential
+backoff until ``OUTBOX_MAX_ATTEMPTS`` is reached.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+if TYPE_CHECKING:
+    from django.core.mail.backends.base import BaseEmailBackend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeliveryResult:
+    """Counters of a delivery run."""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    def add(self, other: "DeliveryResult") -> None:
+        """Add the counters of ``other`` to this result."""
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+
+
+def enqueue_email(subject: str, body: str, recipients: list[str], from_email: "str | None" = None) -> OutgoingEmail:
+    """Insert an email into the outbox and return the row."""
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipients),
+    )
+
+
+def get_backoff(attempts: int) -> timedelta:
+    """Return the delay before the next attempt after ``attempts`` failures."""
+    base = getattr(settings, "OUTBOX_RETRY_BACKOFF", 30)
+    maximum = getattr(settings, "OUTBOX_RETRY_BACKOFF_MAX", 3600)
+    return timedelta(seconds=min(maximum, base * 2 ** max(attempts - 1, 0)))
+
+
+def claim_batch(batch_size: int) -> list[OutgoingEmail]:
+    """
+    Return up to ``batch_size`` due emails and push their next attempt into the future.
+
+    The claim keeps concurrent workers from sending the same email twice; rows
+    are locked with ``SKIP LOCKED`` where the backend supports it.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.Status.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:batch_size],
+        )
+        if batch:
+            OutgoingEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+                next_attempt_at=now + get_backoff(1),
+            )
+    return batch
+
+
+def _record_failure(email: OutgoingEmail, error: str, result: DeliveryResult) -> None:
+    """Schedule a retry for ``email`` or give up after ``OUTBOX_MAX_ATTEMPTS``."""
+    email.last_error = error
+    if email.attempts >= getattr(settings, "OUTBOX_MAX_ATTEMPTS", 5):
+        email.status = OutgoingEmail.Status.FAILED
+        result.failed += 1
+    else:
+        email.next_attempt_at = timezone.now() + get_backoff(email.attempts)
+        result.retried += 1
+
+
+def send_batch(batch: list[OutgoingEmail], connection: "BaseEmailBackend | None") -> DeliveryResult:
+    """
+    Send ``batch`` over the open ``connection`` and record the outcome of every email.
+
+    ``connection`` is ``None`` if it could not be opened; the whole batch is then
+    scheduled for a retry.
+    """
+    result = DeliveryResult()
+    for email in batch:
+        email.attempts += 1
+        if connection is None:
+            _record_failure(email, "Email connection unavailable.", result)
+            continue
+        message = EmailMessage(email.subject, email.body, email.from_email, email.to, connection=connection)
+        try:
+            message.send()
+        except Exception as exc:  # noqa: BLE001 - the backend may raise anything
+            _record_failure(email, str(exc), result)
+        else:
+            email.status = OutgoingEmail.Status.SENT
+            email.sent_at = timezone.now()
+            email.last_error = ""
+            result.sent += 1
+
+    OutgoingEmail.objects.bulk_update(batch, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"])
+    return result
+
+
+def deliver_pending(batch_size: int = 100, max_batches: "int | None" = None) -> DeliveryResult:
+    """Send all due emails in batches of ``batch_size`` over one connection and return the counters."""
+    result = DeliveryResult()
+    connection = None
+    batches = 0
+    try:
+        while max_batches is None or batches < max_batches:
+            batch = claim_batch(batch_size)
+            if not batch:
+                break
+            if connection is None:
+                connection = get_connection()
+                try:
+                    connection.open()
+                except Exception:
+                    logger.exception("Could not open the email connection.")
+                    result.add(send_batch(batch, None))
+                    connection = None
+                    break
+            result.add(send_batch(batch, connection))
+            batches += 1
+    finally:
+        if connection is not None:
+            connection.close()
+    return result
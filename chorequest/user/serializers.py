@@ -2,15 +2,22 @@
 
 from typing import ClassVar
 
-from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
+from django.contrib.auth import aauthenticate, authenticate, get_user_model
 from django.contrib.auth.models import User as AuthUser
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import get_cached_user, is_user_revoked
+from .hashing import hash_password
+from .outbox import enqueue_email
+from .tokens import ChoreQuestRefreshToken
 
 User = get_user_model()
 
@@ -39,8 +46,14 @@ class RegisterSerializer(serializers.ModelSerializer):
         # Entfernen der confirm_password, da wir es nicht speichern müssen
         validated_data.pop("confirm_password")
 
-        # Benutzer erstellen
-        return User.objects.create_user(**validated_data)
+        # Passwort im Hashing-Pool hashen statt im Request-Worker
+        password = validated_data.pop("password")
+        user = User(**validated_data)
+        user.username = User.normalize_username(user.username)
+        user.email = User.objects.normalize_email(user.email)
+        user.password = hash_password(password)
+        user.save()
+        return user
 
 
 class LoginSerializer(serializers.Serializer):
@@ -49,14 +62,33 @@ class LoginSerializer(serializers.Serializer):
     username = serializers.CharField()
     password = serializers.CharField(write_only=True)
 
+    error_message = "Invalid username or password"
+
     def validate(self, data: dict) -> dict:
         """Validate the user login data."""
-        from django.contrib.auth import authenticate
-        user = authenticate(username=data["username"], password=data["password"])
+        user = authenticate(self.context.get("request"), username=data["username"], password=data["password"])
         if not user:
-            error_message = "Invalid username or password"
-            raise serializers.ValidationError(error_message)
-        tokens = RefreshToken.for_user(user)
+            raise serializers.ValidationError(self.error_message)
+        return self.get_token_data(user)
+
+    async def avalidate(self, data: dict) -> dict:
+        """Async counterpart of ``validate`` used by the async login view."""
+        user = await aauthenticate(self.context.get("request"), username=data["username"], password=data["password"])
+        if not user:
+            raise serializers.ValidationError(self.error_message)
+        return await sync_to_async(self.get_token_data)(user)
+
+    async def arun_validation(self, data: dict) -> dict:
+        """Async counterpart of ``run_validation``; errors end up under ``non_field_errors`` as well."""
+        value = self.to_internal_value(data)
+        try:
+            return await self.avalidate(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError(detail=serializers.as_serializer_error(exc)) from exc
+
+    def get_token_data(self, user: AuthUser) -> dict:
+        """Return the token pair and basic user data for a successful login."""
+        tokens = ChoreQuestRefreshToken.for_user(user)
         return {
             "refresh": str(tokens),
             "access": str(tokens.access_token),
@@ -64,30 +96,61 @@ class LoginSerializer(serializers.Serializer):
             "username": user.username,
         }
 
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that re-stamps the account claims on every refresh.
+
+    The user and the active character are resolved through their caches, so a
+    refresh costs at most one account lookup and one active-character lookup.
+    Deactivated or deleted accounts cannot obtain new access tokens.
+    """
+
+    token_class = ChoreQuestRefreshToken
+
+    def validate(self, attrs: dict) -> dict:
+        """Validate the refresh token and return a fresh access token."""
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = get_cached_user(user_id) if user_id else None
+        if user is None or not user.is_active or is_user_revoked(user.pk):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        refresh.stamp_claims(user)
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
 class PasswordResetSerializer(serializers.Serializer):
     """Serializer for requesting a password reset email."""
 
     email = serializers.EmailField()
 
     def validate_email(self, value: str) -> str:
-        """Validate that the email exists in the database."""
-        if not User.objects.filter(email=value).exists():
+        """Validate that the email exists in the database and remember the user."""
+        self.user = User.objects.filter(email=value).only("pk", "email", "password", "last_login").first()
+        if self.user is None:
             error_message = "No user is associated with this email address."
             raise serializers.ValidationError(error_message)
         return value
 
     def save(self) -> None:
-        """Send a password reset email to the user."""
-        user = User.objects.get(email=self.validated_data["email"])
-        token = default_token_generator.make_token(user)
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
+        """Queue a password reset email for the user in the outbox."""
+        token = default_token_generator.make_token(self.user)
+        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
         reset_link = reverse("password_reset_confirm", kwargs={"uidb64": uid, "token": token})
         full_link = f"http://127.0.0.1:8000{reset_link}"
 
-        # Sende die E-Mail
-        send_mail(
+        # Die E-Mail wird vom deliver_outbox-Worker versendet
+        enqueue_email(
             "Password Reset Request",
             f"Click the link to reset your password: {full_link}",
-            "noreply@chorequest.com",
-            [user.email],
+            [self.user.email],
+            from_email="noreply@chorequest.com",
         )
@@ -0,0 +1,24 @@
+"""Signal handlers keeping the user cache consistent with the database."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import clear_user_revocation, invalidate_cached_user, revoke_user_tokens
+from .models import UserAccount
+
+
+@receiver(post_save, sender=UserAccount)
+def user_saved(sender: type[UserAccount], instance: UserAccount, **kwargs: object) -> None:  # noqa: ARG001
+    """Drop the cached user and revoke or restore its tokens depending on ``is_active``."""
+    invalidate_cached_user(instance.pk)
+    if instance.is_active:
+        clear_user_revocation(instance.pk)
+    else:
+        revoke_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=UserAccount)
+def user_deleted(sender: type[UserAccount], instance: UserAccount, **kwargs: object) -> None:  # noqa: ARG001
+    """Drop the cached user and revoke its tokens once the account is gone."""
+    invalidate_cached_user(instance.pk)
+    revoke_user_tokens(instance.pk)
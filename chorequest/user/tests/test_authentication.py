@@ -0,0 +1,78 @@
+"""Tests for the claims based JWT authentication and the user cache."""
+
+from character.models import Character
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user.cache import get_cached_user, user_cache_key
+from user.models import UserAccount
+
+
+class ClaimsJWTAuthenticationTestCase(APITestCase):
+    """Tests for ClaimsJWTAuthentication."""
+
+    def setUp(self) -> None:
+        """Create a user with an active character and log in."""
+        cache.clear()
+        self.user = UserAccount.objects.create_user(
+            username="claimsuser",
+            email="claims@example.com",
+            password="securepassword",  # noqa: S106
+        )
+        self.character = Character.objects.create(user=self.user, name="ClaimsHero", active=True)
+        response = self.client.post(
+            reverse("login"), {"username": "claimsuser", "password": "securepassword"}, format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.access = response.data["access"]
+        self.refresh = response.data["refresh"]
+
+    def test_token_contains_account_claims(self) -> None:
+        """Test that the login token carries is_active and the active character."""
+        token = AccessToken(self.access)
+        self.assertTrue(token["is_active"])
+        self.assertEqual(token["active_character_id"], self.character.id)
+
+    def test_request_does_not_query_user_table(self) -> None:
+        """Test that an authenticated request never loads the UserAccount."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/characters/", HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any("user_useraccount" in query["sql"] for query in queries.captured_queries))
+
+    def test_deactivated_user_is_rejected(self) -> None:
+        """Test that deactivating a user revokes the access token immediately."""
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get("/api/characters/", HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_rejected_for_deactivated_user(self) -> None:
+        """Test that a deactivated user cannot refresh the token."""
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.post(reverse("token_refresh"), {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_restamps_active_character(self) -> None:
+        """Test that a refreshed access token reflects the current active character."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.active = False
+            self.character.save()
+        response = self.client.post(reverse("token_refresh"), {"refresh": self.refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(AccessToken(response.data["access"])["active_character_id"])
+
+    def test_user_cache_invalidated_on_save(self) -> None:
+        """Test that saving a user drops the cached instance."""
+        self.assertEqual(get_cached_user(self.user.pk), self.user)
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+        self.user.email = "changed@example.com"
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertEqual(get_cached_user(self.user.pk).email, "changed@example.com")
@@ -0,0 +1,90 @@
+"""Tests for the bulk household importer."""
+
+import json
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+from character.models import Character
+from django.core.management import call_command
+from django.test import TestCase
+
+from user.models import UserAccount
+
+
+class ImportHouseholdsTestCase(TestCase):
+    """Tests for the import_households management command."""
+
+    def setUp(self) -> None:
+        """Create an existing user and character that collide with the import."""
+        self.existing = UserAccount.objects.create_user(
+            username="existing", email="existing@example.com", password="securepassword",  # noqa: S106
+        )
+        Character.objects.create(user=self.existing, name="TakenName")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name: str, content: str) -> Path:
+        """Write an input file into the temporary directory."""
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_import_csv(self) -> None:
+        """Test importing users and characters from CSV while skipping duplicates."""
+        path = self.write(
+            "households.csv",
+            "username,email,password,character_name\n"
+            "anna,anna@example.com,password123,AnnaHero\n"
+            "ben,ben@example.com,password123,\n"
+            "existing,other@example.com,password123,Other\n"
+            "carl,carl@example.com,password123,TakenName\n"
+            "anna,anna2@example.com,password123,Anna2\n",
+        )
+        out, err = StringIO(), StringIO()
+        call_command("import_households", str(path), "--workers", "1", stdout=out, stderr=err)
+
+        self.assertIn("Imported 2 users and 1 characters, skipped 3 rows", out.getvalue())
+        self.assertIn("duplicate username existing", err.getvalue())
+        anna = UserAccount.objects.get(username="anna")
+        self.assertTrue(anna.check_password("password123"))
+        self.assertTrue(Character.objects.get(name="AnnaHero", user=anna).active)
+        self.assertFalse(Character.objects.filter(user__username="ben").exists())
+
+    def test_import_json_in_chunks(self) -> None:
+        """Test importing a JSON list split over several chunks."""
+        rows = [
+            {"username": f"user{i}", "email": f"user{i}@example.com", "password": "password123",
+             "character_name": f"Hero{i}"}
+            for i in range(5)
+        ]
+        path = self.write("households.json", json.dumps(rows))
+        call_command("import_households", str(path), "--chunk-size", "2", "--workers", "1", stdout=StringIO())
+
+        self.assertEqual(UserAccount.objects.filter(username__startswith="user").count(), 5)
+        self.assertEqual(Character.objects.filter(name__startswith="Hero").count(), 5)
+
+    def test_invalid_date_of_birth_is_skipped(self) -> None:
+        """Test that an invalid date of birth skips its row instead of aborting the import."""
+        path = self.write(
+            "households.csv",
+            "username,email,password,date_of_birth\n"
+            "anna,anna@example.com,password123,2010-04-01\n"
+            "ben,ben@example.com,password123,2010-02-30\n"
+            "carl,carl@example.com,password123,yesterday\n"
+            "dora,dora@example.com,password123,\n",
+        )
+        err = StringIO()
+        call_command(
+            "import_households", str(path), "--chunk-size", "1", "--workers", "1", stdout=StringIO(), stderr=err,
+        )
+
+        self.assertEqual(
+            list(UserAccount.objects.exclude(pk=self.existing.pk).order_by("username").values_list(
+                "username", "date_of_birth",
+            )),
+            [("anna", date(2010, 4, 1)), ("dora", None)],
+        )
+        self.assertIn("invalid date of birth 2010-02-30", err.getvalue())
+        self.assertIn("invalid date of birth yesterday", err.getvalue())
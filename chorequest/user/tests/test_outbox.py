@@ -0,0 +1,100 @@
+"""Tests for the email outbox and the deliver_outbox command."""
+
+from io import StringIO
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from user.models import OutgoingEmail, UserAccount
+from user.outbox import deliver_pending, enqueue_email
+
+
+class CountingBackend(EmailBackend):
+    """Locmem backend counting how often a connection is opened."""
+
+    opened = 0
+
+    def open(self) -> bool:
+        """Count the opened connection."""
+        CountingBackend.opened += 1
+        return True
+
+
+class FailingBackend(EmailBackend):
+    """Backend whose sends always fail."""
+
+    def send_messages(self, messages: list) -> int:  # noqa: ARG002
+        """Fail like an unreachable SMTP server."""
+        msg = "SMTP server unavailable"
+        raise ConnectionRefusedError(msg)
+
+
+class PasswordResetOutboxTestCase(APITestCase):
+    """Tests for queueing password reset emails."""
+
+    def setUp(self) -> None:
+        """Set up a test user."""
+        self.user = UserAccount.objects.create_user(
+            username="outboxuser", email="outbox@example.com", password="securepassword",  # noqa: S106
+        )
+
+    def test_password_reset_only_queues_email(self) -> None:
+        """Test that the request runs one lookup plus one insert and sends nothing."""
+        with self.assertNumQueries(2):
+            response = self.client.post(reverse("password_reset_api"), {"email": "outbox@example.com"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.to, ["outbox@example.com"])
+        self.assertIn("/password/reset/confirm/", email.body)
+
+
+class DeliverOutboxTestCase(TestCase):
+    """Tests for delivering the outbox."""
+
+    def setUp(self) -> None:
+        """Queue a few emails."""
+        for index in range(3):
+            enqueue_email("Subject", "Body", [f"user{index}@example.com"])
+
+    @override_settings(EMAIL_BACKEND="user.tests.test_outbox.CountingBackend")
+    def test_batches_share_one_connection(self) -> None:
+        """Test that all batches are sent over a single connection."""
+        CountingBackend.opened = 0
+        result = deliver_pending(batch_size=2)
+        self.assertEqual(result.sent, 3)
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(OutgoingEmail.objects.exclude(status=OutgoingEmail.Status.SENT).exists())
+
+    @override_settings(EMAIL_BACKEND="user.tests.test_outbox.FailingBackend", OUTBOX_RETRY_BACKOFF=10)
+    def test_failures_are_retried_with_backoff(self) -> None:
+        """Test that failed emails stay pending and are scheduled for later."""
+        result = deliver_pending()
+        self.assertEqual(result.retried, 3)
+        email = OutgoingEmail.objects.first()
+        self.assertEqual(email.status, OutgoingEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        self.assertEqual(deliver_pending().retried, 0)
+
+    @override_settings(EMAIL_BACKEND="user.tests.test_outbox.FailingBackend", OUTBOX_MAX_ATTEMPTS=2)
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Test that an email is marked as failed after the last attempt."""
+        deliver_pending()
+        OutgoingEmail.objects.update(next_attempt_at=timezone.now())
+        result = deliver_pending()
+        self.assertEqual(result.failed, 3)
+        self.assertEqual(OutgoingEmail.objects.filter(status=OutgoingEmail.Status.FAILED).count(), 3)
+
+    def test_command_reports_counts(self) -> None:
+        """Test the deliver_outbox management command."""
+        out = StringIO()
+        call_command("deliver_outbox", stdout=out)
+        self.assertIn("Sent 3", out.getvalue())
@@ -1,9 +1,16 @@
 """Module containing test cases for user-related endpoints."""
 
+import threading
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from user.hashing import get_hashing_pool
 from user.models import UserAccount
 
 
@@ -66,6 +73,45 @@ class UserLoginTestCase(APITestCase):
         response = self.client.post(url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_login_malformed_json(self) -> None:
+        """Test that a malformed JSON body is rejected by the DRF parser."""
+        response = self.client.post(reverse("login"), "{bad", content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("JSON parse error", response.data["detail"])
+
+    def test_failed_login_sends_signal(self) -> None:
+        """Test that a failed login goes through the auth backends and sends user_login_failed."""
+        failures = []
+
+        def receiver(credentials: dict, **kwargs: object) -> None:  # noqa: ARG001
+            failures.append(credentials)
+
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+        data = {"username": "testuser", "password": "wrongpassword"}
+        self.client.post(reverse("login"), data, format="json")
+        self.assertEqual([credentials["username"] for credentials in failures], ["testuser"])
+
+    @override_settings(PASSWORD_HASHERS=[
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher", "django.contrib.auth.hashers.MD5PasswordHasher",
+    ])
+    def test_login_upgrades_outdated_hash(self) -> None:
+        """Test that the pooled backend rehashes passwords stored with an outdated hasher."""
+        self.user.password = make_password(self.user_password, hasher="md5")
+        self.user.save(update_fields=["password"])
+        data = {"username": "testuser", "password": self.user_password}
+        response = self.client.post(reverse("login"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+    def test_login_is_documented(self) -> None:
+        """Test that the async login view appears in the OpenAPI schema with its responses."""
+        schema = self.client.get("/swagger.json").json()
+        login = schema["paths"][reverse("login").removeprefix(schema["basePath"])]["post"]
+        self.assertEqual(login["operationId"], "user_login_create")
+        self.assertEqual(set(login["responses"]), {"200", "400", "429"})
+
 class PasswordResetTestCase(APITestCase):
     """Tests for the password reset endpoint."""
 
@@ -93,3 +139,56 @@ class PasswordResetTestCase(APITestCase):
         response = self.client.post(self.password_reset_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("No user is associated with this email address.", str(response.data))
+
+
+class PasswordHashingSaturationTestCase(APITestCase):
+    """Tests for the fast rejection when the password hashing pool is saturated."""
+
+    def setUp(self) -> None:
+        """Set up a test user."""
+        UserAccount.objects.all().delete()
+        self.user = UserAccount.objects.create_user(
+            username="testuser", email="test@example.com", password="securepassword",  # noqa: S106
+        )
+
+    def occupy_hashing_pool(self) -> None:
+        """Hold the only slot of the hashing pool until the test has finished."""
+        release = threading.Event()
+        get_hashing_pool().submit(release.wait)
+        self.addCleanup(release.set)
+
+    @override_settings(PASSWORD_HASHING_MAX_CONCURRENCY=1, PASSWORD_HASHING_RETRY_AFTER=3)
+    def test_login_rejected_when_saturated(self) -> None:
+        """Test that login answers 429 with Retry-After when no hashing capacity is left."""
+        self.occupy_hashing_pool()
+        data = {"username": "testuser", "password": "securepassword"}
+        response = self.client.post(reverse("login"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "3")
+
+    @override_settings(PASSWORD_HASHING_MAX_CONCURRENCY=1)
+    def test_registration_rejected_when_saturated(self) -> None:
+        """Test that registration answers 429 and creates no user when saturated."""
+        self.occupy_hashing_pool()
+        data = {
+            "username": "newuser",
+            "email": "new@example.com",
+            "password": "securepassword",
+            "confirm_password": "securepassword",
+        }
+        response = self.client.post(reverse("register"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+        self.assertFalse(UserAccount.objects.filter(username="newuser").exists())
+
+    @override_settings(PASSWORD_HASHING_MAX_CONCURRENCY=0)
+    def test_concurrency_below_one_is_rejected(self) -> None:
+        """Test that a cap below one is reported as a configuration error instead of refusing every login."""
+        with self.assertRaisesMessage(ImproperlyConfigured, "must be at least 1"):
+            get_hashing_pool()
+
+    def test_login_with_form_data(self) -> None:
+        """Test that the async login view also accepts form encoded credentials."""
+        response = self.client.post(reverse("login"), {"username": "testuser", "password": "securepassword"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
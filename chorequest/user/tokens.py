@@ -0,0 +1,32 @@
+"""JWT token classes carrying the claims needed for database-free authentication."""
+
+from character.cache import get_active_character_id
+from django.contrib.auth.models import AbstractBaseUser
+from rest_framework_simplejwt.tokens import RefreshToken
+
+IS_ACTIVE_CLAIM = "is_active"
+IS_STAFF_CLAIM = "is_staff"
+ACTIVE_CHARACTER_CLAIM = "active_character_id"
+
+
+class ChoreQuestRefreshToken(RefreshToken):
+    """
+    Refresh token that embeds the account state as signed claims.
+
+    Besides ``user_id`` the token carries ``is_active``, ``is_staff`` and
+    ``active_character_id``.  They are copied into every access token derived
+    from it, so authenticated requests can be served without loading the user.
+    """
+
+    @classmethod
+    def for_user(cls, user: AbstractBaseUser) -> "ChoreQuestRefreshToken":
+        """Return a refresh token for ``user`` including the account claims."""
+        token = super().for_user(user)
+        token.stamp_claims(user)
+        return token
+
+    def stamp_claims(self, user: AbstractBaseUser) -> None:
+        """Write the current account state of ``user`` into the token claims."""
+        self[IS_ACTIVE_CLAIM] = user.is_active
+        self[IS_STAFF_CLAIM] = user.is_staff
+        self[ACTIVE_CHARACTER_CLAIM] = get_active_character_id(user.pk)
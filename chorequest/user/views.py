@@ -1,16 +1,33 @@
 """Module contains views for user registration, login, and password reset."""
 
+import inspect
+
 from django.contrib.auth import get_user_model
+from django.http import HttpRequest
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, status
 from rest_framework.generics import GenericAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from .serializers import LoginSerializer, PasswordResetSerializer, RegisterSerializer
 
 User = get_user_model()
 
+LOGIN_RESPONSE = openapi.Response(
+    "Token pair and user",
+    openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            "refresh": openapi.Schema(type=openapi.TYPE_STRING),
+            "access": openapi.Schema(type=openapi.TYPE_STRING),
+            "user_id": openapi.Schema(type=openapi.TYPE_INTEGER),
+            "username": openapi.Schema(type=openapi.TYPE_STRING),
+        },
+    ),
+)
+
 # Registration View
 class RegisterView(generics.CreateAPIView):
     """API View for user registration."""
@@ -32,14 +49,51 @@ class RegisterView(generics.CreateAPIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 # Login View
-class LoginView(APIView):
-    """API View for user login."""
+class LoginView(GenericAPIView):
+    """
+    Async API View for user login.
 
-    def post(self, request: Request) -> Response:
-        """Handle POST request for password reset."""
-        serializer = LoginSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        return Response(serializer.validated_data, status=status.HTTP_200_OK)
+    The password check runs on the bounded hashing pool while the event loop keeps
+    serving other requests.  When the pool is saturated the view answers with
+    ``429`` and a ``Retry-After`` header instead of queueing the request.
+
+    DRF cannot await a handler, so ``dispatch`` is the async counterpart of
+    ``APIView.dispatch``; parsing, content negotiation, exception handling and
+    rendering stay with DRF.
+    """
+
+    serializer_class = LoginSerializer
+
+    async def dispatch(self, request: HttpRequest, *args: object, **kwargs: object) -> Response:
+        """Run the DRF request cycle around the awaited handler."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+            handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:  # noqa: BLE001
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    @swagger_auto_schema(responses={
+        status.HTTP_200_OK: LOGIN_RESPONSE,
+        status.HTTP_400_BAD_REQUEST: "Invalid username or password",
+        status.HTTP_429_TOO_MANY_REQUESTS: "Password hashing pool saturated, retry after Retry-After seconds",
+    })
+    async def post(self, request: Request) -> Response:
+        """Handle POST request for user login."""
+        serializer = self.get_serializer(data=request.data)
+        validated_data = await serializer.arun_validation(serializer.initial_data)
+        return Response(validated_data, status=status.HTTP_200_OK)
 
 class PasswordResetView(GenericAPIView):
     """API View for requesting a password reset email."""